@@ -102,6 +102,7 @@ extras_require = {
         "sphinxcontrib-autoprogram",
     ],
     "pycodegen": ["black"],
+    "fastyaml": ["PyYAML"],
 }
 
 setup(
@@ -32,7 +32,7 @@ A schema may be one of:
   Null.
 """
 
-from typing import Any, Optional, TypeAlias, Union, cast
+from typing import Any, Final, Optional, TypeAlias, Union, cast
 
 from mypy_extensions import mypyc_attr
 
@@ -561,6 +561,9 @@ class UnionSchema(Schema):
 
         # Add class members
         self._schemas = _build_schema_objects(schemas, names)
+        # The alternatives that may accept a datum of a given Python type,
+        # filled in as needed by schema_salad.validate.union_candidates
+        self.candidates: dict[type, list[Any]] = {}
 
     # read-only properties
     @property
@@ -596,6 +599,9 @@ class NamedUnionSchema(NamedSchema):
 
         # Add class members
         self._schemas = _build_schema_objects(schemas, names)
+        # The alternatives that may accept a datum of a given Python type,
+        # filled in as needed by schema_salad.validate.union_candidates
+        self.candidates: dict[type, list[Any]] = {}
         if doc is not None:
             self.set_prop("doc", doc)
 
@@ -662,6 +668,11 @@ class RecordSchema(NamedSchema):
         # Add class members
         field_objects = RecordSchema.make_field_objects(fields, names)
         self.set_prop("fields", field_objects)
+        # The fields by name, so validation finds them without a scan
+        self.field_map: dict[str, Field] = {}
+        for field in field_objects:
+            self.field_map.setdefault(field.name, field)
+        self.field_names: frozenset[str] = frozenset(self.field_map)
         if doc is not None:
             self.set_prop("doc", doc)
 
@@ -782,8 +793,50 @@ def make_avsc_object(json_data: JsonDataType, names: Names | None = None) -> Sch
     raise SchemaParseException(fail_msg)
 
 
-def is_subtype(types: dict[str, Any], existing: PropType, new: PropType) -> bool:
-    """Check if a new type specification is compatible with an existing type spec."""
+class SubtypeCache:
+    """
+    Remembered is_subtype() verdicts between named types.
+
+    The cache also notes which named types the verdicts looked up, so that
+    changing the definition of any other named type keeps them.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        self.verdicts: dict[tuple[str, str], bool] = {}
+        self.names: set[str] = set()
+
+    def forget(self, name: str) -> None:
+        """Forget the verdicts if they could depend on this named type, which changed."""
+        if name in self.names:
+            self.verdicts = {}
+            self.names = set()
+
+
+def is_subtype(
+    types: dict[str, Any],
+    existing: PropType,
+    new: PropType,
+    cache: SubtypeCache | None = None,
+) -> bool:
+    """
+    Check if a new type specification is compatible with an existing type spec.
+
+    If a cache is given, verdicts between named types are remembered there.
+    """
+    if cache is None or not isinstance(existing, str) or not isinstance(new, str):
+        return _is_subtype(types, existing, new, cache)
+    key: Final = (existing, new)
+    verdict = cache.verdicts.get(key)
+    if verdict is None:
+        verdict = _is_subtype(types, existing, new, cache)
+        cache.verdicts[key] = verdict
+    return verdict
+
+
+def _is_subtype(
+    types: dict[str, Any], existing: PropType, new: PropType, cache: SubtypeCache | None
+) -> bool:
     if existing == new:
         return True
     if isinstance(existing, list) and (new in existing):
@@ -794,29 +847,35 @@ def is_subtype(types: dict[str, Any], existing: PropType, new: PropType) -> bool
         if isinstance(new, list) and "null" in new:
             return False
         return True
-    if isinstance(existing, str) and existing in types:
-        return is_subtype(types, types[existing], new)
-    if isinstance(new, str) and new in types:
-        return is_subtype(types, existing, types[new])
+    if isinstance(existing, str):
+        if cache is not None:
+            cache.names.add(existing)
+        if existing in types:
+            return is_subtype(types, types[existing], new, cache)
+    if isinstance(new, str):
+        if cache is not None:
+            cache.names.add(new)
+        if new in types:
+            return is_subtype(types, existing, types[new], cache)
     if isinstance(existing, dict) and existing.get("type") == "union":
-        return is_subtype(types, existing["names"], new)
+        return is_subtype(types, existing["names"], new, cache)
     if isinstance(new, dict) and new.get("type") == "union":
-        return is_subtype(types, existing, new["names"])
+        return is_subtype(types, existing, new["names"], cache)
     if isinstance(existing, dict) and isinstance(new, dict):
         if "extends" in new and new["extends"] == existing.get("name"):
             return True
         if existing.get("type") == "array" and new.get("type") == "array":
-            return is_subtype(types, existing["items"], new["items"])
+            return is_subtype(types, existing["items"], new["items"], cache)
         if existing.get("type") == "map" and new.get("type") == "map":
-            return is_subtype(types, existing["values"], new["values"])
+            return is_subtype(types, existing["values"], new["values"], cache)
         if existing.get("type") == "enum" and new.get("type") == "enum":
-            return is_subtype(types, existing["symbols"], new["symbols"])
+            return is_subtype(types, existing["symbols"], new["symbols"], cache)
         if existing.get("type") == "record" and new.get("type") == "record":
             for new_field in cast(list[dict[str, Any]], new["fields"]):
                 new_field_missing = True
                 for existing_field in cast(list[dict[str, Any]], existing["fields"]):
                     if new_field["name"] == existing_field["name"]:
-                        if not is_subtype(types, existing_field["type"], new_field["type"]):
+                        if not is_subtype(types, existing_field["type"], new_field["type"], cache):
                             return False
                         new_field_missing = False
                 if new_field_missing:
@@ -826,7 +885,7 @@ def is_subtype(types: dict[str, Any], existing: PropType, new: PropType) -> bool
         missing = False
         for _type_new in new:
             if _type_new not in existing and not any(
-                is_subtype(types, cast(PropType, _type_existing), cast(PropType, _type_new))
+                is_subtype(types, cast(PropType, _type_existing), cast(PropType, _type_new), cache)
                 for _type_existing in existing
             ):
                 missing = True
@@ -1,13 +1,50 @@
 """Shared Exception classes."""
 
-from collections.abc import Sequence
-from typing import Final
+from collections.abc import Callable, Sequence
+from typing import Any, Final
 
 from .sourceline import SourceLine, reflow_all, strip_duplicated_lineno
 
 
+class LazyMessage:
+    """
+    An error message that is only rendered when it is first needed.
+
+    Holds ``render`` and its arguments; ``str()`` returns ``render(*parts)``,
+    which must not be empty. For messages that are costly to format, in
+    errors that are often discarded. Pickles as the rendered string.
+
+    The parts are kept as they are, not copied: a list or mapping among
+    them must not be changed until the message is rendered. The validators
+    never change the documents they check.
+    """
+
+    def __init__(self, render: Callable[..., str], *parts: Any) -> None:
+        """Keep the parts of the message for later."""
+        self.render: Final = render
+        self.parts: tuple[Any, ...] = parts
+        self.text: str | None = None
+
+    def __str__(self) -> str:
+        """Render the message, once."""
+        if self.text is None:
+            self.text = self.render(*self.parts)
+            # drop the references to the (possibly large) parts
+            self.parts = ()
+        return self.text
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __reduce__(self) -> tuple[type[str], tuple[str]]:
+        return str, (str(self),)
+
+
+MessageType = str | LazyMessage
+
+
 def _simplify(exc: "SchemaSaladException") -> list["SchemaSaladException"]:
-    return [exc] if len(exc.message) else exc.children
+    return [exc] if exc.has_message() else exc.children
 
 
 def _with_bullet(exc: "SchemaSaladException", bullet: str) -> "SchemaSaladException":
@@ -21,15 +58,15 @@ class SchemaSaladException(Exception):
 
     def __init__(
         self,
-        msg: str,
+        msg: MessageType,
         sl: SourceLine | None = None,
         children: Sequence["SchemaSaladException"] | None = None,
         bullet_for_children: str = "",
-        detailed_message: str | None = None,
+        detailed_message: MessageType | None = None,
     ) -> None:
         super().__init__(msg, sl, children, bullet_for_children, detailed_message)
-        self.message: Final = self.args[0]
-        self.detailed_message: Final = detailed_message
+        self._message: MessageType = msg
+        self._detailed_message: MessageType | None = detailed_message
         self.file: str | None = None
         self.start: tuple[int, int] | None = None
         self.end: tuple[int, int] | None = None
@@ -51,6 +88,24 @@ class SchemaSaladException(Exception):
         self.with_sourceline(sl)
         self.propagate_sourceline()
 
+    @property
+    def message(self) -> str:
+        """The message of this exception, without its children."""
+        if not isinstance(self._message, str):
+            self._message = str(self._message)
+        return self._message
+
+    @property
+    def detailed_message(self) -> str | None:
+        """A more detailed message, used instead of :py:attr:`message` for a leaf."""
+        if self._detailed_message is not None and not isinstance(self._detailed_message, str):
+            self._detailed_message = str(self._detailed_message)
+        return self._detailed_message
+
+    def has_message(self) -> bool:
+        """Tell if the message is not empty, without rendering a lazy one."""
+        return not isinstance(self._message, str) or len(self._message) > 0
+
     def propagate_sourceline(self) -> None:
         if self.file is None:
             return
@@ -83,7 +138,7 @@ class SchemaSaladException(Exception):
         """Return the list of all the exceptions at the tips of the tree."""
         if len(self.children) > 0:
             return sum((c.leaves() for c in self.children), [])
-        if len(self.message):
+        if self.has_message():
             return [self]
         return []
 
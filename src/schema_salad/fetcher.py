@@ -7,6 +7,7 @@ import sys
 import urllib.parse
 import urllib.request
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Final
 
 import requests
@@ -29,7 +30,12 @@ class Fetcher(ABC):
 
     @abstractmethod
     def check_exists(self, url: str) -> bool:
-        """Check if the given resource exists."""
+        """
+        Check if the given resource exists.
+
+        Called from several threads at once when the Loader's
+        ``link_check_workers`` is above 1, and must then be thread-safe.
+        """
 
     @abstractmethod
     def urljoin(self, base_url: str, url: str) -> str:
@@ -216,3 +222,39 @@ class DefaultFetcher(MemoryCachingFetcher):
                 )
 
         return urllib.parse.urljoin(base_url, url)
+
+
+class AsyncFetcher(ABC):
+    """Fetch resources from URIs without waiting for them."""
+
+    @abstractmethod
+    def fetch_text_async(self, url: str, content_types: list[str] | None = None) -> Future[str]:
+        """Start retrieving the given resource as a string."""
+
+    def close(self) -> None:
+        """Release the resources used for fetching."""
+
+
+class ThreadedFetcher(AsyncFetcher):
+    """Run the blocking fetch_text of a transport Fetcher in a pool of threads."""
+
+    def __init__(self, transport: Fetcher | None = None, max_workers: int = 8) -> None:
+        """
+        Create a ThreadedFetcher object.
+
+        :param transport: The Fetcher to retrieve resources with, the default
+            only reads local files.
+        :param max_workers: The maximum number of resources fetched at the same time.
+        """
+        self.transport: Final = transport if transport is not None else DefaultFetcher({}, None)
+        self.executor: Final = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="schema-salad-fetch"
+        )
+
+    def fetch_text_async(self, url: str, content_types: list[str] | None = None) -> Future[str]:
+        """Start retrieving the given resource as a string."""
+        return self.executor.submit(self.transport.fetch_text, url, content_types)
+
+    def close(self) -> None:
+        """Stop the threads, dropping the fetches that have not started yet."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -2,11 +2,15 @@
 
 import argparse
 import importlib.metadata
+import json
 import logging
 import os
 import sys
-from collections.abc import Mapping, MutableSequence
-from typing import Any, Final, cast
+import time
+import traceback
+from collections.abc import Iterable, Iterator, Mapping, MutableSequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Final, NamedTuple, cast
 from urllib.parse import urlparse
 
 from rdflib import __version__ as rdflib_version
@@ -16,11 +20,11 @@ from rich_argparse import HelpPreviewAction, RichHelpFormatter
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 from . import codegen, jsonld_context, schema
-from .avro.schema import SchemaParseException
-from .exceptions import ValidationException, to_one_line_messages
+from .avro.schema import Names, SchemaParseException
+from .exceptions import SchemaSaladException, ValidationException, to_one_line_messages
 from .makedoc import makedoc
 from .ref_resolver import Loader, file_uri
-from .utils import json_dump, stdout
+from .utils import ContextType, json_dump, stdout
 
 if int(rdflib_version.split(".", maxsplit=1)[0]) < 6:
     register("json-ld", Parser, "rdflib_jsonld.parser", "JsonLDParser")
@@ -29,6 +33,17 @@ if int(rdflib_version.split(".", maxsplit=1)[0]) < 6:
 _logger: Final = logging.getLogger("salad")
 
 
+def positive_int(value: str) -> int:
+    """Parse a strictly positive integer argument."""
+    try:
+        number = int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"Invalid number: '{value}'") from e
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"Expected a number of at least 1, got {number}")
+    return number
+
+
 def parse_kv(pair: str) -> tuple[str, str]:
     """Parse `key=value` arguments into a tuple of `key` and `value`."""
     try:
@@ -38,6 +53,208 @@ def parse_kv(pair: str) -> tuple[str, str]:
         raise argparse.ArgumentTypeError(f"Invalid format: '{pair}', expected key=value") from e
 
 
+class DocumentResult(NamedTuple):
+    """Outcome of loading and validating a single document."""
+
+    uri: str
+    valid: bool
+    message: str
+    """The error report, formatted for logging; empty if the document is valid."""
+    elapsed: float
+    """Wall-clock time spent on the document, in seconds."""
+    bytes_fetched: int
+    """Size of the documents fetched to load this one, excluding those already loaded."""
+    errors: list[dict[str, Any]]
+    """One entry per leaf error, see :py:func:`error_records`."""
+    trace: str = ""
+    """The traceback of the error, shown with ``--debug``; empty if the document is valid."""
+
+
+def error_records(exc: SchemaSaladException) -> list[dict[str, Any]]:
+    """Flatten an exception tree into JSON-serializable records with source locations."""
+    records: Final[list[dict[str, Any]]] = []
+    for leaf in exc.leaves():
+        line, col = leaf.start if leaf.start else (None, None)
+        records.append(
+            {
+                "message": leaf.detailed_message or leaf.message,
+                "file": leaf.file,
+                "line": line,
+                "col": col,
+                "warning": leaf.is_warning,
+            }
+        )
+    return records
+
+
+def validate_document(
+    document_loader: Loader,
+    avsc_names: Names,
+    uri: str,
+    strict: bool,
+    strict_foreign_properties: bool = False,
+    print_oneline: bool = False,
+) -> DocumentResult:
+    """
+    Load, resolve and validate a single document.
+
+    Validation errors, and schema-salad or I/O errors that stop the document
+    from being loaded, are captured in the result; other errors propagate.
+    """
+    start: Final = time.perf_counter()
+    # Newly fetched documents are appended to the loader's size table.
+    known_sources: Final = len(document_loader.source_sizes)
+
+    def result(
+        message: str = "", exc: SchemaSaladException | None = None, cause: Exception | None = None
+    ) -> DocumentResult:
+        sizes = list(document_loader.source_sizes.values())
+        error = cause or exc
+        return DocumentResult(
+            uri,
+            exc is None,
+            message,
+            time.perf_counter() - start,
+            sum(sizes[known_sources:]),
+            [] if exc is None else error_records(exc),
+            (
+                ""
+                if error is None
+                else "".join(traceback.format_exception(type(error), error, error.__traceback__))
+            ),
+        )
+
+    def unexpected(e: SchemaSaladException | OSError) -> DocumentResult:
+        # reported as an invalid document, so that the other documents are still checked
+        error: Final = SchemaSaladException(f"{type(e).__name__}: {e}")
+        return result(f"Document {uri!r} could not be validated:\n{error}", error, e)
+
+    try:
+        document, _ = document_loader.resolve_ref(
+            uri, strict_foreign_properties=strict_foreign_properties
+        )
+    except ValidationException as e:
+        msg = to_one_line_messages(e) if print_oneline else str(e)
+        return result(f"Document {uri!r} failed validation:\n{msg}", e)
+    except (SchemaSaladException, OSError) as e:
+        return unexpected(e)
+    try:
+        schema.validate_doc(
+            avsc_names,
+            document,
+            document_loader,
+            strict,
+            strict_foreign_properties=strict_foreign_properties,
+        )
+    except ValidationException as e:
+        msg = to_one_line_messages(e) if print_oneline else str(e)
+        return result(f"While validating document {uri!r}:\n{msg}", e)
+    except (SchemaSaladException, OSError) as e:
+        return unexpected(e)
+    return result()
+
+
+def write_report(results: Iterable[DocumentResult], out: Any) -> bool:
+    """
+    Write one JSON object per line to ``out`` as each result becomes available.
+
+    Return True if every document was valid.
+    """
+    all_valid = True
+    for res in results:
+        all_valid = all_valid and res.valid
+        record = {
+            "uri": res.uri,
+            "status": "valid" if res.valid else "invalid",
+            "time": round(res.elapsed, 6),
+            "bytes_fetched": res.bytes_fetched,
+            "errors": res.errors,
+        }
+        out.write(json.dumps(record) + "\n")
+        out.flush()
+    return all_valid
+
+
+_worker_state: tuple[Loader, Names, bool, bool, bool] | None = None
+
+
+def _init_worker(
+    schema_ctx: ContextType,
+    skip_schemas: bool,
+    salad_version: str | None,
+    avsc_names: Names,
+    strict: bool,
+    strict_foreign_properties: bool,
+    print_oneline: bool,
+    log_level: int,
+    fast_parse: bool,
+) -> None:
+    """Build the per-process document loader used by :py:func:`_validate_in_worker`."""
+    global _worker_state
+    _logger.setLevel(log_level)
+    _worker_state = (
+        Loader(
+            schema_ctx,
+            skip_schemas=skip_schemas,
+            salad_version=salad_version,
+            fast_parse=fast_parse,
+        ),
+        avsc_names,
+        strict,
+        strict_foreign_properties,
+        print_oneline,
+    )
+
+
+def _validate_in_worker(uri: str) -> DocumentResult:
+    if _worker_state is None:
+        raise RuntimeError("Worker process was not initialized.")
+    loader, avsc_names, strict, strict_foreign_properties, print_oneline = _worker_state
+    return validate_document(
+        loader, avsc_names, uri, strict, strict_foreign_properties, print_oneline
+    )
+
+
+def validate_documents_parallel(
+    uris: list[str],
+    jobs: int,
+    schema_ctx: ContextType,
+    avsc_names: Names,
+    strict: bool,
+    strict_foreign_properties: bool = False,
+    skip_schemas: bool = False,
+    salad_version: str | None = None,
+    print_oneline: bool = False,
+    fast_parse: bool = False,
+) -> Iterator[DocumentResult]:
+    """
+    Validate many documents using a pool of ``jobs`` worker processes.
+
+    The schema is built once by the caller and shipped to each worker, which
+    keeps its own document loader for all the documents it is given.
+    Results are yielded as soon as they are ready, in the order the documents
+    finish, so that one slow document does not hold back the others.
+    """
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(
+            schema_ctx,
+            skip_schemas,
+            salad_version,
+            avsc_names,
+            strict,
+            strict_foreign_properties,
+            print_oneline,
+            _logger.getEffectiveLevel(),
+            fast_parse,
+        ),
+    ) as executor:
+        futures: Final = [executor.submit(_validate_in_worker, uri) for uri in uris]
+        for future in as_completed(futures):
+            yield future.result()
+
+
 def printrdf(
     workflow: str,
     wf: CommentedMap | CommentedSeq,
@@ -75,6 +292,28 @@ def arg_parser() -> argparse.ArgumentParser:
     parser.add_argument("schema", type=str, nargs="?", default=None)
     parser.add_argument("document", type=str, nargs="*", default=None)
     parser.add_argument("--version", "-v", action="store_true", help="Print version", default=None)
+    parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        metavar="N",
+        default=1,
+        help="Validate the documents in parallel using N worker processes. "
+        "All documents are checked, instead of stopping at the first invalid one.",
+    )
+    parser.add_argument(
+        "--fast-parser",
+        action="store_true",
+        default=False,
+        help="Parse the documents with libyaml, if PyYAML provides it. Much faster, "
+        "but comments are not kept, so do not use it with the --print-* options.",
+    )
+    parser.add_argument(
+        "--report",
+        choices=["jsonl"],
+        default=None,
+        help="Check all the documents and write a report to stdout as each one completes, "
+        "with one JSON object per document (`jsonl`).",
+    )
 
     parser.add_argument(
         "--generate-help-preview",
@@ -128,6 +367,13 @@ def arg_parser() -> argparse.ArgumentParser:
     output_exclusive.add_argument(
         "--print-doc", action="store_true", help="Print HTML schema documentation page"
     )
+    output_exclusive.add_argument(
+        "--compile-schema",
+        type=str,
+        metavar="FILE",
+        help="Write the loaded schema to FILE in compiled form, "
+        "see `schema_salad.schema.load_compiled_schema`",
+    )
 
     codegen_opts = parser.add_argument_group(
         title="Code generation configuration", description="Requires --codegen LANGUAGE"
@@ -356,7 +602,10 @@ def main(argsl: list[str] | None = None) -> int:
     # Create the loader that will be used to load the target document.
     schema_version: Final = schema_metadata.get("saladVersion", None)
     document_loader: Final = Loader(
-        schema_ctx, skip_schemas=args.skip_schemas, salad_version=schema_version
+        schema_ctx,
+        skip_schemas=args.skip_schemas,
+        salad_version=schema_version,
+        fast_parse=args.fast_parser,
     )
 
     if args.codegen:
@@ -396,6 +645,12 @@ def main(argsl: list[str] | None = None) -> int:
         _logger.error("Schema %r must be a list.", args.schema)  # type: ignore[unreachable]
         return 1
 
+    if args.compile_schema:
+        schema.save_compiled_schema(
+            args.compile_schema, document_loader, avsc_names, schema_metadata, metaschema_loader
+        )
+        return 0
+
     # Optionally print Avro-compatible schema from schema
     if args.print_avro:
         json_dump(avsc_obj, fp=sys.stdout, indent=4, default=str)
@@ -429,7 +684,50 @@ def main(argsl: list[str] | None = None) -> int:
         print(f"Schema {args.schema!r} is valid")
         return 0
 
-    # Load target document and resolve refs
+    if not (args.print_pre or args.print_index or args.print_rdf or args.print_metadata):
+        if args.jobs > 1:
+            results: Iterable[DocumentResult] = validate_documents_parallel(
+                args.document,
+                args.jobs,
+                schema_ctx,
+                avsc_names,
+                args.strict,
+                strict_foreign_properties=args.strict_foreign_properties,
+                skip_schemas=args.skip_schemas,
+                salad_version=schema_version,
+                print_oneline=args.print_oneline,
+                fast_parse=args.fast_parser,
+            )
+        else:
+            results = (
+                validate_document(
+                    document_loader,
+                    avsc_names,
+                    uri,
+                    args.strict,
+                    strict_foreign_properties=args.strict_foreign_properties,
+                    print_oneline=args.print_oneline,
+                )
+                for uri in args.document
+            )
+        if args.report:
+            return 0 if write_report(results, sys.stdout) else 1
+        all_valid = True
+        for result in results:
+            if result.valid:
+                _logger.info("Document %r is valid", result.uri)
+            else:
+                all_valid = False
+                if args.debug:
+                    _logger.error("%s\n%s", result.message, result.trace.rstrip())
+                else:
+                    _logger.error("%s", result.message)
+                if args.jobs == 1:
+                    # a serial run stops at the first invalid document
+                    return 1
+        return 0 if all_valid else 1
+
+    # Load target document and resolve refs, to print it or its metadata
     for uri in args.document:
         try:
             document, doc_metadata = document_loader.resolve_ref(
@@ -439,7 +737,7 @@ def main(argsl: list[str] | None = None) -> int:
             msg = to_one_line_messages(e) if args.print_oneline else str(e)
             _logger.error(
                 "Document %r failed validation:\n%s",
-                args.document,
+                uri,
                 msg,
                 exc_info=args.debug,
             )
@@ -25,7 +25,7 @@ else:
     from typing_extensions import Self
 
 import copy
-from collections.abc import MutableSequence, Sequence, MutableMapping
+from collections.abc import Callable, MutableSequence, Sequence, MutableMapping
 from io import StringIO
 from itertools import chain
 from typing import Any, Final, cast, Generic
@@ -42,7 +42,19 @@ from schema_salad.runtime import (
     Loader,
 )
 from schema_salad.sourceline import SourceLine, add_lc_filename
-from schema_salad.utils import yaml_no_ts  # requires schema-salad v8.2+
+
+try:
+    from schema_salad.exceptions import LazyMessage
+except ImportError:  # older schema-salad: format the message right away
+
+    def LazyMessage(render: Callable[..., str], *parts: Any) -> str:  # type: ignore[no-redef]
+        return render(*parts)
+
+
+try:
+    from schema_salad.utils import pooled_yaml_no_ts
+except ImportError:  # older schema-salad: a fresh loader for each document
+    from schema_salad.utils import yaml_no_ts as pooled_yaml_no_ts  # requires schema-salad v8.2+
 
 _loaders: Final[dict[str, Loader | None]] = {}
 _vocab: Final[dict[str, str]] = {}
@@ -378,7 +390,9 @@ class _UnionLoader(Loader):
                                 if "id" in lc:
                                     errors.append(
                                         ValidationException(
-                                            f"checking object `{id}` using `{t}`",
+                                            LazyMessage(
+                                                "checking object `{}` using `{}`".format, id, t
+                                            ),
                                             SourceLine(lc, "id", str),
                                             [e],
                                         )
@@ -386,7 +400,9 @@ class _UnionLoader(Loader):
                                 else:
                                     errors.append(
                                         ValidationException(
-                                            f"checking object `{id}` using `{t}`",
+                                            LazyMessage(
+                                                "checking object `{}` using `{}`".format, id, t
+                                            ),
                                             SourceLine(lc, doc.get("id"), str),
                                             [e],
                                         )
@@ -396,7 +412,9 @@ class _UnionLoader(Loader):
                                     t, (_PrimitiveLoader)
                                 ):  # avoids 'tried <class "NoneType"> was {x}' errors
                                     errors.append(
-                                        ValidationException(f"tried `{t}` but", None, [e])
+                                        ValidationException(
+                                            LazyMessage("tried `{}` but".format, t), None, [e]
+                                        )
                                     )
                 else:
                     # avoids "tried <class "CWLType"> but x" and instead returns the values for parsing
@@ -734,7 +752,7 @@ def _document_load_by_url(
     text: Final = loadingOptions.fetcher.fetch_text(doc_url)
     textIO: Final = StringIO(text)
     textIO.name = str(doc_url)
-    yaml: Final = yaml_no_ts()
+    yaml: Final = pooled_yaml_no_ts()
     result: Final = yaml.load(textIO)
     add_lc_filename(result, doc_url)
 
@@ -942,9 +960,11 @@ class RecordField(Documented):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -953,8 +973,10 @@ class RecordField(Documented):
                                 "the `name` field is not valid because:",
                                 SourceLine(_doc, "name", str),
                                 [e],
-                                detailed_message=f"the `name` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `name` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
 
@@ -998,9 +1020,11 @@ class RecordField(Documented):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -1009,8 +1033,10 @@ class RecordField(Documented):
                                 "the `doc` field is not valid because:",
                                 SourceLine(_doc, "doc", str),
                                 [e],
-                                detailed_message=f"the `doc` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `doc` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         try:
@@ -1046,9 +1072,11 @@ class RecordField(Documented):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -1057,8 +1085,10 @@ class RecordField(Documented):
                             "the `type` field is not valid because:",
                             SourceLine(_doc, "type", str),
                             [e],
-                            detailed_message=f"the `type` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `type` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         extension_fields: MutableMapping[str, Any] = {}
@@ -1202,9 +1232,11 @@ class RecordSchema(Saveable):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -1213,8 +1245,10 @@ class RecordSchema(Saveable):
                                 "the `fields` field is not valid because:",
                                 SourceLine(_doc, "fields", str),
                                 [e],
-                                detailed_message=f"the `fields` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `fields` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         try:
@@ -1250,9 +1284,11 @@ class RecordSchema(Saveable):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -1261,8 +1297,10 @@ class RecordSchema(Saveable):
                             "the `type` field is not valid because:",
                             SourceLine(_doc, "type", str),
                             [e],
-                            detailed_message=f"the `type` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `type` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         extension_fields: MutableMapping[str, Any] = {}
@@ -1414,9 +1452,11 @@ class EnumSchema(Saveable):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -1425,8 +1465,10 @@ class EnumSchema(Saveable):
                                 "the `name` field is not valid because:",
                                 SourceLine(_doc, "name", str),
                                 [e],
-                                detailed_message=f"the `name` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `name` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
 
@@ -1471,9 +1513,11 @@ class EnumSchema(Saveable):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -1482,8 +1526,10 @@ class EnumSchema(Saveable):
                             "the `symbols` field is not valid because:",
                             SourceLine(_doc, "symbols", str),
                             [e],
-                            detailed_message=f"the `symbols` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `symbols` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         try:
@@ -1519,9 +1565,11 @@ class EnumSchema(Saveable):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -1530,8 +1578,10 @@ class EnumSchema(Saveable):
                             "the `type` field is not valid because:",
                             SourceLine(_doc, "type", str),
                             [e],
-                            detailed_message=f"the `type` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `type` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         extension_fields: MutableMapping[str, Any] = {}
@@ -1675,9 +1725,11 @@ class ArraySchema(Saveable):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -1686,8 +1738,10 @@ class ArraySchema(Saveable):
                             "the `items` field is not valid because:",
                             SourceLine(_doc, "items", str),
                             [e],
-                            detailed_message=f"the `items` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `items` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         try:
@@ -1723,9 +1777,11 @@ class ArraySchema(Saveable):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -1734,8 +1790,10 @@ class ArraySchema(Saveable):
                             "the `type` field is not valid because:",
                             SourceLine(_doc, "type", str),
                             [e],
-                            detailed_message=f"the `type` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `type` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         extension_fields: MutableMapping[str, Any] = {}
@@ -1874,9 +1932,11 @@ class MapSchema(Saveable):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -1885,8 +1945,10 @@ class MapSchema(Saveable):
                             "the `type` field is not valid because:",
                             SourceLine(_doc, "type", str),
                             [e],
-                            detailed_message=f"the `type` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `type` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         try:
@@ -1922,9 +1984,11 @@ class MapSchema(Saveable):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -1933,8 +1997,10 @@ class MapSchema(Saveable):
                             "the `values` field is not valid because:",
                             SourceLine(_doc, "values", str),
                             [e],
-                            detailed_message=f"the `values` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `values` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         extension_fields: MutableMapping[str, Any] = {}
@@ -2073,9 +2139,11 @@ class UnionSchema(Saveable):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -2084,8 +2152,10 @@ class UnionSchema(Saveable):
                             "the `names` field is not valid because:",
                             SourceLine(_doc, "names", str),
                             [e],
-                            detailed_message=f"the `names` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `names` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         try:
@@ -2121,9 +2191,11 @@ class UnionSchema(Saveable):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -2132,8 +2204,10 @@ class UnionSchema(Saveable):
                             "the `type` field is not valid because:",
                             SourceLine(_doc, "type", str),
                             [e],
-                            detailed_message=f"the `type` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `type` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         extension_fields: MutableMapping[str, Any] = {}
@@ -2320,9 +2394,11 @@ class JsonldPredicate(Saveable):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -2331,8 +2407,10 @@ class JsonldPredicate(Saveable):
                                 "the `_id` field is not valid because:",
                                 SourceLine(_doc, "_id", str),
                                 [e],
-                                detailed_message=f"the `_id` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `_id` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         _type = None
@@ -2367,9 +2445,11 @@ class JsonldPredicate(Saveable):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -2378,8 +2458,10 @@ class JsonldPredicate(Saveable):
                                 "the `_type` field is not valid because:",
                                 SourceLine(_doc, "_type", str),
                                 [e],
-                                detailed_message=f"the `_type` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `_type` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         _container = None
@@ -2414,9 +2496,11 @@ class JsonldPredicate(Saveable):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -2425,8 +2509,10 @@ class JsonldPredicate(Saveable):
                                 "the `_container` field is not valid because:",
                                 SourceLine(_doc, "_container", str),
                                 [e],
-                                detailed_message=f"the `_container` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `_container` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         identity = None
@@ -2461,9 +2547,11 @@ class JsonldPredicate(Saveable):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -2472,8 +2560,10 @@ class JsonldPredicate(Saveable):
                                 "the `identity` field is not valid because:",
                                 SourceLine(_doc, "identity", str),
                                 [e],
-                                detailed_message=f"the `identity` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `identity` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         noLinkCheck = None
@@ -2508,9 +2598,11 @@ class JsonldPredicate(Saveable):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -2519,8 +2611,10 @@ class JsonldPredicate(Saveable):
                                 "the `noLinkCheck` field is not valid because:",
                                 SourceLine(_doc, "noLinkCheck", str),
                                 [e],
-                                detailed_message=f"the `noLinkCheck` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `noLinkCheck` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         mapSubject = None
@@ -2555,9 +2649,11 @@ class JsonldPredicate(Saveable):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -2566,8 +2662,10 @@ class JsonldPredicate(Saveable):
                                 "the `mapSubject` field is not valid because:",
                                 SourceLine(_doc, "mapSubject", str),
                                 [e],
-                                detailed_message=f"the `mapSubject` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `mapSubject` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         mapPredicate = None
@@ -2602,9 +2700,11 @@ class JsonldPredicate(Saveable):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -2613,8 +2713,10 @@ class JsonldPredicate(Saveable):
                                 "the `mapPredicate` field is not valid because:",
                                 SourceLine(_doc, "mapPredicate", str),
                                 [e],
-                                detailed_message=f"the `mapPredicate` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `mapPredicate` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         refScope = None
@@ -2649,9 +2751,11 @@ class JsonldPredicate(Saveable):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -2660,8 +2764,10 @@ class JsonldPredicate(Saveable):
                                 "the `refScope` field is not valid because:",
                                 SourceLine(_doc, "refScope", str),
                                 [e],
-                                detailed_message=f"the `refScope` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `refScope` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         typeDSL = None
@@ -2696,9 +2802,11 @@ class JsonldPredicate(Saveable):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -2707,8 +2815,10 @@ class JsonldPredicate(Saveable):
                                 "the `typeDSL` field is not valid because:",
                                 SourceLine(_doc, "typeDSL", str),
                                 [e],
-                                detailed_message=f"the `typeDSL` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `typeDSL` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         secondaryFilesDSL = None
@@ -2743,9 +2853,11 @@ class JsonldPredicate(Saveable):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -2754,8 +2866,10 @@ class JsonldPredicate(Saveable):
                                 "the `secondaryFilesDSL` field is not valid because:",
                                 SourceLine(_doc, "secondaryFilesDSL", str),
                                 [e],
-                                detailed_message=f"the `secondaryFilesDSL` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `secondaryFilesDSL` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         subscope = None
@@ -2790,9 +2904,11 @@ class JsonldPredicate(Saveable):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -2801,8 +2917,10 @@ class JsonldPredicate(Saveable):
                                 "the `subscope` field is not valid because:",
                                 SourceLine(_doc, "subscope", str),
                                 [e],
-                                detailed_message=f"the `subscope` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `subscope` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         extension_fields: MutableMapping[str, Any] = {}
@@ -3018,9 +3136,11 @@ class SpecializeDef(Saveable):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -3029,8 +3149,10 @@ class SpecializeDef(Saveable):
                             "the `specializeFrom` field is not valid because:",
                             SourceLine(_doc, "specializeFrom", str),
                             [e],
-                            detailed_message=f"the `specializeFrom` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `specializeFrom` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         try:
@@ -3066,9 +3188,11 @@ class SpecializeDef(Saveable):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -3077,8 +3201,10 @@ class SpecializeDef(Saveable):
                             "the `specializeTo` field is not valid because:",
                             SourceLine(_doc, "specializeTo", str),
                             [e],
-                            detailed_message=f"the `specializeTo` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `specializeTo` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         extension_fields: MutableMapping[str, Any] = {}
@@ -3255,9 +3381,11 @@ class SaladRecordField(RecordField):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -3266,8 +3394,10 @@ class SaladRecordField(RecordField):
                                 "the `name` field is not valid because:",
                                 SourceLine(_doc, "name", str),
                                 [e],
-                                detailed_message=f"the `name` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `name` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
 
@@ -3311,9 +3441,11 @@ class SaladRecordField(RecordField):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -3322,8 +3454,10 @@ class SaladRecordField(RecordField):
                                 "the `doc` field is not valid because:",
                                 SourceLine(_doc, "doc", str),
                                 [e],
-                                detailed_message=f"the `doc` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `doc` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         try:
@@ -3359,9 +3493,11 @@ class SaladRecordField(RecordField):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -3370,8 +3506,10 @@ class SaladRecordField(RecordField):
                             "the `type` field is not valid because:",
                             SourceLine(_doc, "type", str),
                             [e],
-                            detailed_message=f"the `type` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `type` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         jsonldPredicate = None
@@ -3406,9 +3544,11 @@ class SaladRecordField(RecordField):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -3417,8 +3557,10 @@ class SaladRecordField(RecordField):
                                 "the `jsonldPredicate` field is not valid because:",
                                 SourceLine(_doc, "jsonldPredicate", str),
                                 [e],
-                                detailed_message=f"the `jsonldPredicate` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `jsonldPredicate` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         default = None
@@ -3453,9 +3595,11 @@ class SaladRecordField(RecordField):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -3464,8 +3608,10 @@ class SaladRecordField(RecordField):
                                 "the `default` field is not valid because:",
                                 SourceLine(_doc, "default", str),
                                 [e],
-                                detailed_message=f"the `default` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `default` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         extension_fields: MutableMapping[str, Any] = {}
@@ -3678,9 +3824,11 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -3689,8 +3837,10 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 "the `name` field is not valid because:",
                                 SourceLine(_doc, "name", str),
                                 [e],
-                                detailed_message=f"the `name` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `name` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
 
@@ -3734,9 +3884,11 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -3745,8 +3897,10 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 "the `inVocab` field is not valid because:",
                                 SourceLine(_doc, "inVocab", str),
                                 [e],
-                                detailed_message=f"the `inVocab` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `inVocab` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         fields = None
@@ -3781,9 +3935,11 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -3792,8 +3948,10 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 "the `fields` field is not valid because:",
                                 SourceLine(_doc, "fields", str),
                                 [e],
-                                detailed_message=f"the `fields` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `fields` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         try:
@@ -3829,9 +3987,11 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -3840,8 +4000,10 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                             "the `type` field is not valid because:",
                             SourceLine(_doc, "type", str),
                             [e],
-                            detailed_message=f"the `type` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `type` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         doc = None
@@ -3876,9 +4038,11 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -3887,8 +4051,10 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 "the `doc` field is not valid because:",
                                 SourceLine(_doc, "doc", str),
                                 [e],
-                                detailed_message=f"the `doc` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `doc` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         docParent = None
@@ -3923,9 +4089,11 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -3934,8 +4102,10 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 "the `docParent` field is not valid because:",
                                 SourceLine(_doc, "docParent", str),
                                 [e],
-                                detailed_message=f"the `docParent` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `docParent` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         docChild = None
@@ -3970,9 +4140,11 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -3981,8 +4153,10 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 "the `docChild` field is not valid because:",
                                 SourceLine(_doc, "docChild", str),
                                 [e],
-                                detailed_message=f"the `docChild` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `docChild` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         docAfter = None
@@ -4017,9 +4191,11 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -4028,8 +4204,10 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 "the `docAfter` field is not valid because:",
                                 SourceLine(_doc, "docAfter", str),
                                 [e],
-                                detailed_message=f"the `docAfter` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `docAfter` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         jsonldPredicate = None
@@ -4064,9 +4242,11 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -4075,8 +4255,10 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 "the `jsonldPredicate` field is not valid because:",
                                 SourceLine(_doc, "jsonldPredicate", str),
                                 [e],
-                                detailed_message=f"the `jsonldPredicate` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `jsonldPredicate` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         documentRoot = None
@@ -4111,9 +4293,11 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -4122,8 +4306,10 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 "the `documentRoot` field is not valid because:",
                                 SourceLine(_doc, "documentRoot", str),
                                 [e],
-                                detailed_message=f"the `documentRoot` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `documentRoot` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         abstract = None
@@ -4158,9 +4344,11 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -4169,8 +4357,10 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 "the `abstract` field is not valid because:",
                                 SourceLine(_doc, "abstract", str),
                                 [e],
-                                detailed_message=f"the `abstract` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `abstract` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         extends = None
@@ -4205,9 +4395,11 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -4216,8 +4408,10 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 "the `extends` field is not valid because:",
                                 SourceLine(_doc, "extends", str),
                                 [e],
-                                detailed_message=f"the `extends` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `extends` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         specialize = None
@@ -4252,9 +4446,11 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -4263,8 +4459,10 @@ class SaladRecordSchema(NamedType, RecordSchema, SchemaDefinedType):
                                 "the `specialize` field is not valid because:",
                                 SourceLine(_doc, "specialize", str),
                                 [e],
-                                detailed_message=f"the `specialize` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `specialize` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         extension_fields: MutableMapping[str, Any] = {}
@@ -4533,9 +4731,11 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -4544,8 +4744,10 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 "the `name` field is not valid because:",
                                 SourceLine(_doc, "name", str),
                                 [e],
-                                detailed_message=f"the `name` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `name` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
 
@@ -4589,9 +4791,11 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -4600,8 +4804,10 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 "the `inVocab` field is not valid because:",
                                 SourceLine(_doc, "inVocab", str),
                                 [e],
-                                detailed_message=f"the `inVocab` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `inVocab` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         try:
@@ -4637,9 +4843,11 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -4648,8 +4856,10 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                             "the `symbols` field is not valid because:",
                             SourceLine(_doc, "symbols", str),
                             [e],
-                            detailed_message=f"the `symbols` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `symbols` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         try:
@@ -4685,9 +4895,11 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -4696,8 +4908,10 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                             "the `type` field is not valid because:",
                             SourceLine(_doc, "type", str),
                             [e],
-                            detailed_message=f"the `type` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `type` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         doc = None
@@ -4732,9 +4946,11 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -4743,8 +4959,10 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 "the `doc` field is not valid because:",
                                 SourceLine(_doc, "doc", str),
                                 [e],
-                                detailed_message=f"the `doc` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `doc` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         docParent = None
@@ -4779,9 +4997,11 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -4790,8 +5010,10 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 "the `docParent` field is not valid because:",
                                 SourceLine(_doc, "docParent", str),
                                 [e],
-                                detailed_message=f"the `docParent` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `docParent` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         docChild = None
@@ -4826,9 +5048,11 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -4837,8 +5061,10 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 "the `docChild` field is not valid because:",
                                 SourceLine(_doc, "docChild", str),
                                 [e],
-                                detailed_message=f"the `docChild` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `docChild` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         docAfter = None
@@ -4873,9 +5099,11 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -4884,8 +5112,10 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 "the `docAfter` field is not valid because:",
                                 SourceLine(_doc, "docAfter", str),
                                 [e],
-                                detailed_message=f"the `docAfter` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `docAfter` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         jsonldPredicate = None
@@ -4920,9 +5150,11 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -4931,8 +5163,10 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 "the `jsonldPredicate` field is not valid because:",
                                 SourceLine(_doc, "jsonldPredicate", str),
                                 [e],
-                                detailed_message=f"the `jsonldPredicate` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `jsonldPredicate` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         documentRoot = None
@@ -4967,9 +5201,11 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -4978,8 +5214,10 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 "the `documentRoot` field is not valid because:",
                                 SourceLine(_doc, "documentRoot", str),
                                 [e],
-                                detailed_message=f"the `documentRoot` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `documentRoot` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         extends = None
@@ -5014,9 +5252,11 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -5025,8 +5265,10 @@ class SaladEnumSchema(NamedType, EnumSchema, SchemaDefinedType):
                                 "the `extends` field is not valid because:",
                                 SourceLine(_doc, "extends", str),
                                 [e],
-                                detailed_message=f"the `extends` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `extends` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         extension_fields: MutableMapping[str, Any] = {}
@@ -5272,9 +5514,11 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -5283,8 +5527,10 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 "the `name` field is not valid because:",
                                 SourceLine(_doc, "name", str),
                                 [e],
-                                detailed_message=f"the `name` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `name` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
 
@@ -5328,9 +5574,11 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -5339,8 +5587,10 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 "the `inVocab` field is not valid because:",
                                 SourceLine(_doc, "inVocab", str),
                                 [e],
-                                detailed_message=f"the `inVocab` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `inVocab` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         try:
@@ -5376,9 +5626,11 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -5387,8 +5639,10 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                             "the `type` field is not valid because:",
                             SourceLine(_doc, "type", str),
                             [e],
-                            detailed_message=f"the `type` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `type` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         try:
@@ -5424,9 +5678,11 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -5435,8 +5691,10 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                             "the `values` field is not valid because:",
                             SourceLine(_doc, "values", str),
                             [e],
-                            detailed_message=f"the `values` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `values` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         doc = None
@@ -5471,9 +5729,11 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -5482,8 +5742,10 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 "the `doc` field is not valid because:",
                                 SourceLine(_doc, "doc", str),
                                 [e],
-                                detailed_message=f"the `doc` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `doc` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         docParent = None
@@ -5518,9 +5780,11 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -5529,8 +5793,10 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 "the `docParent` field is not valid because:",
                                 SourceLine(_doc, "docParent", str),
                                 [e],
-                                detailed_message=f"the `docParent` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `docParent` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         docChild = None
@@ -5565,9 +5831,11 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -5576,8 +5844,10 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 "the `docChild` field is not valid because:",
                                 SourceLine(_doc, "docChild", str),
                                 [e],
-                                detailed_message=f"the `docChild` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `docChild` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         docAfter = None
@@ -5612,9 +5882,11 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -5623,8 +5895,10 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 "the `docAfter` field is not valid because:",
                                 SourceLine(_doc, "docAfter", str),
                                 [e],
-                                detailed_message=f"the `docAfter` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `docAfter` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         jsonldPredicate = None
@@ -5659,9 +5933,11 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -5670,8 +5946,10 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 "the `jsonldPredicate` field is not valid because:",
                                 SourceLine(_doc, "jsonldPredicate", str),
                                 [e],
-                                detailed_message=f"the `jsonldPredicate` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `jsonldPredicate` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         documentRoot = None
@@ -5706,9 +5984,11 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -5717,8 +5997,10 @@ class SaladMapSchema(NamedType, MapSchema, SchemaDefinedType):
                                 "the `documentRoot` field is not valid because:",
                                 SourceLine(_doc, "documentRoot", str),
                                 [e],
-                                detailed_message=f"the `documentRoot` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `documentRoot` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         extension_fields: MutableMapping[str, Any] = {}
@@ -5955,9 +6237,11 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -5966,8 +6250,10 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                                 "the `name` field is not valid because:",
                                 SourceLine(_doc, "name", str),
                                 [e],
-                                detailed_message=f"the `name` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `name` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
 
@@ -6011,9 +6297,11 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -6022,8 +6310,10 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                                 "the `inVocab` field is not valid because:",
                                 SourceLine(_doc, "inVocab", str),
                                 [e],
-                                detailed_message=f"the `inVocab` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `inVocab` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         try:
@@ -6059,9 +6349,11 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -6070,8 +6362,10 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                             "the `names` field is not valid because:",
                             SourceLine(_doc, "names", str),
                             [e],
-                            detailed_message=f"the `names` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `names` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         try:
@@ -6107,9 +6401,11 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -6118,8 +6414,10 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                             "the `type` field is not valid because:",
                             SourceLine(_doc, "type", str),
                             [e],
-                            detailed_message=f"the `type` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `type` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         doc = None
@@ -6154,9 +6452,11 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -6165,8 +6465,10 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                                 "the `doc` field is not valid because:",
                                 SourceLine(_doc, "doc", str),
                                 [e],
-                                detailed_message=f"the `doc` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `doc` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         docParent = None
@@ -6201,9 +6503,11 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -6212,8 +6516,10 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                                 "the `docParent` field is not valid because:",
                                 SourceLine(_doc, "docParent", str),
                                 [e],
-                                detailed_message=f"the `docParent` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `docParent` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         docChild = None
@@ -6248,9 +6554,11 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -6259,8 +6567,10 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                                 "the `docChild` field is not valid because:",
                                 SourceLine(_doc, "docChild", str),
                                 [e],
-                                detailed_message=f"the `docChild` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `docChild` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         docAfter = None
@@ -6295,9 +6605,11 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -6306,8 +6618,10 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                                 "the `docAfter` field is not valid because:",
                                 SourceLine(_doc, "docAfter", str),
                                 [e],
-                                detailed_message=f"the `docAfter` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `docAfter` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         documentRoot = None
@@ -6342,9 +6656,11 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -6353,8 +6669,10 @@ class SaladUnionSchema(NamedType, UnionSchema, DocType):
                                 "the `documentRoot` field is not valid because:",
                                 SourceLine(_doc, "documentRoot", str),
                                 [e],
-                                detailed_message=f"the `documentRoot` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `documentRoot` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         extension_fields: MutableMapping[str, Any] = {}
@@ -6574,9 +6892,11 @@ class Documentation(NamedType, DocType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -6585,8 +6905,10 @@ class Documentation(NamedType, DocType):
                                 "the `name` field is not valid because:",
                                 SourceLine(_doc, "name", str),
                                 [e],
-                                detailed_message=f"the `name` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `name` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
 
@@ -6630,9 +6952,11 @@ class Documentation(NamedType, DocType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -6641,8 +6965,10 @@ class Documentation(NamedType, DocType):
                                 "the `inVocab` field is not valid because:",
                                 SourceLine(_doc, "inVocab", str),
                                 [e],
-                                detailed_message=f"the `inVocab` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `inVocab` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         doc = None
@@ -6677,9 +7003,11 @@ class Documentation(NamedType, DocType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -6688,8 +7016,10 @@ class Documentation(NamedType, DocType):
                                 "the `doc` field is not valid because:",
                                 SourceLine(_doc, "doc", str),
                                 [e],
-                                detailed_message=f"the `doc` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `doc` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         docParent = None
@@ -6724,9 +7054,11 @@ class Documentation(NamedType, DocType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -6735,8 +7067,10 @@ class Documentation(NamedType, DocType):
                                 "the `docParent` field is not valid because:",
                                 SourceLine(_doc, "docParent", str),
                                 [e],
-                                detailed_message=f"the `docParent` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `docParent` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         docChild = None
@@ -6771,9 +7105,11 @@ class Documentation(NamedType, DocType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -6782,8 +7118,10 @@ class Documentation(NamedType, DocType):
                                 "the `docChild` field is not valid because:",
                                 SourceLine(_doc, "docChild", str),
                                 [e],
-                                detailed_message=f"the `docChild` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `docChild` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         docAfter = None
@@ -6818,9 +7156,11 @@ class Documentation(NamedType, DocType):
                                 [ValidationException(f"Value is a {val_type}, "
                                                      f"but valid {to_print} for this field "
                                                      f"{verb_tensage} {error_message}",
-                                                     detailed_message=f"Value `{val}` is a {val_type}, "
-                                                     f"but valid {to_print} for this field "
-                                                     f"{verb_tensage} {error_message}")],
+                                                     detailed_message=LazyMessage(
+                                                         "Value `{}` is a {}, "
+                                                         "but valid {} for this field "
+                                                         "{} {}".format,
+                                                         val, val_type, to_print, verb_tensage, error_message))],
                             )
                         )
                     else:
@@ -6829,8 +7169,10 @@ class Documentation(NamedType, DocType):
                                 "the `docAfter` field is not valid because:",
                                 SourceLine(_doc, "docAfter", str),
                                 [e],
-                                detailed_message=f"the `docAfter` field with value `{val}` "
-                                "is not valid because:",
+                                detailed_message=LazyMessage(
+                                    "the `docAfter` field with value `{}` "
+                                    "is not valid because:".format,
+                                    val),
                             )
                         )
         try:
@@ -6866,9 +7208,11 @@ class Documentation(NamedType, DocType):
                             [ValidationException(f"Value is a {val_type}, "
                                                  f"but valid {to_print} for this field "
                                                  f"{verb_tensage} {error_message}",
-                                                 detailed_message=f"Value `{val}` is a {val_type}, "
-                                                 f"but valid {to_print} for this field "
-                                                 f"{verb_tensage} {error_message}")],
+                                                 detailed_message=LazyMessage(
+                                                     "Value `{}` is a {}, "
+                                                     "but valid {} for this field "
+                                                     "{} {}".format,
+                                                     val, val_type, to_print, verb_tensage, error_message))],
                         )
                     )
                 else:
@@ -6877,8 +7221,10 @@ class Documentation(NamedType, DocType):
                             "the `type` field is not valid because:",
                             SourceLine(_doc, "type", str),
                             [e],
-                            detailed_message=f"the `type` field with value `{val}` "
-                            "is not valid because:",
+                            detailed_message=LazyMessage(
+                                "the `type` field with value `{}` "
+                                "is not valid because:".format,
+                                val),
                         )
                     )
         extension_fields: MutableMapping[str, Any] = {}
@@ -7331,7 +7677,7 @@ def load_document_by_string(
     uri: str,
     loadingOptions: LoadingOptions | None = None,
 ) -> Any:
-    yaml = yaml_no_ts()
+    yaml = pooled_yaml_no_ts()
     result = yaml.load(string)
     add_lc_filename(result, uri)
 
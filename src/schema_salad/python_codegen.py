@@ -699,9 +699,11 @@ if _errors__:
 {spc}                            [ValidationException(f"Value is a {{val_type}}, "
 {spc}                                                 f"but valid {{to_print}} for this field "
 {spc}                                                 f"{{verb_tensage}} {{error_message}}",
-{spc}                                                 detailed_message=f"Value `{{val}}` is a {{val_type}}, "
-{spc}                                                 f"but valid {{to_print}} for this field "
-{spc}                                                 f"{{verb_tensage}} {{error_message}}")],
+{spc}                                                 detailed_message=LazyMessage(
+{spc}                                                     "Value `{{}}` is a {{}}, "
+{spc}                                                     "but valid {{}} for this field "
+{spc}                                                     "{{}} {{}}".format,
+{spc}                                                     val, val_type, to_print, verb_tensage, error_message))],
 {spc}                        )
 {spc}                    )
 {spc}                else:
@@ -710,8 +712,10 @@ if _errors__:
 {spc}                            "the `{fieldname}` field is not valid because:",
 {spc}                            SourceLine(_doc, "{fieldname}", str),
 {spc}                            [e],
-{spc}                            detailed_message=f"the `{fieldname}` field with value `{{val}}` "
-{spc}                            "is not valid because:\",
+{spc}                            detailed_message=LazyMessage(
+{spc}                                "the `{fieldname}` field with value `{{}}` "
+{spc}                                "is not valid because:".format,
+{spc}                                val),
 {spc}                        )
 {spc}                    )
 """.format(
@@ -910,7 +914,7 @@ def load_document_by_string(
     uri: str,
     loadingOptions: LoadingOptions | None = None,
 ) -> Any:
-    yaml = yaml_no_ts()
+    yaml = pooled_yaml_no_ts()
     result = yaml.load(string)
     add_lc_filename(result, uri)
 
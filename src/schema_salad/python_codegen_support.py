@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import copy
-from collections.abc import MutableSequence, Sequence, MutableMapping
+from collections.abc import Callable, MutableSequence, Sequence, MutableMapping
 from io import StringIO
 from itertools import chain
 from typing import Any, Final, cast, Generic
@@ -20,7 +20,19 @@ from schema_salad.runtime import (
     Loader,
 )
 from schema_salad.sourceline import SourceLine, add_lc_filename
-from schema_salad.utils import yaml_no_ts  # requires schema-salad v8.2+
+
+try:
+    from schema_salad.exceptions import LazyMessage
+except ImportError:  # older schema-salad: format the message right away
+
+    def LazyMessage(render: Callable[..., str], *parts: Any) -> str:  # type: ignore[no-redef]
+        return render(*parts)
+
+
+try:
+    from schema_salad.utils import pooled_yaml_no_ts
+except ImportError:  # older schema-salad: a fresh loader for each document
+    from schema_salad.utils import yaml_no_ts as pooled_yaml_no_ts  # requires schema-salad v8.2+
 
 _loaders: Final[dict[str, Loader | None]] = {}
 _vocab: Final[dict[str, str]] = {}
@@ -356,7 +368,9 @@ class _UnionLoader(Loader):
                                 if "id" in lc:
                                     errors.append(
                                         ValidationException(
-                                            f"checking object `{id}` using `{t}`",
+                                            LazyMessage(
+                                                "checking object `{}` using `{}`".format, id, t
+                                            ),
                                             SourceLine(lc, "id", str),
                                             [e],
                                         )
@@ -364,7 +378,9 @@ class _UnionLoader(Loader):
                                 else:
                                     errors.append(
                                         ValidationException(
-                                            f"checking object `{id}` using `{t}`",
+                                            LazyMessage(
+                                                "checking object `{}` using `{}`".format, id, t
+                                            ),
                                             SourceLine(lc, doc.get("id"), str),
                                             [e],
                                         )
@@ -374,7 +390,9 @@ class _UnionLoader(Loader):
                                     t, (_PrimitiveLoader)
                                 ):  # avoids 'tried <class "NoneType"> was {x}' errors
                                     errors.append(
-                                        ValidationException(f"tried `{t}` but", None, [e])
+                                        ValidationException(
+                                            LazyMessage("tried `{}` but".format, t), None, [e]
+                                        )
                                     )
                 else:
                     # avoids "tried <class "CWLType"> but x" and instead returns the values for parsing
@@ -712,7 +730,7 @@ def _document_load_by_url(
     text: Final = loadingOptions.fetcher.fetch_text(doc_url)
     textIO: Final = StringIO(text)
     textIO.name = str(doc_url)
-    yaml: Final = yaml_no_ts()
+    yaml: Final = pooled_yaml_no_ts()
     result: Final = yaml.load(textIO)
     add_lc_filename(result, doc_url)
 
@@ -1,13 +1,20 @@
 import copy
+import hashlib
 import logging
 import os
-import pathlib
 import re
-import tempfile
 import traceback
 import urllib
 import xml.sax  # nosec
-from collections.abc import Callable, MutableMapping, MutableSequence
+from collections.abc import (
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    MutableMapping,
+    MutableSequence,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import StringIO
 from typing import Any, Final, Optional, cast
 
@@ -25,7 +32,7 @@ from ruamel.yaml.comments import CommentedMap, CommentedSeq, LineCol
 from ruamel.yaml.error import MarkedYAMLError
 
 from .exceptions import SchemaSaladException, ValidationException
-from .fetcher import DefaultFetcher
+from .fetcher import AsyncFetcher, DefaultFetcher
 from .sourceline import SourceLine, add_lc_filename, relname
 from .utils import (
     AttachmentsType,
@@ -37,11 +44,28 @@ from .utils import (
     ResolvedRefType,
     ResolveType,
     aslist,
+    cache_dir,
+    copy_yaml_tree,
     onWindows,
-    yaml_no_ts,
+    parsed_documents,
+    pooled_yaml_no_ts,
+    yaml_fast_load,
 )
 
 _logger: Final = logging.getLogger("salad")
+_EXPAND_URL_CACHE_SIZE: Final = 65536
+_NORMALIZED_KEYS_SIZE: Final = 65536
+
+# The roles a field can play in a document, combined in Loader.field_roles
+_URL_FIELD: Final = 1
+_VOCAB_FIELD: Final = 2
+_SCOPED_REF: Final = 4
+_IDMAP_FIELD: Final = 8
+_DSL_FIELD: Final = 16
+_IDENTIFIER: Final = 32
+_IDENTITY_LINK: Final = 64
+_SUBSCOPE: Final = 128
+_VOCAB_TERM: Final = 256  # already a vocabulary term, so _normalize_fields keeps it
 
 
 def file_uri(path: str, split_frag: bool = False) -> str:
@@ -94,51 +118,137 @@ def to_validation_exception(e: MarkedYAMLError) -> ValidationException:
 
 
 class NormDict(dict[str, CommentedMap | CommentedSeq | str | None]):
-    """A Dict where all keys are normalized using the provided function."""
+    """
+    A Dict where all keys are normalized using the provided function.
+
+    The normalized form of each key is remembered, so that looking the same
+    string up again, which the Loader does all the time, is a plain dict lookup.
+    Keys with a fragment are also indexed by (document, each "/"-terminated
+    prefix of the fragment, rest of the fragment), for Loader.validate_scoped.
+    """
 
     def __init__(self, normalize: Callable[[str], str] = str) -> None:
         super().__init__()
         self.normalize: Final = normalize
+        self.normalized: Final[dict[str, str]] = {}
+        self.scoped: Final[dict[tuple[str, str, str], str]] = {}
 
     def __eq__(self, other: Any) -> bool:
         return super().__eq__(other)
 
+    def normalize_key(self, key: str) -> str:
+        """Normalize the key, remembering the result."""
+        normalized = self.normalized.get(key)
+        if normalized is None:
+            normalized = self.normalize(key)
+            if len(self.normalized) >= _NORMALIZED_KEYS_SIZE:
+                del self.normalized[next(iter(self.normalized))]
+            self.normalized[key] = normalized
+        return normalized
+
     def __getitem__(self, key: Any) -> Any:
-        return super().__getitem__(self.normalize(key))
+        return super().__getitem__(self.normalize_key(key))
+
+    def _scoped_keys(self, key: str) -> list[tuple[str, str, str]]:
+        document, _, fragment = key.partition("#")
+        if not fragment:
+            return []
+        keys: Final = [(document, "", fragment)]
+        slash = fragment.find("/")
+        while slash >= 0:
+            keys.append((document, fragment[: slash + 1], fragment[slash + 1 :]))
+            slash = fragment.find("/", slash + 1)
+        return keys
 
     def __setitem__(self, key: Any, value: Any) -> Any:
-        return super().__setitem__(self.normalize(key), value)
+        normalized: Final = self.normalize_key(key)
+        if not super().__contains__(normalized):
+            for scoped in self._scoped_keys(normalized):
+                self.scoped[scoped] = normalized
+        return super().__setitem__(normalized, value)
 
     def __delitem__(self, key: Any) -> Any:
-        return super().__delitem__(self.normalize(key))
+        normalized: Final = self.normalize_key(key)
+        super().__delitem__(normalized)
+        for scoped in self._scoped_keys(normalized):
+            self.scoped.pop(scoped, None)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value: Final = self[key]
+        del self[key]
+        return value
+
+    def clear(self) -> None:
+        super().clear()
+        self.scoped.clear()
 
     def __contains__(self, key: Any) -> bool:
-        return super().__contains__(self.normalize(key))
+        return super().__contains__(self.normalize_key(key))
 
     def __del__(self) -> None:
         del self.normalize
 
 
 def SubLoader(loader: "Loader") -> "Loader":
-    return Loader(
-        loader.ctx,
+    """Create a Loader that starts from the context of the given one."""
+    sub: Final = Loader(
+        {},
         schemagraph=loader.graph,
-        foreign_properties=loader.foreign_properties,
         idx=loader.idx,
         cache=loader.cache,
+        source_checksums=loader.source_checksums,
+        source_sizes=loader.source_sizes,
+        imported_by=loader.imported_by,
         fetcher_constructor=loader.fetcher_constructor,
         skip_schemas=loader.skip_schemas,
-        url_fields=loader.url_fields,
         allow_attachments=loader.allow_attachments,
         session=loader.session,
         salad_version=loader.salad_version,
+        link_check_workers=loader.link_check_workers,
+        fast_parse=loader.fast_parse,
+        async_fetcher=loader.async_fetcher,
+        prefetched=loader.prefetched,
     )
+    sub._share_context(loader)
+    return sub
 
 
 def _url_norm(url: str) -> str:
     return urllib.parse.urlsplit(url).geturl()
 
 
+class _ContextState:
+    """What a Loader derived from its context, as add_context left it, for its SubLoaders."""
+
+    def __init__(self, loader: "Loader") -> None:
+        self.ctx: Final = loader.ctx
+        self.url_fields: Final = loader.url_fields
+        self.foreign_properties: Final = loader.foreign_properties
+        self.scoped_ref_fields: Final = loader.scoped_ref_fields
+        self.vocab_fields: Final = loader.vocab_fields
+        self.identifiers: Final = loader.identifiers
+        self.identity_links: Final = loader.identity_links
+        self.standalone: Final = loader.standalone
+        self.nolinkcheck: Final = loader.nolinkcheck
+        self.vocab: Final = loader.vocab
+        self.rvocab: Final = loader.rvocab
+        self.idmap: Final = loader.idmap
+        self.mapPredicate: Final = loader.mapPredicate
+        self.type_dsl_fields: Final = loader.type_dsl_fields
+        self.secondaryFile_dsl_fields: Final = loader.secondaryFile_dsl_fields
+        self.subscopes: Final = loader.subscopes
+        self.field_roles: Final = loader.field_roles
+        self.expand_url_cache: Final = loader.expand_url_cache
+
+
 @mypyc_attr(allow_interpreted_subclasses=True)
 class Loader:
     def __init__(
@@ -155,8 +265,23 @@ class Loader:
         allow_attachments: AttachmentsType | None = None,
         doc_cache: str | bool = True,
         salad_version: str | None = None,
+        source_checksums: dict[str, str] | None = None,
+        source_sizes: dict[str, int] | None = None,
+        imported_by: dict[str, set[str]] | None = None,
+        link_check_workers: int = 1,
+        fast_parse: bool = False,
+        async_fetcher: AsyncFetcher | None = None,
+        prefetched: dict[str, Future[str]] | None = None,
     ) -> None:
         self.idx: IdxType = NormDict(_url_norm) if idx is None else idx
+        # SHA-256 of the text of every document fetched through this loader
+        self.source_checksums: dict[str, str] = {} if source_checksums is None else source_checksums
+        # and its size in bytes, in the order the documents were fetched
+        self.source_sizes: dict[str, int] = {} if source_sizes is None else source_sizes
+        # The documents that $import, $include or $mixin each document
+        self.imported_by: dict[str, set[str]] = {} if imported_by is None else imported_by
+        # The checksums of the schema documents that the context was built from
+        self.schema_sources: dict[str, str] = {}
 
         self.ctx: ContextType = {}
         self.graph = schemagraph if schemagraph is not None else Graph()
@@ -170,10 +295,9 @@ class Loader:
             if doc_cache is False:
                 temp_session = requests.Session()
             elif doc_cache is True:
-                root: Final = pathlib.Path(os.environ.get("HOME", tempfile.gettempdir()))
                 temp_session = CacheControl(
                     requests.Session(),
-                    cache=SeparateBodyFileCache(root / ".cache" / "salad"),
+                    cache=SeparateBodyFileCache(cache_dir()),
                 )
             elif isinstance(doc_cache, str):
                 temp_session = CacheControl(
@@ -189,6 +313,14 @@ class Loader:
         self.fetcher = self.fetcher_constructor(self.cache, self.session)
         self.fetch_text = self.fetcher.fetch_text
         self.check_exists = self.fetcher.check_exists
+        # Maximum number of links checked at the same time by validate_links;
+        # above 1, the fetcher's check_exists() must be thread-safe
+        self.link_check_workers = link_check_workers
+        # check_exists() results gathered ahead of validate_links
+        self.prechecked_links: dict[str, bool] = {}
+        # Fetches started ahead of resolution by prefetch(), if an AsyncFetcher is set
+        self.async_fetcher = async_fetcher
+        self.prefetched: dict[str, Future[str]] = {} if prefetched is None else prefetched
         self.url_fields: set[str] = set() if url_fields is None else set(url_fields)
         self.scoped_ref_fields: dict[str, int] = {}
         self.vocab_fields: set[str] = set()
@@ -197,13 +329,26 @@ class Loader:
         self.standalone: set[str] | None = None
         self.nolinkcheck: set[str] = set()
         self.vocab: dict[str, str] = {}
+        # expand_url() results, least recently used first; cleared when the vocab changes
+        self.expand_url_cache: dict[tuple[str, str, bool, bool, int | None], str] = {}
+        self.expand_url_cache_size = _EXPAND_URL_CACHE_SIZE
+        self.expand_url_hits = 0
+        self.expand_url_misses = 0
         self.rvocab: dict[str, str] = {}
         self.idmap: dict[str, str] = {}
         self.mapPredicate: dict[str, str] = {}
         self.type_dsl_fields: set[str] = set()
         self.subscopes: dict[str, str] = {}
+        # The roles of each field, recomputed whenever the sets above change
+        self.field_roles: dict[str, int] = {}
         self.secondaryFile_dsl_fields: set[str] = set()
+        # Whether the containers above are shared, with context_state and so
+        # with the SubLoaders; add_namespaces and add_schemas copy them first
+        self.shared_context = False
+        self.context_state: _ContextState | None = None
         self.allow_attachments = allow_attachments
+        # Parse with libyaml when possible, giving up comments and scalar styles
+        self.fast_parse = fast_parse
 
         if salad_version:
             temp_salad_version = salad_version
@@ -221,14 +366,39 @@ class Loader:
         vocab_term: bool = False,
         scoped_ref: int | None = None,
     ) -> str:
+        key: Final = (url, base_url, scoped_id, vocab_term, scoped_ref)
+        cached: Final = self.expand_url_cache.pop(key, None)
+        if cached is not None:
+            self.expand_url_hits += 1
+            self.expand_url_cache[key] = cached
+            return cached
+        self.expand_url_misses += 1
+        expanded, cacheable = self._expand_url(url, base_url, scoped_id, vocab_term, scoped_ref)
+        if cacheable and self.expand_url_cache_size > 0:
+            if len(self.expand_url_cache) >= self.expand_url_cache_size:
+                del self.expand_url_cache[next(iter(self.expand_url_cache))]
+            self.expand_url_cache[key] = expanded
+        return expanded
+
+    def _expand_url(
+        self,
+        url: str,
+        base_url: str,
+        scoped_id: bool,
+        vocab_term: bool,
+        scoped_ref: int | None,
+    ) -> tuple[str, bool]:
+        """Expand the URL; the result can be cached unless a warning was logged."""
         if url in ("@id", "@type"):
-            return url
+            return url, True
 
         if vocab_term and url in self.vocab:
-            return url
+            return url, True
 
         if url.startswith("_:"):
-            return url
+            return url, True
+
+        cacheable = True
 
         if bool(self.vocab) and ":" in url:
             prefix: Final = url.split(":")[0]
@@ -247,6 +417,7 @@ class Loader:
                     prefix,
                     url,
                 )
+                cacheable = False
 
         split: Final = urllib.parse.urlsplit(url)
 
@@ -271,8 +442,8 @@ class Loader:
             url = self.fetcher.urljoin(base_url, url)
 
         if vocab_term and url in self.rvocab:
-            return self.rvocab[url]
-        return url
+            return self.rvocab[url], cacheable
+        return url, cacheable
 
     def _add_properties(self, s: str) -> None:
         for _, _, rng in self.graph.triples((s, RDFS.range, None)):
@@ -286,18 +457,22 @@ class Loader:
 
     def add_namespaces(self, ns: dict[str, str]) -> None:
         """Add the given namespace to our vocab list."""
+        self._own_context()
         self.vocab.update(ns)
+        self.expand_url_cache = {}
+        self._update_field_roles()
 
     def add_schemas(self, ns: list[str] | str, base_url: str) -> None:
         """Fetch external schemas and add them to the graph."""
         if self.skip_schemas:
             return
+        self._own_context()
         for sch in aslist(ns):
             fetchurl = self.fetcher.urljoin(base_url, sch)
             if fetchurl not in self.cache or self.cache[fetchurl] is True:
                 _logger.debug("Getting external schema %s", fetchurl)
                 try:
-                    content = self.fetch_text(fetchurl)
+                    content = self._fetch_text(fetchurl)
                 except Exception as e:
                     tb = traceback.format_exception(type(e), e, e.__traceback__)
                     _logger.warning("Could not load extension schema %s: %s", fetchurl, str(e))
@@ -340,25 +515,29 @@ class Loader:
 
         for s, _, _ in self.graph.triples((None, None, None)):
             self.idx[str(s)] = None
+        self._update_field_roles()
 
     def add_context(self, newcontext: ContextType) -> None:
         if bool(self.vocab):
             raise ValidationException("Refreshing context that already has stuff in it")
 
+        if self.shared_context:
+            self.ctx = dict(self.ctx)
+            self._own_context()
         self.url_fields.add("$schemas")
-        self.scoped_ref_fields.clear()
-        self.vocab_fields.clear()
-        self.identifiers.clear()
-        self.identity_links.clear()
+        self.scoped_ref_fields = {}
+        self.vocab_fields = set()
+        self.identifiers = []
+        self.identity_links = set()
         self.standalone = set()
-        self.nolinkcheck.clear()
-        self.idmap.clear()
-        self.mapPredicate.clear()
+        self.nolinkcheck = set()
+        self.idmap = {}
+        self.mapPredicate = {}
         self.vocab.clear()
-        self.rvocab.clear()
-        self.type_dsl_fields.clear()
-        self.secondaryFile_dsl_fields.clear()
-        self.subscopes.clear()
+        self.rvocab = {}
+        self.type_dsl_fields = set()
+        self.secondaryFile_dsl_fields = set()
+        self.subscopes = {}
 
         self.ctx.update(_copy_dict_without_key(newcontext, "@context"))
 
@@ -405,10 +584,15 @@ class Loader:
             elif isinstance(value, str):
                 self.vocab[key] = value
 
+        # the expansions cached so far are from the old vocabulary
+        self.expand_url_cache = {}
         for k, v in self.vocab.items():
             self.rvocab[self.expand_url(v, "", scoped_id=False)] = k
 
         self.identifiers.sort()
+        self._update_field_roles()
+        self.context_state = _ContextState(self)
+        self.shared_context = True
 
         _logger.debug("identifiers is %s", self.identifiers)
         _logger.debug("identity_links is %s", self.identity_links)
@@ -416,6 +600,70 @@ class Loader:
         _logger.debug("vocab_fields is %s", self.vocab_fields)
         _logger.debug("vocab is %s", self.vocab)
 
+    def _share_context(self, parent: "Loader") -> None:
+        """
+        Use the context of the parent Loader, as its add_context left it.
+
+        The namespaces and schemas the parent added since are not part of
+        it, except for the fields and foreign properties that the schemas
+        added, as with a new Loader made from the parent's ``url_fields`` and
+        ``foreign_properties``.
+        """
+        state: Final = parent.context_state
+        if state is None:
+            raise ValidationException("The parent Loader has no context yet")
+        self.ctx = state.ctx
+        self.url_fields = state.url_fields
+        self.foreign_properties = state.foreign_properties
+        self.scoped_ref_fields = state.scoped_ref_fields
+        self.vocab_fields = state.vocab_fields
+        self.identifiers = state.identifiers
+        self.identity_links = state.identity_links
+        self.standalone = state.standalone
+        self.nolinkcheck = state.nolinkcheck
+        self.vocab = state.vocab
+        self.rvocab = state.rvocab
+        self.idmap = state.idmap
+        self.mapPredicate = state.mapPredicate
+        self.type_dsl_fields = state.type_dsl_fields
+        self.secondaryFile_dsl_fields = state.secondaryFile_dsl_fields
+        self.subscopes = state.subscopes
+        self.field_roles = state.field_roles
+        self.expand_url_cache = state.expand_url_cache
+        self.context_state = state
+        self.shared_context = True
+        if parent.foreign_properties != state.foreign_properties:
+            self.foreign_properties = set(parent.foreign_properties)
+        if parent.url_fields != state.url_fields:
+            self.url_fields = set(parent.url_fields)
+            self._update_field_roles()
+
+    def _own_context(self) -> None:
+        """Copy the parts of a shared context that add_namespaces and add_schemas change."""
+        if self.shared_context:
+            self.vocab = dict(self.vocab)
+            self.url_fields = set(self.url_fields)
+            self.foreign_properties = set(self.foreign_properties)
+            self.shared_context = False
+
+    def _update_field_roles(self) -> None:
+        roles: Final[dict[str, int]] = {}
+        for fields, role in (
+            (self.url_fields, _URL_FIELD),
+            (self.vocab_fields, _VOCAB_FIELD),
+            (self.scoped_ref_fields, _SCOPED_REF),
+            (self.idmap, _IDMAP_FIELD),
+            (self.type_dsl_fields, _DSL_FIELD),
+            (self.secondaryFile_dsl_fields, _DSL_FIELD),
+            (self.identifiers, _IDENTIFIER),
+            (self.identity_links, _IDENTITY_LINK),
+            (self.subscopes, _SUBSCOPE),
+            (self.vocab, _VOCAB_TERM),
+        ):
+            for field in fields:
+                roles[field] = roles.get(field, 0) | role
+        self.field_roles = roles
+
     def resolve_ref(
         self,
         ref: ResolveType,
@@ -423,6 +671,29 @@ class Loader:
         checklinks: bool = True,
         strict_foreign_properties: bool = False,
         content_types: list[str] | None = None,  # Expected content-types
+    ) -> ResolvedRefType:
+        if self.async_fetcher is None:
+            return self._resolve_ref(
+                ref, base_url, checklinks, strict_foreign_properties, content_types
+            )
+        # the fetches started while resolving this reference that it did not use
+        # (like the targets of ``run``) are dropped, so they do not pile up
+        pending: Final = set(self.prefetched)
+        try:
+            return self._resolve_ref(
+                ref, base_url, checklinks, strict_foreign_properties, content_types
+            )
+        finally:
+            for url in [url for url in self.prefetched if url not in pending]:
+                self.prefetched.pop(url).cancel()
+
+    def _resolve_ref(
+        self,
+        ref: ResolveType,
+        base_url: str | None,
+        checklinks: bool,
+        strict_foreign_properties: bool,
+        content_types: list[str] | None,
     ) -> ResolvedRefType:
         lref = ref
         obj: CommentedMap | None = None
@@ -483,6 +754,10 @@ class Loader:
             lref = lref.replace("\\", "/")
 
         url = self.expand_url(lref, base_url, scoped_id=(obj is not None))
+        if imp or inc or mixin:
+            self.imported_by.setdefault(urllib.parse.urldefrag(url)[0], set()).add(
+                urllib.parse.urldefrag(base_url)[0]
+            )
         # Has this reference been loaded already?
         if url in self.idx and (not mixin):
             resolved_obj = self.idx[url]
@@ -518,7 +793,9 @@ class Loader:
         if inc:
             # Make a note in the index that this was an included string
             self.idx["include:" + url] = url
-            return self.fetch_text(url), CommentedMap()
+            included: Final = self._fetch_text(url)
+            self._record_source(url, included)
+            return included, CommentedMap()
 
         doc = None
         if isinstance(obj, MutableMapping):
@@ -581,54 +858,135 @@ class Loader:
         else:
             return resolved_obj, metadata
 
+    def imported_sources(self, urls: Iterable[str]) -> dict[str, str]:
+        """Return the checksums of the documents and of those they import, directly or not."""
+        imports: Final[dict[str, set[str]]] = {}
+        for imported, importers in self.imported_by.items():
+            for importer in importers:
+                imports.setdefault(importer, set()).add(imported)
+        sources: Final[dict[str, str]] = {}
+        seen: Final[set[str]] = set()
+        todo: Final = [urllib.parse.urldefrag(url)[0] for url in urls]
+        while todo:
+            url = todo.pop()
+            if url not in seen:
+                seen.add(url)
+                if url in self.source_checksums:
+                    sources[url] = self.source_checksums[url]
+                todo.extend(imports.get(url, ()))
+        return sources
+
+    def forget(self, changed: Iterable[str]) -> set[str]:
+        """
+        Drop what was loaded from the changed documents and their importers.
+
+        Every document that ``$import``, ``$include`` or ``$mixin`` one of the
+        changed documents, directly or not, embeds its old content, so it is
+        dropped too. The index entries of a document are the ones whose key
+        is in the document or whose value was parsed from it.
+
+        The fetches started by :py:meth:`prefetch` are dropped as well.
+
+        :returns: The URLs of the dropped documents.
+        """
+        affected: Final[set[str]] = set()
+        todo: Final = [urllib.parse.urldefrag(url)[0] for url in changed]
+        while todo:
+            url = todo.pop()
+            if url not in affected:
+                affected.add(url)
+                todo.extend(self.imported_by.get(url, ()))
+        # the file names that add_lc_filename stored in the parsed documents
+        filenames: Final = {relname(url) for url in affected}
+        for key, value in list(self.idx.items()):
+            source = urllib.parse.urldefrag(
+                key.partition(":")[2] if key.startswith(("import:", "include:")) else key
+            )[0]
+            if source in affected or (
+                isinstance(value, (CommentedMap, CommentedSeq))
+                and getattr(value.lc, "filename", None) in filenames
+            ):
+                del self.idx[key]
+        for url in affected:
+            self.source_checksums.pop(url, None)
+            self.source_sizes.pop(url, None)
+        for importers in self.imported_by.values():
+            importers.difference_update(affected)
+        for future in self.prefetched.values():
+            future.cancel()
+        self.prefetched.clear()
+        return affected
+
+    def resolve_changed(
+        self,
+        ref: str,
+        changed: Iterable[str],
+        base_url: str | None = None,
+        checklinks: bool = True,
+        strict_foreign_properties: bool = False,
+        content_types: list[str] | None = None,
+    ) -> ResolvedRefType:
+        """
+        Resolve a document again after some of the documents it was loaded from changed.
+
+        Only the documents that :py:meth:`forget` drops are fetched and resolved
+        again, and links are only validated if the document itself was dropped.
+        """
+        self.forget(changed)
+        return self.resolve_ref(
+            ref,
+            base_url=base_url,
+            checklinks=checklinks,
+            strict_foreign_properties=strict_foreign_properties,
+            content_types=content_types,
+        )
+
     def _resolve_idmap(
         self,
         document: CommentedMap,
         loader: "Loader",
+        fields: list[str],
     ) -> None:
         # Convert fields with mapSubject into lists
         # use mapPredicate if the mapped value isn't a dict.
-        for idmapField in loader.idmap:
-            if idmapField in document:
-                idmapFieldValue = document[idmapField]
-                if (
-                    isinstance(idmapFieldValue, MutableMapping)
-                    and "$import" not in idmapFieldValue
-                    and "$include" not in idmapFieldValue
-                ):
-                    ls = CommentedSeq()
-                    for k in sorted(idmapFieldValue.keys()):
-                        val = idmapFieldValue[k]
-                        v: CommentedMap | None = None
-                        if not isinstance(val, CommentedMap):
-                            if idmapField in loader.mapPredicate:
-                                v = CommentedMap(((loader.mapPredicate[idmapField], val),))
-                                v.lc.add_kv_line_col(
-                                    loader.mapPredicate[idmapField],
-                                    document[idmapField].lc.data[k],
-                                )
-                                v.lc.filename = document.lc.filename
-                            else:
-                                raise ValidationException(
-                                    f"mapSubject {k!r} value {v!r} is not a dict "
-                                    "and does not have a mapPredicate.",
-                                    SourceLine(document, idmapField),
-                                )
+        for idmapField in fields:
+            idmapFieldValue = document[idmapField]
+            if (
+                isinstance(idmapFieldValue, MutableMapping)
+                and "$import" not in idmapFieldValue
+                and "$include" not in idmapFieldValue
+            ):
+                ls = CommentedSeq()
+                for k in sorted(idmapFieldValue.keys()):
+                    val = idmapFieldValue[k]
+                    v: CommentedMap | None = None
+                    if not isinstance(val, CommentedMap):
+                        if idmapField in loader.mapPredicate:
+                            v = CommentedMap(((loader.mapPredicate[idmapField], val),))
+                            v.lc.add_kv_line_col(
+                                loader.mapPredicate[idmapField],
+                                document[idmapField].lc.data[k],
+                            )
+                            v.lc.filename = document.lc.filename
                         else:
-                            v = val
+                            raise ValidationException(
+                                f"mapSubject {k!r} value {v!r} is not a dict "
+                                "and does not have a mapPredicate.",
+                                SourceLine(document, idmapField),
+                            )
+                    else:
+                        v = val
 
-                        v[loader.idmap[idmapField]] = k
-                        v.lc.add_kv_line_col(
-                            loader.idmap[idmapField], document[idmapField].lc.data[k]
-                        )
-                        v.lc.filename = document.lc.filename
+                    v[loader.idmap[idmapField]] = k
+                    v.lc.add_kv_line_col(loader.idmap[idmapField], document[idmapField].lc.data[k])
+                    v.lc.filename = document.lc.filename
 
-                        ls.lc.add_kv_line_col(len(ls), document[idmapField].lc.data[k])
+                    ls.lc.add_kv_line_col(len(ls), document[idmapField].lc.data[k])
 
-                        ls.lc.filename = document.lc.filename
-                        ls.append(v)
+                    ls.lc.filename = document.lc.filename
+                    ls.append(v)
 
-                    document[idmapField] = ls
+                document[idmapField] = ls
 
     def _type_dsl(
         self,
@@ -710,52 +1068,47 @@ class Loader:
         self,
         document: CommentedMap,
         loader: "Loader",
+        fields: list[str],
     ) -> None:
-        fields: Final = list(loader.type_dsl_fields)
-        fields.extend(loader.secondaryFile_dsl_fields)
-
         for d in fields:
-            if d in document:
-                datum2 = datum = document[d]
-                if isinstance(datum, str):
-                    datum2 = self._apply_dsl(
-                        datum,
-                        d,
-                        loader,
-                        document.lc.data[d] if document.lc.data else document.lc,
-                        getattr(document.lc, "filename", ""),
-                    )
-                elif isinstance(datum, CommentedSeq):
-                    datum2 = CommentedSeq()
-                    for n, t in enumerate(datum):
-                        if datum.lc and datum.lc.data:
-                            datum2.lc.add_kv_line_col(len(datum2), datum.lc.data[n])
-                            datum2.append(
-                                self._apply_dsl(
-                                    t, d, loader, datum.lc.data[n], document.lc.filename
-                                )
-                            )
-                        else:
-                            datum2.append(self._apply_dsl(t, d, loader, LineCol(), ""))
-                if isinstance(datum2, CommentedSeq):
-                    datum3 = CommentedSeq()
-                    seen: list[str] = []
-                    for i, item in enumerate(datum2):
-                        if isinstance(item, CommentedSeq):
-                            for j, v in enumerate(item):
-                                if v not in seen:
-                                    datum3.lc.add_kv_line_col(len(datum3), item.lc.data[j])
-                                    datum3.append(v)
-                                    seen.append(v)
-                        else:
-                            if item not in seen:
-                                if datum2.lc and datum2.lc.data:
-                                    datum3.lc.add_kv_line_col(len(datum3), datum2.lc.data[i])
-                                datum3.append(item)
-                                seen.append(item)
-                    document[d] = datum3
-                else:
-                    document[d] = datum2
+            datum2 = datum = document[d]
+            if isinstance(datum, str):
+                datum2 = self._apply_dsl(
+                    datum,
+                    d,
+                    loader,
+                    document.lc.data[d] if document.lc.data else document.lc,
+                    getattr(document.lc, "filename", ""),
+                )
+            elif isinstance(datum, CommentedSeq):
+                datum2 = CommentedSeq()
+                for n, t in enumerate(datum):
+                    if datum.lc and datum.lc.data:
+                        datum2.lc.add_kv_line_col(len(datum2), datum.lc.data[n])
+                        datum2.append(
+                            self._apply_dsl(t, d, loader, datum.lc.data[n], document.lc.filename)
+                        )
+                    else:
+                        datum2.append(self._apply_dsl(t, d, loader, LineCol(), ""))
+            if isinstance(datum2, CommentedSeq):
+                datum3 = CommentedSeq()
+                seen: list[str] = []
+                for i, item in enumerate(datum2):
+                    if isinstance(item, CommentedSeq):
+                        for j, v in enumerate(item):
+                            if v not in seen:
+                                datum3.lc.add_kv_line_col(len(datum3), item.lc.data[j])
+                                datum3.append(v)
+                                seen.append(v)
+                    else:
+                        if item not in seen:
+                            if datum2.lc and datum2.lc.data:
+                                datum3.lc.add_kv_line_col(len(datum3), datum2.lc.data[i])
+                            datum3.append(item)
+                            seen.append(item)
+                document[d] = datum3
+            else:
+                document[d] = datum2
 
     def _resolve_identifier(self, document: CommentedMap, loader: "Loader", base_url: str) -> str:
         # Expand identifier field (usually 'id') to resolve scope
@@ -781,11 +1134,12 @@ class Loader:
         document: dict[str, str | MutableSequence[str | CommentedMap]],
         loader: "Loader",
         base_url: str,
+        fields: list[str],
     ) -> None:
         # Resolve scope for identity fields (fields where the value is the
         # identity of a standalone node, such as enum symbols)
-        for identifier in loader.identity_links:
-            if identifier in document and isinstance(document[identifier], MutableSequence):
+        for identifier in fields:
+            if isinstance(document[identifier], MutableSequence):
                 for n, v in enumerate(document[identifier]):
                     if isinstance(v, str):
                         document[identifier][n] = loader.expand_url(  # type: ignore
@@ -796,8 +1150,9 @@ class Loader:
 
     def _normalize_fields(self, document: CommentedMap, loader: "Loader") -> None:
         # Normalize fields which are prefixed or full URIn to vocabulary terms
+        roles: Final = loader.field_roles
         for d in list(document.keys()):
-            if isinstance(d, str):
+            if isinstance(d, str) and not roles.get(d, 0) & _VOCAB_TERM:
                 d2 = loader.expand_url(d, "", scoped_id=False, vocab_term=True)
                 if d != d2:
                     document[d2] = document[d]
@@ -809,29 +1164,31 @@ class Loader:
         document: dict[str, str | MutableSequence[str | CommentedMap]],
         loader: "Loader",
         base_url: str,
+        fields: list[tuple[str, int]],
     ) -> None:
         # Resolve remaining URLs based on document base
-        for d in loader.url_fields:
-            if d in document:
-                datum = document[d]
-                if isinstance(datum, str):
-                    document[d] = loader.expand_url(
-                        datum,
-                        base_url,
-                        scoped_id=False,
-                        vocab_term=(d in loader.vocab_fields),
-                        scoped_ref=loader.scoped_ref_fields.get(d),
-                    )
-                elif isinstance(datum, MutableSequence):
-                    for i, url in enumerate(datum):
-                        if isinstance(url, str):
-                            datum[i] = loader.expand_url(
-                                url,
-                                base_url,
-                                scoped_id=False,
-                                vocab_term=(d in loader.vocab_fields),
-                                scoped_ref=loader.scoped_ref_fields.get(d),
-                            )
+        for d, role in fields:
+            datum = document[d]
+            vocab_term = bool(role & _VOCAB_FIELD)
+            scoped_ref = loader.scoped_ref_fields[d] if role & _SCOPED_REF else None
+            if isinstance(datum, str):
+                document[d] = loader.expand_url(
+                    datum,
+                    base_url,
+                    scoped_id=False,
+                    vocab_term=vocab_term,
+                    scoped_ref=scoped_ref,
+                )
+            elif isinstance(datum, MutableSequence):
+                for i, url in enumerate(datum):
+                    if isinstance(url, str):
+                        datum[i] = loader.expand_url(
+                            url,
+                            base_url,
+                            scoped_id=False,
+                            vocab_term=vocab_term,
+                            scoped_ref=scoped_ref,
+                        )
 
     def resolve_all(
         self,
@@ -841,6 +1198,51 @@ class Loader:
         checklinks: bool = True,
         strict_foreign_properties: bool = False,
     ) -> ResolvedRefType:
+        # Walk the document with an explicit stack of the documents being
+        # resolved, so deeply nested documents do not hit the recursion limit.
+        # Each one yields its values to resolve, and gets them back resolved
+        # or gets the error raised by resolving them.
+        stack: Final = [
+            self._resolve_all(document, base_url, file_base, checklinks, strict_foreign_properties)
+        ]
+        resolved: ResolvedRefType | None = None
+        error: Exception | None = None
+        while True:
+            walker = stack[-1]
+            try:
+                if error is not None:
+                    thrown, error = error, None
+                    request = walker.throw(thrown)
+                elif resolved is not None:
+                    request = walker.send(resolved)
+                else:
+                    request = next(walker)
+            except StopIteration as stop:
+                stack.pop()
+                if not stack:
+                    return cast(ResolvedRefType, stop.value)
+                resolved = stop.value
+                continue
+            except Exception as e:
+                stack.pop()
+                if not stack:
+                    raise
+                error = e
+                resolved = None
+                continue
+            loader, val, val_base_url, val_file_base = request
+            stack.append(loader._resolve_all(val, val_base_url, val_file_base, False, False))
+            resolved = None
+
+    def _resolve_all(
+        self,
+        document: ResolveType,
+        base_url: str,
+        file_base: str | None,
+        checklinks: bool,
+        strict_foreign_properties: bool,
+    ) -> Generator[tuple["Loader", Any, str, str], ResolvedRefType, ResolvedRefType]:
+        """Resolve a document for :py:meth:`resolve_all`, yielding the values to resolve."""
         loader = self
         metadata = CommentedMap()
         if file_base is None:
@@ -924,20 +1326,44 @@ class Loader:
 
         if isinstance(document, CommentedMap):
             self._normalize_fields(document, loader)
-            self._resolve_idmap(document, loader)
-            self._resolve_dsl(document, loader)
-            base_url = self._resolve_identifier(document, loader, base_url)
-            self._resolve_identity(document, loader, base_url)
-            self._resolve_uris(document, loader, base_url)
+            # Look up the roles of the fields once, then apply each transformation
+            # to the fields that play its role.
+            roles: Final = loader.field_roles
+            idmap_fields: Final[list[str]] = []
+            dsl_fields: Final[list[str]] = []
+            identity_fields: Final[list[str]] = []
+            url_fields: Final[list[tuple[str, int]]] = []
+            found = 0
+            for key in document:
+                role = roles.get(key, 0)
+                if role:
+                    found |= role
+                    if role & _IDMAP_FIELD:
+                        idmap_fields.append(key)
+                    if role & _DSL_FIELD:
+                        dsl_fields.append(key)
+                    if role & _IDENTITY_LINK:
+                        identity_fields.append(key)
+                    if role & _URL_FIELD:
+                        url_fields.append((key, role))
+            if idmap_fields:
+                self._resolve_idmap(document, loader, idmap_fields)
+            if dsl_fields:
+                self._resolve_dsl(document, loader, dsl_fields)
+            if found & _IDENTIFIER:
+                base_url = self._resolve_identifier(document, loader, base_url)
+            if identity_fields:
+                self._resolve_identity(document, loader, base_url, identity_fields)
+            if url_fields:
+                self._resolve_uris(document, loader, base_url, url_fields)
 
             try:
                 for key, val in document.items():
                     subscope: str = ""
-                    if key in loader.subscopes:
+                    if roles.get(key, 0) & _SUBSCOPE:
                         subscope = "/" + loader.subscopes[key]
-                    document[key], _ = loader.resolve_all(
-                        val, base_url + subscope, file_base=file_base, checklinks=False
-                    )
+                    if isinstance(val, (list, dict)):
+                        document[key], _ = yield loader, val, base_url + subscope, file_base
             except ValidationException as v:
                 _logger.warning("loader is %s", id(loader), exc_info=True)
                 raise ValidationException(
@@ -975,9 +1401,8 @@ class Loader:
                             document[i] = l
                             i += 1
                     else:
-                        document[i], _ = loader.resolve_all(
-                            val, base_url, file_base=file_base, checklinks=False
-                        )
+                        if isinstance(val, (list, dict)):
+                            document[i], _ = yield loader, val, base_url, file_base
                         i += 1
             except ValidationException as v:
                 _logger.warning("failed", exc_info=True)
@@ -989,12 +1414,16 @@ class Loader:
 
         if checklinks:
             all_doc_ids: dict[str, str] = {}
-            loader.validate_links(
-                document,
-                "",
-                all_doc_ids,
-                strict_foreign_properties=strict_foreign_properties,
-            )
+            loader.precheck_links(document)
+            try:
+                loader.validate_links(
+                    document,
+                    "",
+                    all_doc_ids,
+                    strict_foreign_properties=strict_foreign_properties,
+                )
+            finally:
+                loader.prechecked_links.clear()
 
         return document, metadata
 
@@ -1007,19 +1436,39 @@ class Loader:
         if url in self.idx:
             return self.idx[url]
         try:
-            text: Final = self.fetch_text(url, content_types=content_types)
-            textIO: Final = StringIO(text)
-            textIO.name = str(url)
-            yaml: Final = yaml_no_ts()
-            attachments: Final = yaml.load_all(textIO)
-            result: Final = cast(CommentedSeq | CommentedMap, next(attachments))
-
-            if self.allow_attachments is not None and self.allow_attachments(result):
-                i = 1
-                for a in attachments:
-                    self.idx[f"{url}#attachment-{i}"] = a
-                    i += 1
+            text: Final = self._fetch_text(url, content_types=content_types)
+            checksum: Final = self._record_source(url, text)
+            # Documents with attachments are parsed in full every time
+            single: Final = self.allow_attachments is None
+            cacheable: Final = single and parsed_documents.max_bytes > 0
+            result = parsed_documents.get(checksum) if cacheable else None
+            if result is None and single and self.fast_parse:
+                try:
+                    parsed = yaml_fast_load(text)
+                    if isinstance(parsed, (CommentedMap, CommentedSeq)):
+                        result = parsed
+                except Exception as e:
+                    _logger.debug("Parsing %s again with ruamel.yaml: %s", url, e)
+            if result is None:
+                textIO: Final = StringIO(text)
+                textIO.name = str(url)
+                yaml: Final = pooled_yaml_no_ts()
+                attachments: Final = yaml.load_all(textIO)
+                result = cast(CommentedSeq | CommentedMap, next(attachments))
+
+                if self.allow_attachments is not None and self.allow_attachments(result):
+                    i = 1
+                    for a in attachments:
+                        self.idx[f"{url}#attachment-{i}"] = a
+                        i += 1
+                # Hand the shared loader back now, not when the generator is collected
+                attachments.close()
+                if cacheable and isinstance(result, (CommentedMap, CommentedSeq)):
+                    parsed_documents.put(checksum, result, len(text))
+                    result = cast(CommentedSeq | CommentedMap, copy_yaml_tree(result))
             add_lc_filename(result, url)
+            if self.async_fetcher is not None:
+                self.prefetch(result, url)
         except MarkedYAMLError as e:
             raise to_validation_exception(e) from e
         if isinstance(result, CommentedMap) and inject_ids and bool(self.identifiers):
@@ -1033,10 +1482,89 @@ class Loader:
         self.idx[url] = result
         return result
 
+    def _fetch_text(self, url: str, content_types: list[str] | None = None) -> str:
+        future: Final = self.prefetched.pop(url, None)
+        if future is None or url in self.cache:
+            if future is not None:
+                future.cancel()
+            return self.fetch_text(url, content_types=content_types)
+        return future.result()
+
+    def prefetch(self, document: ResolveType, base_url: str) -> None:
+        """
+        Start fetching the documents referenced by a freshly parsed document.
+
+        The targets of ``$import``, ``$include`` and ``$mixin``, of
+        ``$schemas`` and of string values of subscope fields (like ``run``)
+        are handed to :py:attr:`async_fetcher`, so they download in parallel
+        while resolution proceeds. :py:meth:`fetch` then picks up the text
+        from :py:attr:`prefetched`; a failed fetch raises there, as it
+        would have without the prefetch. Documents in :py:attr:`cache` are
+        read from there instead.
+        """
+        if self.async_fetcher is None:
+            return
+        refs: Final[list[tuple[str, bool]]] = []
+        todo: Final[list[Any]] = [document]
+        while todo:
+            d = todo.pop()
+            if isinstance(d, MutableMapping):
+                for directive in ("$import", "$include", "$mixin"):
+                    ref = d.get(directive)
+                    if isinstance(ref, str):
+                        refs.append((ref, directive != "$include"))
+                for key, value in d.items():
+                    if key in self.subscopes and isinstance(value, str):
+                        refs.append((value, True))
+                    elif isinstance(value, (MutableMapping, MutableSequence)):
+                        todo.append(value)
+            elif isinstance(d, MutableSequence):
+                todo.extend(d)
+        schemas: Final[list[str]] = []
+        if isinstance(document, MutableMapping) and not self.skip_schemas:
+            schemas.extend(s for s in aslist(document.get("$schemas", [])) if isinstance(s, str))
+        targets: Final[list[str]] = []
+        try:
+            for ref, document_ref in refs:
+                url = self.expand_url(ref, base_url)
+                targets.append(urllib.parse.urldefrag(url)[0] if document_ref else url)
+            for sch in schemas:
+                targets.append(self.fetcher.urljoin(base_url, sch))
+        except ValidationException:
+            # reported when resolution reaches the reference
+            pass
+        for url in targets:
+            if (
+                url in self.prefetched
+                or url in self.cache
+                or url in self.idx
+                or url in self.source_checksums
+                or urllib.parse.urlsplit(url).scheme not in self.fetcher.supported_schemes()
+            ):
+                continue
+            self.prefetched[url] = self.async_fetcher.fetch_text_async(url)
+
+    def _record_source(self, url: str, text: str) -> str:
+        encoded: Final = text.encode("utf-8")
+        checksum: Final = hashlib.sha256(encoded).hexdigest()
+        self.source_checksums[url] = checksum
+        self.source_sizes[url] = len(encoded)
+        return checksum
+
     def validate_scoped(self, field: str, link: str, docid: str) -> str:
+        n = self.scoped_ref_fields[field]
+        if isinstance(self.idx, NormDict) and self.idx.normalize is _url_norm and link:
+            # The normalized document URL is what urlunsplit() gives without a fragment
+            document, _, fragment = docid.partition("#")
+            document = self.idx.normalize_key(document)
+            segments: Final = fragment.split("/")
+            for end in range(max(len(segments) - n, 0), -1, -1):
+                prefix = "/".join(segments[:end]) + "/" if end > 0 else ""
+                target = self.idx.scoped.get((document, prefix, link))
+                if target is not None and target in self.idx:
+                    return f"{document}#{prefix}{link}"
         split: Final = urllib.parse.urlsplit(docid)
         sp = split.fragment.split("/")
-        n = self.scoped_ref_fields[field]
         while n > 0 and len(sp) > 0:
             sp.pop()
             n -= 1
@@ -1075,14 +1603,14 @@ class Loader:
                 if link not in self.vocab and link not in self.idx and link not in self.rvocab:
                     if field in self.scoped_ref_fields:
                         return self.validate_scoped(field, link, docid)
-                    elif not self.check_exists(link):
+                    elif not self._link_exists(link):
                         raise ValidationException(
                             f"Field {field!r} contains undefined reference to {link!r}"
                         )
             elif link not in self.idx and link not in self.rvocab:
                 if field in self.scoped_ref_fields:
                     return self.validate_scoped(field, link, docid)
-                elif not self.check_exists(link):
+                elif not self._link_exists(link):
                     raise ValidationException(
                         f"Field {field!r} contains undefined reference to {link!r}"
                     )
@@ -1105,6 +1633,73 @@ class Loader:
             )
         return link
 
+    def _link_exists(self, link: str) -> bool:
+        exists: Final = self.prechecked_links.get(link)
+        if exists is None:
+            return self.check_exists(link)
+        return exists
+
+    def _collect_link(self, field: str, link: Any, links: set[str]) -> None:
+        if isinstance(link, str):
+            if link in self.idx or link in self.rvocab or link in self.cache:
+                return
+            if field in self.vocab_fields and link in self.vocab:
+                return
+            if urllib.parse.urlsplit(link).scheme in ("http", "https"):
+                links.add(link)
+        elif isinstance(link, CommentedSeq):
+            for item in link:
+                self._collect_link(field, item, links)
+
+    def _collect_links(self, document: Any, links: set[str]) -> None:
+        """Collect the remote links that validate_links would pass to check_exists."""
+        todo: Final[list[Any]] = [document]
+        while todo:
+            d = todo.pop()
+            if isinstance(d, MutableSequence):
+                todo.extend(d)
+            elif isinstance(d, MutableMapping):
+                for field in self.url_fields:
+                    if (
+                        field in d
+                        and field not in self.identity_links
+                        and field not in self.nolinkcheck
+                        and field not in self.scoped_ref_fields
+                    ):
+                        self._collect_link(field, d[field], links)
+                todo.extend(d.values())
+
+    def precheck_links(self, document: ResolveType) -> None:
+        """
+        Check the existence of the remote links in a document concurrently.
+
+        Only http(s) links are checked here, the others being cheap to check;
+        no threads are started for fewer than two of them. The results are
+        kept in :py:attr:`prechecked_links` for :py:meth:`validate_links`,
+        which reports the missing ones. At most :py:attr:`link_check_workers`
+        links are checked at a time, from as many threads; the default of 1
+        checks nothing here, as fetchers need not be thread-safe. A link whose
+        check fails with an exception is left to :py:meth:`validate_links` to
+        check, and report, again.
+        """
+        links: Final[set[str]] = set()
+        self._collect_links(document, links)
+        links.difference_update(self.prechecked_links)
+        if self.link_check_workers < 2 or len(links) < 2:
+            return
+
+        def check(link: str) -> bool | None:
+            try:
+                return self.check_exists(link)
+            except Exception:
+                return None
+
+        ordered: Final = sorted(links)
+        with ThreadPoolExecutor(max_workers=self.link_check_workers) as executor:
+            for link, exists in zip(ordered, executor.map(check, ordered)):
+                if exists is not None:
+                    self.prechecked_links[link] = exists
+
     def getid(self, d: Any) -> str | None:
         """Use our identifiers to extract the first match from the document."""
         if isinstance(d, MutableMapping):
@@ -1122,82 +1717,128 @@ class Loader:
         all_doc_ids: dict[str, str],
         strict_foreign_properties: bool = False,
     ) -> None:
-        docid: Final = self.getid(document) or base_url
-
-        errors: Final[list[SchemaSaladException]] = []
-        iterator: Any = None
-        if isinstance(document, MutableSequence):
-            iterator = enumerate(document)
-        elif isinstance(document, MutableMapping):
-            for d in self.url_fields:
-                try:
-                    if d in document and d not in self.identity_links:
-                        document[d] = self.validate_link(d, document[d], docid, all_doc_ids)
-                except SchemaSaladException as v:
-                    v = v.with_sourceline(SourceLine(document, d, str))
-                    if d == "$schemas" or (
-                        d in self.foreign_properties and not strict_foreign_properties
-                    ):
-                        _logger.warning(v.as_warning())
-                    else:
-                        errors.append(v)
-            # TODO: Validator should local scope only in which
-            # duplicated keys are prohibited.
-            # See also https://github.com/common-workflow-language/common-workflow-language/issues/734  # noqa: B950
-            # In the future, it should raise
-            # ValidationException instead of _logger.warn
-            try:
-                for identifier in self.identifiers:  # validate that each id is defined uniquely
-                    if identifier in document:
-                        sl = SourceLine(document, identifier, str)
-                        if (
-                            document[identifier] in all_doc_ids
-                            and sl.makeLead() != all_doc_ids[document[identifier]]
-                        ):
-                            _logger.warning(
-                                "%s object %s %r previously defined",
-                                all_doc_ids[document[identifier]],
-                                identifier,
-                                relname(document[identifier]),
-                            )
-                        else:
-                            all_doc_ids[document[identifier]] = sl.makeLead()
-                            break
-            except ValidationException as v:
-                errors.append(v.with_sourceline(sl))
-
-            iterator = list(document.items())
-        else:
+        # Walk the document with an explicit stack, so deeply nested documents
+        # neither hit the recursion limit nor pay for a call per level.
+        root: Final = self._links_node(
+            document, base_url, all_doc_ids, strict_foreign_properties, None, None
+        )
+        if root is None:
             return
+        stack: Final = [root]
+        while stack:
+            node = stack[-1]
+            child = next(node.children, None)
+            if child is not None:
+                key, val = child
+                found = self._links_node(
+                    val, node.docid, all_doc_ids, strict_foreign_properties, key, val
+                )
+                if found is not None:
+                    stack.append(found)
+                continue
+            stack.pop()
+            if not node.errors:
+                continue
+            if len(node.errors) > 1:
+                exc: SchemaSaladException = ValidationException("", None, node.errors)
+            else:
+                exc = node.errors[0]
+            if not stack or not isinstance(exc, ValidationException):
+                raise exc
+            parent = stack[-1]
+            key = node.key
+            if key in self.nolinkcheck or (isinstance(key, str) and ":" in key):
+                _logger.warning(exc.as_warning())
+            else:
+                sl = SourceLine(parent.document, key, str)
+                docid2 = self.getid(node.value)
+                if docid2 is not None:
+                    parent.errors.append(
+                        ValidationException(f"checking object {relname(docid2)!r}", sl, [exc])
+                    )
+                elif isinstance(key, str):
+                    parent.errors.append(ValidationException(f"checking field {key!r}", sl, [exc]))
+                else:
+                    parent.errors.append(ValidationException("checking item", sl, [exc]))
 
-        for key, val in iterator:
-            sl = SourceLine(document, key, str)
+    def _links_node(
+        self,
+        document: Any,
+        base_url: str,
+        all_doc_ids: dict[str, str],
+        strict_foreign_properties: bool,
+        key: Any,
+        value: Any,
+    ) -> Optional["_LinksNode"]:
+        """Check the links of a document itself, returning it for validate_links to descend."""
+        if isinstance(document, MutableSequence):
+            return _LinksNode(
+                document, self.getid(document) or base_url, enumerate(document), key, value
+            )
+        if not isinstance(document, MutableMapping):
+            return None
+        docid: Final = self.getid(document) or base_url
+        errors: Final[list[SchemaSaladException]] = []
+        for d in self.url_fields:
             try:
-                self.validate_links(
-                    val,
-                    docid,
-                    all_doc_ids,
-                    strict_foreign_properties=strict_foreign_properties,
-                )
-            except ValidationException as v:
-                if key in self.nolinkcheck or (isinstance(key, str) and ":" in key):
+                if d in document and d not in self.identity_links:
+                    document[d] = self.validate_link(d, document[d], docid, all_doc_ids)
+            except SchemaSaladException as v:
+                v = v.with_sourceline(SourceLine(document, d, str))
+                if d == "$schemas" or (
+                    d in self.foreign_properties and not strict_foreign_properties
+                ):
                     _logger.warning(v.as_warning())
                 else:
-                    docid2 = self.getid(val)
-                    if docid2 is not None:
-                        errors.append(
-                            ValidationException(f"checking object {relname(docid2)!r}", sl, [v])
+                    errors.append(v)
+        # TODO: Validator should local scope only in which
+        # duplicated keys are prohibited.
+        # See also https://github.com/common-workflow-language/common-workflow-language/issues/734  # noqa: B950
+        # In the future, it should raise
+        # ValidationException instead of _logger.warn
+        try:
+            for identifier in self.identifiers:  # validate that each id is defined uniquely
+                if identifier in document:
+                    sl = SourceLine(document, identifier, str)
+                    if (
+                        document[identifier] in all_doc_ids
+                        and sl.makeLead() != all_doc_ids[document[identifier]]
+                    ):
+                        _logger.warning(
+                            "%s object %s %r previously defined",
+                            all_doc_ids[document[identifier]],
+                            identifier,
+                            relname(document[identifier]),
                         )
                     else:
-                        if isinstance(key, str):
-                            errors.append(ValidationException(f"checking field {key!r}", sl, [v]))
-                        else:
-                            errors.append(ValidationException("checking item", sl, [v]))
-        if bool(errors):
-            if len(errors) > 1:
-                raise ValidationException("", None, errors)
-            raise errors[0]
-        return
+                        all_doc_ids[document[identifier]] = sl.makeLead()
+                        break
+        except ValidationException as v:
+            errors.append(v.with_sourceline(sl))
+
+        node: Final = _LinksNode(document, docid, iter(list(document.items())), key, value)
+        node.errors.extend(errors)
+        return node
+
+
+class _LinksNode:
+    """A document that validate_links is descending into."""
+
+    def __init__(
+        self,
+        document: MutableMapping[Any, Any] | MutableSequence[Any],
+        docid: str,
+        children: Iterator[tuple[Any, Any]],
+        key: Any,
+        value: Any,
+    ) -> None:
+        self.document: Final = document
+        self.docid: Final = docid
+        self.children: Final = children
+        # where the document is in its parent, for the error messages
+        self.key: Final = key
+        self.value: Final = value
+        self.errors: Final[list[SchemaSaladException]] = []
 
 
 def _copy_dict_without_key(
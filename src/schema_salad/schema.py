@@ -2,10 +2,16 @@
 
 import copy
 import hashlib
+import importlib.metadata
+import os
+import pickle  # nosec
+import sys
+import tempfile
+import zlib
 from collections.abc import Mapping, MutableMapping, MutableSequence
 from importlib.resources import files
 from typing import IO, Any, Final, TypeAlias, cast
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlsplit
 
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
@@ -14,19 +20,31 @@ from schema_salad.utils import (
     ResolveType,
     add_dictlist,
     aslist,
+    cache_dir,
     convert_to_dict,
     flatten,
     json_dumps,
-    yaml_no_ts,
+    pooled_yaml_no_ts,
+)
+from . import _logger, jsonld_context, ref_resolver, sourceline, validate
+from .avro import schema as avro_schema
+from .avro.schema import (
+    NamedSchema,
+    Names,
+    RecordSchema,
+    Schema,
+    SchemaParseException,
+    SubtypeCache,
+    is_subtype,
+    make_avsc_object,
 )
-from . import _logger, jsonld_context, ref_resolver, validate
-from .avro.schema import Names, SchemaParseException, is_subtype, make_avsc_object
 from .exceptions import (
     ClassValidationException,
+    SchemaException,
     SchemaSaladException,
     ValidationException,
 )
-from .ref_resolver import Loader
+from .ref_resolver import Loader, uri_file_path
 from .sourceline import SourceLine, add_lc_filename, relname
 
 SALAD_FILES: Final = (
@@ -195,7 +213,15 @@ def get_metaschema() -> tuple[Names, list[dict[str, str]], Loader]:
         files("schema_salad").joinpath("metaschema/metaschema.yml").read_text("UTF-8")
     )
 
-    yaml: Final = yaml_no_ts()
+    cache_file: Final = _metaschema_cache_file(loader.cache)
+    if (cached := _load_metaschema_cache(cache_file)) is not None:
+        cached_names, cached_doc, cached_idx = cached
+        for key, value in cached_idx.items():
+            loader.idx[key] = value
+        cached_metaschema = (cached_names, cached_doc, loader)
+        return cached_metaschema
+
+    yaml: Final = pooled_yaml_no_ts()
     j: Final = yaml.load(loader.cache["https://w3id.org/cwl/salad"])
     add_lc_filename(j, "metaschema.yml")
     j2: Final = loader.resolve_all(j, saladp)[0]
@@ -210,10 +236,113 @@ def get_metaschema() -> tuple[Names, list[dict[str, str]], Loader]:
         _logger.error("Metaschema error, avro was:\n%s", json_dumps(sch_obj, indent=4))
         raise
     validate_doc(sch_names, j2, loader, strict=True)
+    _save_metaschema_cache(cache_file, sch_names, j2, loader.idx)
     cached_metaschema = (sch_names, j2, loader)
     return cached_metaschema
 
 
+# Bump when the layout of the pickled schema classes changes, so that the
+# on-disk metaschema cache and compiled schemas of development builds are
+# not restored into objects that lack the new attributes.
+_PICKLE_FORMAT: Final = 3
+
+
+def _salad_version() -> str:
+    try:
+        return importlib.metadata.version("schema_salad")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+# The modules that build and pickle the metaschema.
+_fingerprint_files: list[str] = [
+    __file__,
+    avro_schema.__file__,
+    ref_resolver.__file__,
+    sourceline.__file__,
+    validate.__file__,
+]
+
+
+def _code_fingerprint() -> str:
+    """
+    Identify the code that builds and pickles the metaschema.
+
+    Use the size and modification time of its modules, as development builds
+    all share the same version number.
+    """
+    parts: Final[list[str]] = []
+    for module_file in _fingerprint_files:
+        try:
+            stat = os.stat(module_file)
+            parts.append(f"{module_file}\0{stat.st_size}\0{stat.st_mtime_ns}")
+        except (OSError, TypeError):
+            parts.append(str(module_file))
+    return "\0".join(parts)
+
+
+def _metaschema_cache_file(salad_cache: CacheType) -> str:
+    """
+    Compute the on-disk location of the compiled metaschema.
+
+    The file name is keyed on the schema-salad version and code, the Python
+    implementation and the content of every bundled metaschema file, so a
+    stale entry is never picked up after an upgrade or an edit.
+    """
+    checksum: Final = hashlib.sha256()
+    checksum.update(
+        f"{_salad_version()}\0{_PICKLE_FORMAT}\0{sys.implementation.cache_tag}\0".encode()
+    )
+    checksum.update(f"{_code_fingerprint()}\0".encode())
+    for url in sorted(salad_cache):
+        content = salad_cache[url]
+        if isinstance(content, str):
+            checksum.update(f"{url}\0{content}\0".encode())
+    return os.path.join(cache_dir(), f"metaschema-{checksum.hexdigest()}.pickle")
+
+
+def _load_metaschema_cache(
+    cache_file: str,
+) -> tuple[Names, list[dict[str, str]], dict[str, Any]] | None:
+    """Load the compiled metaschema from disk, if available."""
+    try:
+        with open(cache_file, "rb") as handle:
+            cached = pickle.load(handle)  # nosec
+    except FileNotFoundError:
+        return None
+    except Exception as err:
+        _logger.debug("Ignoring unreadable metaschema cache %s: %s", cache_file, err)
+        return None
+    if (
+        isinstance(cached, tuple)
+        and len(cached) == 3
+        and isinstance(cached[0], Names)
+        and isinstance(cached[1], CommentedSeq)
+        and isinstance(cached[2], dict)
+    ):
+        return cast(tuple[Names, list[dict[str, str]], dict[str, Any]], cached)
+    _logger.debug("Ignoring malformed metaschema cache %s", cache_file)
+    return None
+
+
+def _save_metaschema_cache(
+    cache_file: str, names: Names, doc: list[dict[str, str]], idx: dict[str, Any]
+) -> None:
+    """Atomically write the compiled metaschema to disk, ignoring any failure."""
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                pickle.dump((names, doc, dict(idx)), handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except Exception as err:
+        _logger.debug("Could not write metaschema cache %s: %s", cache_file, err)
+
+
 def add_namespaces(metadata: Mapping[str, Any], namespaces: MutableMapping[str, str]) -> None:
     """Collect the provided namespaces, checking for conflicts."""
     for key, value in metadata.items():
@@ -259,6 +388,7 @@ def load_schema(
         metaschema_loader = Loader(
             ctx=metaschema_loader.ctx, cache=cache, session=metaschema_loader.session
         )
+    known_sources: Final = set(metaschema_loader.source_checksums)
     schema_doc, schema_metadata = metaschema_loader.resolve_ref(schema_ref, "")
 
     if not isinstance(schema_doc, MutableSequence):
@@ -271,6 +401,12 @@ def load_schema(
 
     # Create the loader that will be used to load the target document.
     document_loader = Loader(schema_ctx, cache=cache)
+    # The metaschema loader may be shared by every schema of the process: only
+    # keep what was fetched for this one, or that it imports
+    roots: Final = [url for url in metaschema_loader.source_checksums if url not in known_sources]
+    if isinstance(schema_ref, str):
+        roots.append(metaschema_loader.expand_url(schema_ref, "", scoped_id=False))
+    document_loader.schema_sources = metaschema_loader.imported_sources(roots)
 
     # Make the Avro validation that will be used to validate the target
     # document
@@ -279,6 +415,100 @@ def load_schema(
     return document_loader, avsc_names, schema_metadata, metaschema_loader
 
 
+COMPILED_SCHEMA_MAGIC: Final = b"schema-salad compiled schema v1\n"
+
+
+def save_compiled_schema(
+    target: str,
+    document_loader: Loader,
+    avsc_names: Names,
+    schema_metadata: dict[str, Any],
+    metaschema_loader: Loader,
+) -> None:
+    """
+    Serialize the output of :py:func:`load_schema` to a compiled schema file.
+
+    The file holds the JSON-LD context of the document loader, the avro
+    ``Names`` table and the schema metadata, together with the SHA-256 of
+    every document the schema was loaded from (``document_loader.schema_sources``).
+    Use :py:func:`load_compiled_schema` to restore it.
+    """
+    payload: Final = {
+        "version": _salad_version(),
+        "pickle_format": _PICKLE_FORMAT,
+        "ctx": document_loader.ctx,
+        "salad_version": document_loader.salad_version,
+        "skip_schemas": document_loader.skip_schemas,
+        "names": avsc_names,
+        "metadata": schema_metadata,
+        "sources": dict(document_loader.schema_sources),
+    }
+    with open(target, "wb") as handle:
+        handle.write(COMPILED_SCHEMA_MAGIC)
+        handle.write(zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)))
+
+
+def load_compiled_schema(
+    source: str,
+    cache: CacheType | None = None,
+    check_sources: bool = True,
+) -> schema_type:
+    """
+    Restore a schema written by :py:func:`save_compiled_schema`.
+
+    Schema resolution, metaschema validation, JSON-LD context generation and
+    Avro construction are not re-run.
+    If ``check_sources`` is set, every ``file:`` document that went into the
+    compiled schema is re-read and compared against its recorded checksum.
+
+    :raises SchemaException: if the file is not a compiled schema, was written
+      by another version of schema-salad, or one of its sources has changed.
+    :returns: document_loader, avsc_names, schema_metadata, metaschema_loader
+    """
+    with open(source, "rb") as handle:
+        data: Final = handle.read()
+    if not data.startswith(COMPILED_SCHEMA_MAGIC):
+        raise SchemaException(f"{source!r} is not a compiled schema-salad schema.")
+    try:
+        payload: Final = pickle.loads(zlib.decompress(data[len(COMPILED_SCHEMA_MAGIC) :]))  # nosec
+    except Exception as err:
+        raise SchemaException(f"Could not read compiled schema {source!r}: {err}") from err
+    if payload.get("version") != _salad_version() or payload.get("pickle_format") != _PICKLE_FORMAT:
+        raise SchemaException(
+            f"Compiled schema {source!r} was written by schema-salad "
+            f"{payload.get('version')}, not {_salad_version()}."
+        )
+    sources: Final[dict[str, str]] = payload["sources"]
+    if check_sources:
+        for url, checksum in sources.items():
+            if urlsplit(url).scheme != "file":
+                continue
+            try:
+                with open(uri_file_path(url), encoding="utf-8") as src:
+                    current = hashlib.sha256(src.read().encode("utf-8")).hexdigest()
+            except OSError:
+                current = ""
+            if current != checksum:
+                raise SchemaException(f"Compiled schema {source!r} is out of date: {url} changed.")
+
+    metaschema_loader = get_metaschema()[2]
+    if cache is not None:
+        for k, v in metaschema_loader.cache.items():
+            if k not in cache:
+                cache[k] = v
+        metaschema_loader = Loader(
+            ctx=metaschema_loader.ctx, cache=cache, session=metaschema_loader.session
+        )
+    document_loader: Final = Loader(
+        payload["ctx"],
+        cache=cache,
+        skip_schemas=payload["skip_schemas"],
+        salad_version=payload["salad_version"],
+    )
+    document_loader.schema_sources = sources
+    return document_loader, payload["names"], payload["metadata"], metaschema_loader
+
+
 def load_and_validate(
     document_loader: Loader,
     avsc_names: Names,
@@ -323,8 +553,23 @@ def validate_doc(
     loader: Loader,
     strict: bool,
     strict_foreign_properties: bool = False,
+    validator: validate.CompiledValidator | None = None,
+    single_pass: bool = False,
 ) -> None:
-    """Validate a document using the provided schema."""
+    """
+    Validate a document using the provided schema.
+
+    :param validator: if given, used to check the document instead of
+        :py:func:`validate.validate_ex`; it must have been made by
+        :py:func:`compile_validator` from the same loader and options.
+        The errors of an invalid document are reported the same either way.
+        If the loader has replaced its ``vocab`` or ``identifiers`` since,
+        a new validator is made for this call.
+    :param single_pass: when no root matches, explain the rejection by
+        checking again only the roots that are reported: the one whose
+        ``class`` matches if there is one, else all of them. Otherwise every
+        root is checked again until one whose ``class`` matches.
+    """
     has_root = False
     for root in schema_names.names.values():
         if (hasattr(root, "get_prop") and root.get_prop("documentRoot")) or (
@@ -336,6 +581,12 @@ def validate_doc(
     if not has_root:
         raise ValidationException("No document roots defined in the schema")
 
+    if validator is not None and (
+        validator.vocab is not loader.vocab or validator.identifiers is not loader.identifiers
+    ):
+        # the loader stopped sharing its context, or loaded a new one
+        validator = compile_validator(loader, validator.strict, validator.strict_foreign_properties)
+
     if isinstance(doc, MutableSequence):
         vdoc = doc
     elif isinstance(doc, CommentedMap):
@@ -356,54 +607,61 @@ def validate_doc(
     for pos, item in enumerate(vdoc):
         sourceline = SourceLine(vdoc, pos, str)
         success = False
+        # the roots that do not match, and whether their class does
+        rejected: list[tuple[NamedSchema, bool]] = []
         for root in roots:
-            success = validate.validate_ex(
-                root,
-                item,
-                loader.identifiers,
-                strict,
-                foreign_properties=loader.foreign_properties,
-                raise_ex=False,
-                skip_foreign_properties=loader.skip_schemas,
-                strict_foreign_properties=strict_foreign_properties,
-                vocab=loader.vocab,
-            )
+            if validator is not None:
+                success = validator.validate(root, item, loader.foreign_properties)
+            else:
+                success = validate.validate_ex(
+                    root,
+                    item,
+                    loader.identifiers,
+                    strict,
+                    foreign_properties=loader.foreign_properties,
+                    raise_ex=False,
+                    skip_foreign_properties=loader.skip_schemas,
+                    strict_foreign_properties=strict_foreign_properties,
+                    vocab=loader.vocab,
+                )
             if success:
                 break
+            if single_pass:
+                rejected.append((root, _class_matches(root, item, loader)))
 
         if not success:
+            # the roots tried so far, with why they do not match
+            failures: list[tuple[Schema, ValidationException]] = []
+            explain = roots
+            if single_pass:
+                explain = [root for root, matched in rejected if matched][:1] or [
+                    root for root, _ in rejected
+                ]
+            for root in explain:
+                failure = _root_error(root, item, loader, strict, strict_foreign_properties)
+                if failure is not None:
+                    failures.append((root, failure))
+                    if isinstance(failure, ClassValidationException):
+                        break
             errors: list[SchemaSaladException] = []
-            for root in roots:
-                if hasattr(root, "get_prop"):
-                    name = root.get_prop("name")
-                elif hasattr(root, "name"):
-                    name = root.name
-
-                try:
-                    validate.validate_ex(
-                        root,
-                        item,
-                        loader.identifiers,
-                        strict,
-                        foreign_properties=loader.foreign_properties,
-                        raise_ex=True,
-                        skip_foreign_properties=loader.skip_schemas,
-                        strict_foreign_properties=strict_foreign_properties,
-                        vocab=loader.vocab,
-                    )
-                except ClassValidationException as exc1:
+            for failed, failure in failures:
+                if hasattr(failed, "get_prop"):
+                    name = failed.get_prop("name")
+                elif hasattr(failed, "name"):
+                    name = failed.name
+
+                if isinstance(failure, ClassValidationException):
                     errors = [
                         ClassValidationException(
-                            f"tried {validate.friendly(name)!r} but", sourceline, [exc1]
+                            f"tried {validate.friendly(name)!r} but", sourceline, [failure]
                         )
                     ]
                     break
-                except ValidationException as exc2:
-                    errors.append(
-                        ValidationException(
-                            f"tried {validate.friendly(name)!r} but", sourceline, [exc2]
-                        )
+                errors.append(
+                    ValidationException(
+                        f"tried {validate.friendly(name)!r} but", sourceline, [failure]
                     )
+                )
 
             objerr = "Invalid"
             for ident in loader.identifiers:
@@ -415,6 +673,54 @@ def validate_doc(
         raise ValidationException("", None, anyerrors, "*")
 
 
+def _class_matches(root: Schema, item: Any, loader: Loader) -> bool:
+    """Tell if a document root is a record whose ``class`` is the one of the item."""
+    return (
+        isinstance(root, RecordSchema)
+        and "class" in root.field_names
+        and isinstance(item, MutableMapping)
+        and validate._class_matches(root.name, item.get("class"), loader.vocab)
+    )
+
+
+def _root_error(
+    root: Schema,
+    item: Any,
+    loader: Loader,
+    strict: bool,
+    strict_foreign_properties: bool,
+) -> ValidationException | None:
+    """Validate an item against a document root, returning the error if it does not match."""
+    try:
+        validate.validate_ex(
+            root,
+            item,
+            loader.identifiers,
+            strict,
+            foreign_properties=loader.foreign_properties,
+            raise_ex=True,
+            skip_foreign_properties=loader.skip_schemas,
+            strict_foreign_properties=strict_foreign_properties,
+            vocab=loader.vocab,
+        )
+    except ValidationException as exc:
+        return exc
+    return None
+
+
+def compile_validator(
+    loader: Loader, strict: bool, strict_foreign_properties: bool = False
+) -> validate.CompiledValidator:
+    """Make a compiled validator for use with :py:func:`validate_doc`."""
+    return validate.CompiledValidator(
+        loader.identifiers,
+        loader.vocab,
+        strict=strict,
+        strict_foreign_properties=strict_foreign_properties,
+        skip_foreign_properties=loader.skip_schemas,
+    )
+
+
 def get_anon_name(rec: MutableMapping[str, str | dict[str, str] | list[str]]) -> str:
     """Calculate a reproducible name for anonymous types."""
     if "name" in rec:
@@ -449,7 +755,11 @@ def replace_type(
     find_embeds: bool = True,
     deepen: bool = True,
 ) -> Any:
-    """Go through and replace types in the 'spec' mapping."""
+    """
+    Go through and replace types in the 'spec' mapping.
+
+    Parts that need no change are shared with the input, not copied.
+    """
     if isinstance(items, MutableMapping):
         # recursively check these fields for types to replace
         if items.get("type") in ("record", "enum", "map", "union") and items.get("name"):
@@ -460,9 +770,12 @@ def replace_type(
         if not deepen:
             return items
 
-        items = copy.copy(items)
+        replaced = items  # copied on the first change
         if not items.get("name"):
-            items["name"] = get_anon_name(items)
+            anon_name: Final = get_anon_name(items)
+            if items.get("name") != anon_name:
+                replaced = copy.copy(items)
+                replaced["name"] = anon_name
         for name in ("type", "items", "fields", "values"):
             if name in items:
                 new_type = replace_type(
@@ -473,17 +786,25 @@ def replace_type(
                     find_embeds=find_embeds,
                     deepen=find_embeds,
                 )
-                items[name] = new_type
-                if isinstance(items[name], MutableSequence):
-                    items[name] = flatten(items[name])
-
-        return items
+                if isinstance(new_type, MutableSequence) and (
+                    new_type is not items[name] or not _is_flat(new_type)
+                ):
+                    new_type = flatten(new_type)
+                if new_type is not items[name]:
+                    if replaced is items:
+                        replaced = copy.copy(items)
+                    replaced[name] = new_type
+
+        return replaced
     if isinstance(items, MutableSequence):
         # recursively transform list
-        return [
+        new_items: Final = [
             replace_type(i, spec, loader, found, find_embeds=find_embeds, deepen=deepen)
             for i in items
         ]
+        if all(new is old for new, old in zip(new_items, items)):
+            return items
+        return new_items
     if isinstance(items, str):
         # found a string which is a symbol corresponding to a type.
         replace_with = None
@@ -502,6 +823,11 @@ def replace_type(
     return items
 
 
+def _is_flat(items: MutableSequence[Any]) -> bool:
+    """Tell if flatten() would leave the items as they are."""
+    return not any(isinstance(i, (list, tuple)) for i in items)
+
+
 def avro_field_name(url: str) -> str:
     """
     Turn a URL into an Avro-safe name.
@@ -511,10 +837,12 @@ def avro_field_name(url: str) -> str:
     Extract either the last part of the URL fragment past the slash, otherwise
     the whole fragment.
     """
-    d: Final = urlparse(url)
-    if d.fragment:
-        return d.fragment.split("/")[-1]
-    return d.path.split("/")[-1]
+    return shortname(url)
+
+
+def _same(new: Any, old: Any) -> bool:
+    """Tell if make_valid_avro() left this part as it was."""
+    return new is old or (isinstance(new, str) and new == old)
 
 
 Avro: TypeAlias = MutableMapping[str, Any] | MutableSequence[Any] | str
@@ -528,19 +856,26 @@ def make_valid_avro(
     fielddef: bool = False,
     vocab: dict[str, str] | None = None,
 ) -> Avro | MutableMapping[str, str] | str | list[Any | MutableMapping[str, str] | str]:
-    """Convert our schema to be more avro like."""
+    """
+    Convert our schema to be more avro like.
+
+    Parts that need no change are shared with the input, not copied.
+    """
     if vocab is None:
         _, _, metaschema_loader = get_metaschema()
         vocab = metaschema_loader.vocab
 
     # Possibly could be integrated into our fork of avro/schema.py?
     if isinstance(items, MutableMapping):
-        avro: Final = copy.copy(items)
+        avro = items  # copied on the first change, the rest is shared with the input
         if avro.get("name"):
             if fielddef:
-                avro["name"] = avro_field_name(avro["name"])
+                name = avro_field_name(avro["name"])
             else:
-                avro["name"] = validate.avro_type_name(avro["name"])
+                name = validate.avro_type_name(avro["name"])
+            if name != avro["name"]:
+                avro = copy.copy(items)
+                avro["name"] = name
 
         if "type" in avro and avro["type"] in (
             saladp + "record",
@@ -560,7 +895,7 @@ def make_valid_avro(
                 found.add(avro["name"])
         for field in ("type", "items", "names", "values", "fields"):
             if field in avro:
-                avro[field] = make_valid_avro(
+                value = make_valid_avro(
                     avro[field],
                     alltypes,
                     found,
@@ -568,8 +903,16 @@ def make_valid_avro(
                     fielddef=(field == "fields"),
                     vocab=vocab,
                 )
+                if not _same(value, avro[field]):
+                    if avro is items:
+                        avro = copy.copy(items)
+                    avro[field] = value
         if "symbols" in avro:
-            avro["symbols"] = [avro_field_name(sym) for sym in avro["symbols"]]
+            symbols: Final = [avro_field_name(sym) for sym in avro["symbols"]]
+            if symbols != avro["symbols"]:
+                if avro is items:
+                    avro = copy.copy(items)
+                avro["symbols"] = symbols
         return avro
     if items and isinstance(items, MutableSequence):
         ret: Final = []
@@ -577,6 +920,8 @@ def make_valid_avro(
             ret.append(
                 make_valid_avro(i, alltypes, found, union=union, fielddef=fielddef, vocab=vocab)
             )
+        if all(_same(new, old) for new, old in zip(ret, items)):
+            return items
         return ret
     if union and isinstance(items, str):
         if items in alltypes and validate.avro_type_name(items) not in found:
@@ -601,6 +946,27 @@ def deepcopy_strip(item: Any) -> Any:
     return item
 
 
+def _add_with_bases(
+    stype: dict[str, Any],
+    types: dict[str, Any],
+    placed: set[int],
+    ordered: list[dict[str, Any]],
+) -> None:
+    """Add the type to the ordered list, after the types it extends."""
+    if id(stype) in placed:  # already there, or on the path of an 'extends' cycle
+        return
+    placed.add(id(stype))
+    for ex in aslist(stype.get("extends", [])):
+        if ex in types:
+            _add_with_bases(types[ex], types, placed, ordered)
+    ordered.append(stype)
+
+
+def _by_shortname(fields: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Index the fields by their short names."""
+    return {shortname(field["name"]): field for field in fields}
+
+
 def extend_and_specialize(
     items: list[dict[str, Any]], loader: Loader, expand_subtypes: bool = True
 ) -> list[dict[str, Any]]:
@@ -610,9 +976,17 @@ def extend_and_specialize(
         i["name"]: i for i in items2
     }  # no Final, error: ‘CPyStatic_types___’ undeclared (first use in this function)
     types.update({k[len(saladp) :]: v for k, v in types.items() if k.startswith(saladp)})
-    results: Final = []
-
+    subtypes: Final = SubtypeCache()
+    # Materialize the base types first, so that each type is extended once
+    # from the complete definitions of its bases, whatever the declaration order
+    ordered: Final[list[dict[str, Any]]] = []
+    placed: Final[set[int]] = set()
     for stype in items2:
+        _add_with_bases(stype, types, placed, ordered)
+    materialized: Final[dict[int, dict[str, Any]]] = {}
+
+    for item in ordered:
+        stype = item
         if "extends" in stype:
             specs: dict[str, str] = {}
             if "specialize" in stype:
@@ -631,9 +1005,14 @@ def extend_and_specialize(
 
                 if stype["type"] == "record":
                     if specs:
-                        basetype["fields"] = replace_type(
-                            basetype.get("fields", []), specs, loader, set()
-                        )
+                        basefields = basetype.get("fields", [])
+                        # copy the fields that replace_type() shares with the
+                        # base type, so that they are marked in this type only
+                        shared = {id(field) for field in basefields}
+                        basetype["fields"] = [
+                            copy.copy(field) if id(field) in shared else field
+                            for field in replace_type(basefields, specs, loader, set())
+                        ]
 
                     for field in basetype.get("fields", []):
                         if "inherited_from" not in field:
@@ -651,8 +1030,8 @@ def extend_and_specialize(
                 # (e.g. Child#id) from a parent (Parent#id) we avoid adding
                 # the same field twice (previously we had just
                 # ``exfields.extends(stype.fields)``).
-                sns_fields = {shortname(field["name"]): field for field in fields}
-                sns_exfields = {shortname(exfield["name"]): exfield for exfield in exfields}
+                sns_fields = _by_shortname(fields)
+                sns_exfields = _by_shortname(exfields)
 
                 # N.B.: This could be simpler. We could have a single loop
                 #       to create the list of fields. The reason for this more
@@ -670,7 +1049,7 @@ def extend_and_specialize(
                         field = exfield
                     else:
                         # make sure field name has not been used yet
-                        if not is_subtype(types, exfield["type"], field["type"]):
+                        if not is_subtype(types, exfield["type"], field["type"], subtypes):
                             raise SchemaParseException(
                                 f"Field name {field['name']} already in use with "
                                 "incompatible type. "
@@ -678,8 +1057,8 @@ def extend_and_specialize(
                             )
                     combined_fields.append(field)
                 # Second pass, now add the ones that are specific to the subtype.
-                for field in sns_fields.values():
-                    if field not in combined_fields:
+                for sn_field, field in sns_fields.items():
+                    if sn_field not in sns_exfields:
                         combined_fields.append(field)
 
                 stype["fields"] = combined_fields
@@ -697,8 +1076,11 @@ def extend_and_specialize(
                 stype["symbols"] = exsym
 
             types[stype["name"]] = stype
+            subtypes.forget(stype["name"])
 
-        results.append(stype)
+        materialized[id(item)] = stype
+
+    results: Final = [materialized[id(item)] for item in items2]
 
     ex_types: Final = {}
     for result in results:
@@ -775,12 +1157,19 @@ def make_avro_schema_from_avro(avro: list[Avro | dict[str, str] | str]) -> Names
     return names
 
 
+_short_names: Final[dict[str, str]] = {}
+
+
 def shortname(inputid: str) -> str:
     """Return the last segment of the provided fragment or path."""
-    parsed_id: Final = urlparse(inputid)
-    if parsed_id.fragment:
-        return parsed_id.fragment.split("/")[-1]
-    return parsed_id.path.split("/")[-1]
+    name = _short_names.get(inputid)
+    if name is None:
+        parsed_id: Final = urlparse(inputid)
+        name = sys.intern((parsed_id.fragment or parsed_id.path).split("/")[-1])
+        if len(_short_names) >= validate.NAME_CACHE_SIZE:
+            _short_names.clear()
+        _short_names[inputid] = name
+    return name
 
 
 def print_inheritance(doc: list[dict[str, Any]], stream: IO[Any]) -> None:
@@ -0,0 +1,150 @@
+"""
+Time the document walkers of the Loader on real and deeply nested documents.
+
+Run with ``python -m schema_salad.tests.benchmark_walkers [runs]``. The real
+workflows from ``tests/test_real_cwl`` are resolved and validated against the
+CWL schema; the nested documents are as deep as twice the recursion limit.
+"""
+
+import copy
+import logging
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from ruamel.yaml.comments import CommentedMap, CommentedSeq
+
+from schema_salad import _logger
+from schema_salad.avro.schema import Names, make_avsc_object
+from schema_salad.exceptions import ValidationException
+from schema_salad.fetcher import DefaultFetcher
+from schema_salad.ref_resolver import Loader
+from schema_salad.schema import load_schema
+from schema_salad.validate import validate_ex
+
+from .util import get_data
+
+WORKFLOWS = [
+    "tests/test_real_cwl/h3agatk/GATK-complete-WES-Workflow-h3abionet.cwl",
+    "tests/test_real_cwl/topmed/topmed_variant_calling_pipeline.cwl",
+]
+
+
+class ExistsFetcher(DefaultFetcher):
+    """Take every link as existing, to time the walk and not the file system."""
+
+    def check_exists(self, url: str) -> bool:
+        return True
+
+
+def best_of(runs: int, setup: Callable[[], Any], run: Callable[[Any], object]) -> float:
+    """Return the shortest time, in milliseconds, that ``run`` took on a fresh ``setup()``."""
+    best = float("inf")
+    for _ in range(runs):
+        arg = setup()
+        start = time.perf_counter()
+        run(arg)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def nested_document(depth: int) -> CommentedMap:
+    """Make a document nested ``depth`` times in a list of one mapping."""
+    document = CommentedMap([("id", "leaf"), ("link", "http://example.com/linked")])
+    for _ in range(depth):
+        document = CommentedMap([("nested", CommentedSeq([document]))])
+    document["id"] = "doc"
+    return document
+
+
+def main(runs: int) -> None:
+    """Print the timings."""
+    # the real workflows use a namespace before declaring it
+    _logger.setLevel(logging.ERROR)
+    document_loader, avsc_names, _, _ = load_schema(
+        get_data("tests/test_schema/CommonWorkflowLanguage.yml")
+    )
+    assert isinstance(avsc_names, Names)
+    workflow_schema = avsc_names.get_name("org.w3id.cwl.cwl.Workflow", None)
+    assert workflow_schema is not None
+    for workflow in WORKFLOWS:
+        url = "file://" + get_data(workflow)
+        text = Loader(document_loader.ctx).fetch(url)
+
+        def fresh(text: Any = text) -> tuple[Loader, Any]:
+            loader = Loader(document_loader.ctx, fetcher_constructor=ExistsFetcher)
+            return loader, copy.deepcopy(text)
+
+        def resolve_all(args: tuple[Loader, Any], url: str = url) -> object:
+            return args[0].resolve_all(args[1], url, checklinks=False)
+
+        def resolve_checked(args: tuple[Loader, Any], url: str = url) -> object:
+            return args[0].resolve_all(args[1], url, checklinks=True)
+
+        resolved, _ = fresh()[0].resolve_all(copy.deepcopy(text), url, checklinks=False)
+
+        def validate(raise_ex: bool, resolved: Any = resolved) -> object:
+            try:
+                return validate_ex(
+                    workflow_schema,
+                    resolved,
+                    list(document_loader.identifiers),
+                    foreign_properties=set(document_loader.foreign_properties),
+                    raise_ex=raise_ex,
+                    vocab=document_loader.vocab,
+                )
+            except ValidationException:
+                return False
+
+        name = workflow.rsplit("/", 1)[-1]
+        print(f"{name}: resolve_all {best_of(runs, fresh, resolve_all):.2f} ms")
+        print(f"{name}: resolve_all with links {best_of(runs, fresh, resolve_checked):.2f} ms")
+        print(f"{name}: validate_ex {best_of(runs, lambda: False, validate):.2f} ms")
+        print(f"{name}: validate_ex raising errors {best_of(runs, lambda: True, validate):.2f} ms")
+
+    depth = sys.getrecursionlimit() * 2
+    context: dict[str, Any] = {
+        "id": "@id",
+        "link": {"@type": "@id"},
+        "nested": "http://example.com/nested",
+    }
+
+    def fresh_nested() -> tuple[Loader, CommentedMap]:
+        return Loader(context, fetcher_constructor=ExistsFetcher), nested_document(depth)
+
+    def resolve_nested(args: tuple[Loader, CommentedMap]) -> object:
+        return args[0].resolve_ref(args[1], "http://example.com/", checklinks=True)
+
+    try:
+        timing = f"{best_of(runs, fresh_nested, resolve_nested):.2f} ms"
+    except RecursionError:
+        timing = "RecursionError"
+    print(f"{depth} levels deep: resolve_ref with links {timing}")
+
+    node_schema = make_avsc_object(
+        {
+            "name": "Node",
+            "type": "record",
+            "fields": [
+                {"name": "id", "type": ["null", "string"]},
+                {"name": "link", "type": ["null", "string"]},
+                {"name": "nested", "type": ["null", {"type": "array", "items": "Node"}]},
+            ],
+        },
+        Names(),
+    )
+    nested = nested_document(depth)
+
+    def validate_nested(document: CommentedMap) -> object:
+        return validate_ex(node_schema, document, vocab={})
+
+    try:
+        timing = f"{best_of(runs, lambda: nested, validate_nested):.2f} ms"
+    except RecursionError:
+        timing = "RecursionError"
+    print(f"{depth} levels deep: validate_ex {timing}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -1,9 +1,11 @@
 """Avro related tests."""
 
-from schema_salad.avro.schema import Names
+import pickle
+
+from schema_salad.avro.schema import Names, RecordSchema
 from schema_salad.schema import load_schema
 
-from .util import get_data
+from .util import cwl_file_uri, get_data
 
 
 def test_avro_loading() -> None:
@@ -12,3 +14,19 @@ def test_avro_loading() -> None:
     document_loader, avsc_names, schema_metadata, metaschema_loader = load_schema(path)
     assert isinstance(avsc_names, Names)
     assert avsc_names.get_name("com.example.derived_schema.ExtendedThing", None)
+
+
+def test_record_field_map() -> None:
+    """Records index their fields by name, also once unpickled."""
+    _, avsc_names, _, _ = load_schema(cwl_file_uri)
+    assert isinstance(avsc_names, Names)
+    records = {n: s for n, s in avsc_names.names.items() if isinstance(s, RecordSchema)}
+    assert records
+    for names in (avsc_names, pickle.loads(pickle.dumps(avsc_names))):
+        for name, record in records.items():
+            restored = names.names[name]
+            assert isinstance(restored, RecordSchema)
+            assert [restored.field_map[f.name].name for f in restored.fields] == [
+                f.name for f in record.fields
+            ]
+            assert restored.field_names == frozenset(f.name for f in record.fields)
@@ -1,12 +1,17 @@
 """test different sets of command line arguments"""
 
+import json
 from pathlib import Path
 
 import pytest
 
 import schema_salad.main as cli_parser
+from schema_salad.avro.schema import Names
+from schema_salad.fetcher import DefaultFetcher
+from schema_salad.ref_resolver import Loader
+from schema_salad.schema import load_schema
 
-from .util import cwl_file_uri
+from .util import cwl_file_uri, get_data
 
 
 def test_version(capsys: pytest.CaptureFixture[str]) -> None:
@@ -52,3 +57,99 @@ def test_python_codegen_parent_bad(tmp_path: Path, capsys: pytest.CaptureFixture
         "argument --codegen-parent: Invalid format: "
         r"'https://w3id.org/cwl/salad:schema_salad.metaschema', expected key=value" in err
     )
+
+
+def test_parallel_validation(caplog: pytest.LogCaptureFixture) -> None:
+    """Validate several documents with a process pool."""
+    schema_path = get_data("tests/test_schema/CommonWorkflowLanguage.yml")
+    valid = get_data("tests/test_real_cwl/bio-cwl-tools/bamtools_stats.cwl")
+    invalid = get_data("tests/test_real_cwl/topmed/topmed_variant_calling_pipeline.cwl")
+    assert cli_parser.main(["--jobs", "2", schema_path, valid, valid]) == 0
+    assert caplog.text.count(f"Document {valid!r} is valid") == 2
+
+    caplog.clear()
+    assert cli_parser.main(["--jobs", "2", schema_path, invalid, valid, invalid]) == 1
+    assert caplog.text.count(f"Document {valid!r} is valid") == 1
+    assert caplog.text.count(repr(invalid)) == 2
+
+
+def test_parallel_validation_matches_serial(caplog: pytest.LogCaptureFixture) -> None:
+    """The error report of a worker process is the same as a serial run."""
+    schema_path = get_data("tests/test_schema/CommonWorkflowLanguage.yml")
+    invalid = get_data("tests/test_real_cwl/topmed/topmed_variant_calling_pipeline.cwl")
+    assert cli_parser.main([schema_path, invalid]) == 1
+    serial = caplog.records[-1].getMessage()
+
+    caplog.clear()
+    assert cli_parser.main(["--jobs", "2", schema_path, invalid, invalid]) == 1
+    assert [r.getMessage() for r in caplog.records[-2:]] == [serial, serial]
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_jsonl_report(capsys: pytest.CaptureFixture[str], jobs: str) -> None:
+    """Report on every document, one JSON object per line, with error locations."""
+    schema_path = get_data("tests/test_schema/CommonWorkflowLanguage.yml")
+    valid = get_data("tests/test_real_cwl/bio-cwl-tools/bamtools_stats.cwl")
+    invalid = get_data("tests/test_real_cwl/topmed/topmed_variant_calling_pipeline.cwl")
+    capsys.readouterr()
+    assert cli_parser.main(["--report", "jsonl", "--jobs", jobs, schema_path, invalid, valid]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    records = sorted((json.loads(line) for line in lines), key=lambda r: r["uri"] != invalid)
+    assert [r["uri"] for r in records] == [invalid, valid]
+    assert [r["status"] for r in records] == ["invalid", "valid"]
+    assert records[0]["bytes_fetched"] > 0
+    assert records[0]["errors"]
+    for error in records[0]["errors"]:
+        assert error["message"]
+        assert error["file"].endswith(".cwl")
+        assert isinstance(error["line"], int)
+        assert isinstance(error["col"], int)
+    assert records[1]["errors"] == []
+    assert all(r["time"] >= 0 for r in records)
+
+
+@pytest.mark.parametrize("jobs", ["0", "-1", "x"])
+def test_jobs_must_be_positive(capsys: pytest.CaptureFixture[str], jobs: str) -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        cli_parser.main(["--jobs", jobs, cwl_file_uri])
+    assert exc_info.value.code == 2
+    assert "argument --jobs" in capsys.readouterr().err
+
+
+class BrokenFetcher(DefaultFetcher):
+    def fetch_text(self, url: str, content_types: list[str] | None = None) -> str:
+        raise ConnectionResetError("connection reset")
+
+
+class BuggyFetcher(DefaultFetcher):
+    def fetch_text(self, url: str, content_types: list[str] | None = None) -> str:
+        raise KeyError(url)
+
+
+def test_validate_document_unexpected_error() -> None:
+    """I/O errors are reported for the document at fault, programming errors propagate."""
+    document_loader, avsc_names, _, _ = load_schema(cwl_file_uri)
+    assert isinstance(avsc_names, Names)
+    loader = Loader(document_loader.ctx, fetcher_constructor=BrokenFetcher)
+    valid = get_data("tests/test_real_cwl/bio-cwl-tools/bamtools_stats.cwl")
+    result = cli_parser.validate_document(loader, avsc_names, valid, True)
+    assert not result.valid
+    assert "ConnectionResetError: connection reset" in result.message
+    assert [e["message"] for e in result.errors] == ["ConnectionResetError: connection reset"]
+    assert "in fetch_text" in result.trace
+
+    loader = Loader(document_loader.ctx, fetcher_constructor=BuggyFetcher)
+    with pytest.raises(KeyError):
+        cli_parser.validate_document(loader, avsc_names, valid, True)
+
+
+def test_debug_traceback(caplog: pytest.LogCaptureFixture) -> None:
+    """With --debug, the error of an invalid document comes with its traceback."""
+    schema_path = get_data("tests/test_schema/CommonWorkflowLanguage.yml")
+    invalid = get_data("tests/test_real_cwl/topmed/topmed_variant_calling_pipeline.cwl")
+    assert cli_parser.main([schema_path, invalid]) == 1
+    assert "Traceback" not in caplog.text
+    caplog.clear()
+    assert cli_parser.main(["--debug", schema_path, invalid]) == 1
+    assert "Traceback (most recent call last)" in caplog.text
+    assert "ValidationException" in caplog.text
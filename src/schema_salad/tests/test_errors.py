@@ -1,16 +1,21 @@
 """Tests of helpful error messages."""
 
+import pickle
 import re
+from typing import Any
 
 import pytest
+from ruamel.yaml.comments import CommentedSeq
 
 import schema_salad
 import schema_salad.main
-from schema_salad.avro.schema import Names
-from schema_salad.exceptions import ValidationException
+from schema_salad.avro.schema import Names, PrimitiveSchema
+from schema_salad.exceptions import LazyMessage, ValidationException, to_one_line_messages
 from schema_salad.ref_resolver import Loader
 from schema_salad.schema import load_and_validate, load_schema
 from schema_salad.sourceline import cmap
+from schema_salad.utils import fast_yaml_available
+from schema_salad.validate import validate_ex
 
 from .util import get_data, get_data_uri
 
@@ -420,3 +425,68 @@ def test_schemas_type() -> None:
             ),
             "",
         )
+
+
+def test_lazy_message() -> None:
+    """A lazy message is only rendered when needed, and once."""
+    calls: list[int] = []
+
+    def render(value: int) -> str:
+        calls.append(value)
+        return f"value {value} is wrong"
+
+    child = ValidationException(LazyMessage(render, 42))
+    exc = ValidationException("parent", None, [child, ValidationException("other")], "-")
+    assert not calls
+    assert child.has_message()
+    assert exc.children[0] is child
+    assert "value 42 is wrong" in str(exc)
+    assert child.message == "value 42 is wrong"
+    assert to_one_line_messages(exc) == "value 42 is wrong\nother"
+    assert calls == [42]
+
+    restored = pickle.loads(pickle.dumps(ValidationException(LazyMessage(render, 7))))
+    assert restored.message == "value 7 is wrong"
+    assert calls == [42, 7]
+
+
+def test_lazy_message_container_parts() -> None:
+    """Messages about lists and mappings are rendered only when needed too."""
+    calls: list[Any] = []
+
+    def render(value: Any) -> str:
+        calls.append(value)
+        return f"the value {value} is wrong"
+
+    value: dict[str, Any] = {"a": [1]}
+    message = LazyMessage(render, value)
+    assert not calls and message.text is None
+    assert str(message) == "the value {'a': [1]} is wrong"
+    assert calls == [value]
+
+    datum = CommentedSeq(range(1000))
+    with pytest.raises(ValidationException) as exc:
+        validate_ex(PrimitiveSchema("int"), datum, vocab={})
+    lazy = exc.value._message
+    assert isinstance(lazy, LazyMessage) and lazy.text is None
+    assert "is not int" in str(exc.value)
+    assert lazy.text is not None
+
+
+@pytest.mark.skipif(not fast_yaml_available, reason="PyYAML with libyaml is not installed")
+def test_fast_parse_same_errors() -> None:
+    """Documents parsed with libyaml give the same errors, at the same locations."""
+    path = get_data("tests/test_schema/CommonWorkflowLanguage.yml")
+    document_loader, avsc_names, _, _ = load_schema(path)
+    assert isinstance(avsc_names, Names)
+    for number in range(1, 20):
+        document = get_data(f"tests/test_schema/test{number}.cwl")
+        messages = []
+        for fast_parse in (False, True):
+            loader = Loader(document_loader.ctx, fast_parse=fast_parse)
+            try:
+                load_and_validate(loader, avsc_names, document, True)
+                messages.append("")
+            except ValidationException as e:
+                messages.append(str(e))
+        assert messages[1] == messages[0]
@@ -3,6 +3,7 @@
 import datetime
 import os
 import sys
+import threading
 from io import StringIO
 from pathlib import Path
 from typing import Any, cast
@@ -16,7 +17,7 @@ from schema_salad.exceptions import ValidationException
 from schema_salad.jsonld_context import makerdf
 from schema_salad.ref_resolver import Loader, file_uri, uri_file_path
 from schema_salad.sourceline import SourceLine, cmap
-from schema_salad.utils import ContextType, stdout, yaml_no_ts
+from schema_salad.utils import ContextType, pooled_yaml_no_ts, stdout, yaml_no_ts
 
 from .util import cwl_file_uri, get_data, get_data_uri, get_path
 
@@ -320,6 +321,30 @@ def test_yaml_float_test() -> None:
     assert yaml_no_ts().load("float-test: 2e-10")["float-test"] == 2e-10
 
 
+def test_pooled_yaml() -> None:
+    """Each thread reuses its own loader, and an error does not leak into the next document."""
+    yaml = pooled_yaml_no_ts()
+    assert pooled_yaml_no_ts() is yaml
+    others: list[Any] = []
+    thread = threading.Thread(target=lambda: others.append(pooled_yaml_no_ts()))
+    thread.start()
+    thread.join()
+    assert others[0] is not yaml
+
+    text = "a: &x [1, 2]\nb: *x\nwhen: 2001-12-14\n"
+    with pytest.raises(Exception):
+        yaml.load("a: &x [1, 2]\nb: {c: *x, c: 3}\n")
+    with pytest.raises(Exception):
+        yaml.load("a: [1, 2\n")
+    unfinished = pooled_yaml_no_ts().load_all("a: 1\n---\nb: 2\n")
+    assert next(unfinished) == {"a": 1}
+    unfinished.close()
+    doc = pooled_yaml_no_ts().load(text)
+    assert doc == yaml_no_ts().load(text) and doc["a"] is doc["b"]
+    assert doc.lc.key("b") == (1, 0)
+    assert len(yaml.doc_infos) == 1
+
+
 def test_typedsl_ref() -> None:
     ldr = Loader({}, salad_version="v1.1")
     ldr.add_context(
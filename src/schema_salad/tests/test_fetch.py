@@ -1,10 +1,14 @@
 import os
+import threading
+import time
 from urllib.parse import urljoin, urlsplit
 
 import pytest
 import requests
+from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
-from schema_salad.fetcher import Fetcher
+from schema_salad.exceptions import ValidationException
+from schema_salad.fetcher import Fetcher, ThreadedFetcher
 from schema_salad.ref_resolver import Loader, file_uri
 from schema_salad.utils import CacheType
 
@@ -94,3 +98,148 @@ def test_cache() -> None:
     print(loader.cache)
     assert {"hello": "foo"} == loader.resolve_ref("foo.txt")[0]
     assert loader.check_exists(foo)
+
+
+class SlowFetcher(testFetcher):
+    lock = threading.Lock()
+    checked: list[str] = []
+
+    def check_exists(self, url: str) -> bool:
+        with SlowFetcher.lock:
+            SlowFetcher.checked.append(url)
+        time.sleep(0.05)
+        return super().check_exists(url)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_precheck_links(workers: int) -> None:
+    """Links are checked concurrently, once each, with the same errors."""
+    SlowFetcher.checked = []
+    loader = Loader(
+        {"id": "@id", "links": {"@type": "@id"}},
+        fetcher_constructor=SlowFetcher,
+        link_check_workers=workers,
+    )
+    links = [f"http://example.com/{n}/foo.txt" for n in range(8)]
+    document = CommentedMap(
+        [("id", "doc"), ("links", CommentedSeq(links + ["http://example.com/bar.txt"]))],
+    )
+    with pytest.raises(ValidationException) as exc:
+        loader.resolve_ref(document, base_url="http://example.com/")
+    assert str(exc.value).strip() == (
+        "Field 'links' contains undefined reference to 'http://example.com/bar.txt'"
+    )
+    assert sorted(SlowFetcher.checked) == sorted(links + ["http://example.com/bar.txt"])
+    assert not loader.prechecked_links
+
+
+def test_precheck_links_opt_in() -> None:
+    """Links are only checked from other threads when link_check_workers asks for it."""
+    SlowFetcher.checked = []
+    loader = Loader({"id": "@id", "links": {"@type": "@id"}}, fetcher_constructor=SlowFetcher)
+    remote = ["http://example.com/a/foo.txt", "https://example.com/b/foo.txt"]
+    loader.precheck_links(CommentedMap([("links", CommentedSeq(remote))]))
+    assert not loader.prechecked_links
+    assert not SlowFetcher.checked
+
+
+def test_precheck_remote_links_only() -> None:
+    """Only the http(s) links that validate_links would check are checked in advance."""
+    SlowFetcher.checked = []
+    loader = Loader(
+        {"id": "@id", "links": {"@type": "@id"}, "skipped": {"@type": "@id", "noLinkCheck": True}},
+        fetcher_constructor=SlowFetcher,
+        link_check_workers=4,
+    )
+    remote = ["http://example.com/a/foo.txt", "https://example.com/b/foo.txt"]
+    document = CommentedMap(
+        [
+            ("id", "http://example.com/doc"),
+            ("links", CommentedSeq(remote + ["file:///a/foo.txt", "file:///b/foo.txt"])),
+            ("skipped", CommentedSeq(["http://example.com/c/foo.txt"])),
+        ]
+    )
+    loader.precheck_links(document)
+    assert sorted(loader.prechecked_links) == remote
+    assert sorted(SlowFetcher.checked) == remote
+
+    loader.prechecked_links.clear()
+    SlowFetcher.checked = []
+    loader.precheck_links(
+        CommentedMap([("links", CommentedSeq(["file:///a/foo.txt", "file:///b/foo.txt"]))])
+    )
+    assert not SlowFetcher.checked
+
+
+class SlowMemoryFetcher(SlowFetcher):
+    documents = {
+        "http://example.com/main.yml": "- $import: a.yml\n- $import: b.yml\n- $include: c.txt\n",
+        "http://example.com/a.yml": "hello: a\n",
+        "http://example.com/b.yml": "- $import: a.yml\n- hello: b\n",
+        "http://example.com/c.txt": "hello c\n",
+    }
+
+    def fetch_text(self, url: str, content_types: list[str] | None = None) -> str:
+        self.check_exists(url)
+        return self.documents[url]
+
+    def urljoin(self, base: str, url: str) -> str:
+        return urljoin(base, url)
+
+
+def test_prefetch() -> None:
+    """Referenced documents are fetched in parallel, with the same result."""
+    url = "http://example.com/main.yml"
+    expected, _ = Loader({}, fetcher_constructor=SlowMemoryFetcher).resolve_ref(url)
+
+    SlowFetcher.checked = []
+    async_fetcher = ThreadedFetcher(SlowMemoryFetcher({}, None))
+    loader = Loader({}, fetcher_constructor=SlowMemoryFetcher, async_fetcher=async_fetcher)
+    try:
+        resolved, _ = loader.resolve_ref(url)
+    finally:
+        async_fetcher.close()
+    assert resolved == expected
+    assert sorted(SlowFetcher.checked) == sorted(SlowMemoryFetcher.documents)
+    assert not loader.prefetched
+
+
+def test_prefetch_cached() -> None:
+    """Documents in the Loader cache are read from there, not prefetched."""
+    async_fetcher = ThreadedFetcher()
+    loader = Loader({}, async_fetcher=async_fetcher)
+    loader.cache.update(
+        {
+            "http://example.com/main.yml": "- $import: a.yml\n- $include: c.txt\n",
+            "http://example.com/a.yml": "hello: a\n",
+            "http://example.com/c.txt": "hello c\n",
+        }
+    )
+    try:
+        resolved, _ = loader.resolve_ref("http://example.com/main.yml")
+    finally:
+        async_fetcher.close()
+    assert resolved == [{"hello": "a"}, "hello c\n"]
+    assert not loader.prefetched
+
+
+def test_prefetch_unused_dropped() -> None:
+    """Prefetched documents that resolution does not use are not kept."""
+    SlowMemoryFetcher.documents["http://example.com/tool.yml"] = "id: tool\nrun: a.yml\n"
+    async_fetcher = ThreadedFetcher(SlowMemoryFetcher({}, None))
+    loader = Loader(
+        {"id": "@id", "run": {"@type": "@id", "subscope": "run"}},
+        fetcher_constructor=SlowMemoryFetcher,
+        async_fetcher=async_fetcher,
+    )
+    try:
+        loader.resolve_ref("http://example.com/tool.yml", checklinks=False)
+        assert not loader.prefetched
+
+        loader.prefetch(CommentedMap([("run", "b.yml")]), "http://example.com/tool.yml")
+        assert list(loader.prefetched) == ["http://example.com/b.yml"]
+        loader.forget(["http://example.com/tool.yml"])
+        assert not loader.prefetched
+    finally:
+        async_fetcher.close()
+        del SlowMemoryFetcher.documents["http://example.com/tool.yml"]
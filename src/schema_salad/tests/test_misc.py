@@ -1,5 +1,6 @@
 from rdflib.graph import Graph
 
+from schema_salad import runtime, schema, validate
 from schema_salad.avro.schema import Names
 from schema_salad.schema import load_schema
 
@@ -36,3 +37,30 @@ def test_load_schema_cache() -> None:
     )
     assert isinstance(avsc_names, Names)
     assert "EmptyType" in document_loader.vocab
+
+
+def test_name_caches() -> None:
+    """The names computed from URLs are remembered, within a bounded cache."""
+    urls = [
+        "http://example.com/foo",
+        "http://example.com/#bar",
+        "http://example.com/foo/bar",
+        "http://example.com/foo#bar",
+        "http://example.com/#foo/bar",
+        "http://example.com/foo#bar/baz",
+    ]
+    for url in urls:
+        assert schema.shortname(url) == runtime.shortname(url)
+        assert schema.avro_field_name(url) is schema.shortname(url)
+    assert validate.avro_type_name("https://w3id.org/cwl/cwl#File") == "org.w3id.cwl.cwl.File"
+    assert validate.avro_type_name("https://w3id.org/cwl/salad#record") == "record"
+    assert validate.avro_type_name("http://example.com/foo#bar/baz") is validate.avro_type_name(
+        "http://example.com/foo#bar/baz"
+    )
+
+    for number in range(validate.NAME_CACHE_SIZE + 1):
+        validate.avro_type_name(f"http://example.com/{number}")
+        schema.shortname(f"http://example.com/{number}")
+    assert len(validate._avro_type_names) <= validate.NAME_CACHE_SIZE
+    assert len(schema._short_names) <= validate.NAME_CACHE_SIZE
+    assert validate.avro_type_name("http://example.com/12#a") == "com.example.12.a"
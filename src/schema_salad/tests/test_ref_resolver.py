@@ -1,5 +1,6 @@
 """Test the ref_resolver module."""
 
+import hashlib
 import os
 import shutil
 import sys
@@ -13,10 +14,21 @@ from requests import Session
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 import schema_salad.main
+from schema_salad import ref_resolver
 from schema_salad.exceptions import ValidationException
 from schema_salad.fetcher import DefaultFetcher
 from schema_salad.ref_resolver import Loader
+from schema_salad.sourceline import cmap
 from schema_salad.tests.util import get_data, get_data_uri, get_path
+from schema_salad.utils import (
+    ContextType,
+    ParsedDocuments,
+    copy_yaml_tree,
+    fast_yaml_available,
+    parsed_documents,
+    yaml_fast_load,
+    yaml_no_ts,
+)
 
 
 def is_fs_case_sensitive(
@@ -257,3 +269,376 @@ def test_resolve_missing_step_id(caplog: Any) -> None:
     document_path = get_data("tests/missing_step_name.cwl")
     assert 1 == schema_salad.main.main(argsl=["--print-rdf", schema_path, document_path])
     assert "missing_step_name.cwl:13:1" in "\n".join(caplog.messages)
+
+
+def test_expand_url_cache(caplog: pytest.LogCaptureFixture) -> None:
+    """expand_url results are reused until the namespaces change."""
+    loader = Loader({"id": "@id", "edam": "http://edamontology.org/"})
+    base = "http://example.com/doc"
+    misses = loader.expand_url_misses
+    assert loader.expand_url("edam:format_1", base) == "http://edamontology.org/format_1"
+    assert loader.expand_url("edam:format_1", base) == "http://edamontology.org/format_1"
+    assert loader.expand_url("edam:format_1", base, scoped_id=True) == (
+        "http://edamontology.org/format_1"
+    )
+    assert (loader.expand_url_hits, loader.expand_url_misses - misses) == (1, 2)
+
+    # URLs with an unknown prefix are not cached, so the warning is repeated
+    assert loader.expand_url("foo:bar", base) == "foo:bar"
+    assert loader.expand_url("foo:bar", base) == "foo:bar"
+    assert caplog.text.count("URI prefix 'foo' of 'foo:bar' not recognized") == 2
+    loader.add_namespaces({"foo": "http://example.com/foo#"})
+    assert loader.expand_url("foo:bar", base) == "http://example.com/foo#bar"
+
+    loader.expand_url_cache_size = 2
+    for n in range(3):
+        loader.expand_url(f"#{n}", base)
+    assert len(loader.expand_url_cache) == 2
+    assert ("#0", base, False, False, None) not in loader.expand_url_cache
+
+
+def test_add_context_fresh_rvocab() -> None:
+    """The reverse vocabulary is not built from expansions cached before the context."""
+    loader = Loader({})
+    loader.expand_url_cache[("ex:bar", "", False, False, None)] = "http://example.com/old/bar"
+    loader.add_context({"ex": "http://example.com/new/", "bar": "ex:bar"})
+    assert loader.rvocab["http://example.com/new/bar"] == "bar"
+    assert "http://example.com/old/bar" not in loader.rvocab
+
+
+def test_field_roles() -> None:
+    """field_roles follows the context and the namespaces added later."""
+    loader = Loader(
+        {
+            "id": "@id",
+            "inputs": {"@id": "http://example.com/inputs", "mapSubject": "id"},
+            "run": {"@type": "@id", "subscope": "run"},
+            "type": {"@type": "@vocab", "refScope": 2, "typeDSL": True},
+        }
+    )
+    roles = loader.field_roles
+    assert roles["id"] == ref_resolver._IDENTIFIER | ref_resolver._IDENTITY_LINK
+    assert roles["inputs"] == ref_resolver._IDMAP_FIELD | ref_resolver._VOCAB_TERM
+    assert roles["run"] == ref_resolver._URL_FIELD | ref_resolver._SUBSCOPE
+    assert roles["type"] == (
+        ref_resolver._URL_FIELD
+        | ref_resolver._VOCAB_FIELD
+        | ref_resolver._SCOPED_REF
+        | ref_resolver._DSL_FIELD
+    )
+    assert "ex" not in roles
+    loader.add_namespaces({"ex": "http://example.com/"})
+    assert loader.field_roles["ex"] == ref_resolver._VOCAB_TERM
+
+
+def test_validate_links_deep_document() -> None:
+    """validate_links does not recurse into the nested documents it checks."""
+    loader = Loader({"id": "@id", "link": {"@type": "@id"}, "nested": "http://example.com/nested"})
+    loader.check_exists = lambda url: url.endswith("exists")
+    leaf = CommentedMap([("link", "http://example.com/exists")])
+    document = leaf
+    for _ in range(sys.getrecursionlimit() * 2):
+        document = CommentedMap([("nested", CommentedSeq([document]))])
+    loader.validate_links(document, "http://example.com/", {})
+
+    leaf["link"] = "http://example.com/missing"
+    with pytest.raises(ValidationException):
+        loader.validate_links(document, "http://example.com/", {})
+
+    document = CommentedMap([("nested", CommentedSeq([CommentedMap([("nested", leaf)])]))])
+    with pytest.raises(ValidationException) as exc:
+        loader.validate_links(document, "http://example.com/", {})
+    assert str(exc.value).splitlines() == [
+        "checking field 'nested'",
+        "  checking item",
+        "    checking field 'nested'",
+        "      Field 'link' contains undefined reference to 'http://example.com/missing'",
+    ]
+
+
+def test_resolve_deep_document() -> None:
+    """resolve_all does not recurse into the nested documents it resolves."""
+    loader = Loader({"id": "@id", "link": {"@type": "@id"}, "nested": "http://example.com/nested"})
+    loader.check_exists = lambda url: url.endswith("exists")
+    leaf = CommentedMap([("link", "exists")])
+    document = leaf
+    for _ in range(sys.getrecursionlimit() * 2):
+        document = CommentedMap([("nested", CommentedSeq([document]))])
+    document["id"] = "doc"
+    loader.resolve_ref(document, "http://example.com/", checklinks=True)
+    assert leaf["link"] == "http://example.com/exists"
+
+    document = CommentedMap([("id", "doc2"), ("nested", CommentedSeq([CommentedMap(leaf)]))])
+    document["nested"][0]["nested"] = [1]
+    with pytest.raises(ValidationException) as exc:
+        loader.resolve_ref(document, "http://example.com/")
+    assert "Validation error in position 0" in str(exc.value)
+
+
+def test_subloader_shares_context() -> None:
+    """A SubLoader reuses its parent's context until it adds to it."""
+    loader = Loader({"id": "@id", "edam": "http://edamontology.org/"})
+    sub = ref_resolver.SubLoader(loader)
+    assert sub.shared_context
+    assert sub.vocab is loader.vocab and sub.field_roles is loader.field_roles
+
+    sub.add_namespaces({"ex": "http://example.com/"})
+    assert sub.vocab is not loader.vocab
+    assert sub.identifiers is loader.identifiers
+    assert sub.expand_url("ex:a", "") == "http://example.com/a"
+    assert sub.expand_url("edam:a", "") == "http://edamontology.org/a"
+    assert "ex" not in loader.vocab and "ex" not in loader.field_roles
+    assert loader.expand_url("ex:a", "http://example.com/doc") == "ex:a"
+
+
+def test_subloader_context_isolated(caplog: pytest.LogCaptureFixture) -> None:
+    """Neither a SubLoader nor its parent sees what the other adds to the context."""
+    loader = Loader({"id": "@id", "edam": "http://edamontology.org/"})
+    assert loader.expand_url("edam:a", "") == "http://edamontology.org/a"
+    loader.add_namespaces({"ex": "http://example.com/"})
+    loader._add_properties("http://example.com/prop")
+    loader.url_fields.add("http://example.com/link")
+    loader._update_field_roles()
+
+    sub = ref_resolver.SubLoader(loader)
+    assert "ex" not in sub.vocab
+    assert sub.expand_url("ex:a", "") == "ex:a"
+    assert "URI prefix 'ex' of 'ex:a' not recognized" in caplog.text
+    assert sub.foreign_properties == loader.foreign_properties
+    assert sub.foreign_properties is not loader.foreign_properties
+    assert "http://example.com/link" in sub.url_fields
+    assert sub.field_roles["http://example.com/link"] & ref_resolver._URL_FIELD
+
+    sub.add_namespaces({"other": "http://example.com/other/"})
+    sub._add_properties("http://example.com/subprop")
+    assert "other" not in loader.vocab
+    assert "http://example.com/subprop" not in loader.foreign_properties
+    assert loader.expand_url("other:a", "") == "other:a"
+
+    loader.add_namespaces({"late": "http://example.com/late/"})
+    sibling = ref_resolver.SubLoader(loader)
+    assert "late" not in sibling.vocab and "other" not in sibling.vocab
+    assert sibling.expand_url("edam:a", "") == "http://edamontology.org/a"
+
+
+def test_resolve_changed(tmp_path: Path) -> None:
+    """Only the changed documents and the ones importing them are loaded again."""
+    (tmp_path / "main.yml").write_text(
+        "id: main\nsteps:\n  - $import: step.yml\n  - $import: other.yml\n"
+        "doc:\n  $include: doc.txt\n"
+    )
+    (tmp_path / "step.yml").write_text(
+        "id: step\nlabel: first\ntool:\n  id: http://example.com/tool\n"
+    )
+    (tmp_path / "other.yml").write_text("id: other\nlabel: unchanged\n")
+    (tmp_path / "doc.txt").write_text("Some documentation\n")
+    ctx: ContextType = {"id": "@id"}
+    main = (tmp_path / "main.yml").as_uri()
+    loader = Loader(ctx)
+    loader.resolve_ref(main)
+    other = loader.idx[(tmp_path / "other.yml").as_uri()]
+
+    (tmp_path / "step.yml").write_text("id: step\nlabel: second\n")
+    changed = loader.forget([(tmp_path / "step.yml").as_uri()])
+    assert changed == {main, (tmp_path / "step.yml").as_uri()}
+    assert f"{main}#main" not in loader.idx
+    assert (tmp_path / "step.yml").as_uri() + "#step" not in loader.idx
+    assert "http://example.com/tool" not in loader.idx
+    assert (tmp_path / "other.yml").as_uri() + "#other" in loader.idx
+    resolved, _ = loader.resolve_changed(main, [])
+    assert isinstance(resolved, CommentedMap)
+    assert resolved == Loader(ctx).resolve_ref(main)[0]
+    assert resolved["steps"][0]["label"] == "second"
+    assert resolved["steps"][1] is other
+
+    (tmp_path / "doc.txt").write_text("Better documentation\n")
+    resolved, _ = loader.resolve_changed(main, [(tmp_path / "doc.txt").as_uri()])
+    assert isinstance(resolved, CommentedMap)
+    assert resolved["doc"] == "Better documentation\n"
+    assert resolved["steps"][1] is other
+
+
+def test_parsed_documents(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Loaders share parsed documents, once enabled, and each gets its own copy."""
+    text = "id: one  # the first\nsteps: &steps\n  - {id: a, in: [x, y]}\nalias: *steps\n"
+    for name in ("zero.yml", "one.yml", "two.yml"):
+        (tmp_path / name).write_text(text)
+    checksum = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    parsed_documents.clear()
+    Loader({}).fetch((tmp_path / "zero.yml").as_uri())
+    assert not parsed_documents.documents
+
+    monkeypatch.setattr(parsed_documents, "max_bytes", 1024 * 1024)
+    first = Loader({}).fetch((tmp_path / "one.yml").as_uri())
+    assert isinstance(first, CommentedMap)
+    assert checksum in parsed_documents.documents
+
+    second = Loader({}).fetch((tmp_path / "two.yml").as_uri())
+    assert isinstance(second, CommentedMap)
+    assert second == first and second is not first
+    assert second["steps"] is second["alias"] and second["steps"] is not first["steps"]
+    assert second["steps"][0].lc.data == first["steps"][0].lc.data
+    assert second["steps"][0]["in"].lc.col == first["steps"][0]["in"].lc.col == 16
+    assert second.lc.filename.endswith("two.yml") and first.lc.filename.endswith("one.yml")
+    second.lc.data["id"][0] = 42
+    second.ca.items["id"][2].value = "# changed\n"
+    third = Loader({}).fetch((tmp_path / "one.yml").as_uri() + "?again")
+    assert isinstance(third, CommentedMap)
+    assert third.lc.data["id"][0] == first.lc.data["id"][0] == 0
+    assert third.ca.items["id"][2].value == first.ca.items["id"][2].value == "# the first\n"
+    parsed_documents.clear()
+
+    cache = ParsedDocuments(len(text) * 2)
+    for n in range(3):
+        cache.put(str(n), copy_yaml_tree(first), len(text))
+    assert list(cache.documents) == ["1", "2"] and cache.size == len(text) * 2
+    assert cache.get("1") == first and list(cache.documents) == ["2", "1"]
+
+
+def same_yaml_tree(fast: Any, slow: Any) -> None:
+    assert fast == slow
+    if isinstance(slow, CommentedMap):
+        assert isinstance(fast, CommentedMap)
+        assert list(fast) == list(slow)
+        assert (fast.lc.line, fast.lc.col, fast.lc.data) == (
+            slow.lc.line,
+            slow.lc.col,
+            slow.lc.data,
+        )
+        for key in slow:
+            same_yaml_tree(fast[key], slow[key])
+    elif isinstance(slow, CommentedSeq):
+        assert isinstance(fast, CommentedSeq)
+        assert (fast.lc.line, fast.lc.col, fast.lc.data) == (
+            slow.lc.line,
+            slow.lc.col,
+            slow.lc.data,
+        )
+        for fast_item, slow_item in zip(fast, slow):
+            same_yaml_tree(fast_item, slow_item)
+
+
+@pytest.mark.skipif(not fast_yaml_available, reason="PyYAML with libyaml is not installed")
+@pytest.mark.parametrize(
+    "path",
+    [
+        "tests/test_real_cwl/topmed/topmed_variant_calling_pipeline.cwl",
+        "tests/test_real_cwl/bio-cwl-tools/bamtools_stats.cwl",
+        "tests/test_schema/CommonWorkflowLanguage.yml",
+        "tests/test_schema/test1.cwl",
+        "tests/test_schema/test12.cwl",
+    ],
+)
+def test_yaml_fast_load(path: str) -> None:
+    """libyaml builds the same tree, with the same line and column data, as ruamel."""
+    with open(get_path(path), encoding="utf-8") as f:
+        text = f.read()
+    same_yaml_tree(yaml_fast_load(text), yaml_no_ts().load(text))
+
+
+@pytest.mark.skipif(not fast_yaml_available, reason="PyYAML with libyaml is not installed")
+def test_fast_parse_fallback(tmp_path: Path) -> None:
+    """Documents libyaml cannot handle are parsed, and rejected, as before."""
+    values = "port: 010\nversion: 1.0\nflag: yes\nwhen: 2001-12-14\nnull_value: ~\n"
+    assert yaml_fast_load(values) == yaml_no_ts().load(values)
+    with pytest.raises(ValueError):
+        yaml_fast_load("id: one\nid: two\n")
+    (tmp_path / "dup.yml").write_text("id: one\nid: two\n")
+    with pytest.raises(ValidationException, match="dup.yml:2:1"):
+        Loader({}, fast_parse=True).fetch((tmp_path / "dup.yml").as_uri())
+    (tmp_path / "tagged.yml").write_text("id: !custom one\nports: [8080, 010]\n")
+    tagged = Loader({}, fast_parse=True).fetch((tmp_path / "tagged.yml").as_uri())
+    assert isinstance(tagged, CommentedMap) and tagged["id"].tag.value == "!custom"
+    assert tagged["ports"] == [8080, 10] and tagged["ports"].lc.data == {0: [1, 8], 1: [1, 14]}
+
+
+def test_normdict_remembers_keys() -> None:
+    """NormDict normalizes each distinct key once, in a bounded map."""
+    calls: list[str] = []
+
+    def normalize(url: str) -> str:
+        calls.append(url)
+        return url.lower()
+
+    idx = ref_resolver.NormDict(normalize)
+    idx["HTTP://Example.com/A"] = "a"
+    assert "http://example.com/a" in idx and idx["HTTP://Example.com/A"] == "a"
+    assert "HTTP://Example.com/A" in idx
+    assert calls == ["HTTP://Example.com/A", "http://example.com/a"]
+    del idx["HTTP://EXAMPLE.COM/A"]
+    assert "http://example.com/a" not in idx
+
+    for n in range(ref_resolver._NORMALIZED_KEYS_SIZE):
+        assert f"X{n}" not in idx
+    assert len(idx.normalized) == ref_resolver._NORMALIZED_KEYS_SIZE
+    assert "HTTP://Example.com/A" not in idx.normalized
+
+
+def test_validate_scoped_index() -> None:
+    """Scoped references found through the idx index are those the search finds."""
+    ctx: ContextType = {
+        "source": {"@type": "@id", "refScope": 2},
+        "scatter": {"@type": "@id", "refScope": 0},
+        "steps": {"mapSubject": "id"},
+        "in": {"mapSubject": "id", "mapPredicate": "source"},
+        "out": {"@type": "@id", "identity": True},
+        "id": "@id",
+    }
+    document = {
+        "id": "main",
+        "inputs": [{"id": "inp"}, {"id": "step1/inp"}],
+        "steps": {
+            "step1": {"in": {"inp": "inp"}, "out": ["out"]},
+            "step2": {"in": {"inp": "step1/out", "x": "step1/inp"}, "out": ["out"]},
+        },
+    }
+    loader = Loader(ctx)
+    loader.resolve_all(cmap(document), "http://example.com/wf.cwl", checklinks=False)
+    assert isinstance(loader.idx, ref_resolver.NormDict)
+    assert loader.idx.scoped[("http://example.com/wf.cwl", "main/", "step1/out")] == (
+        "http://example.com/wf.cwl#main/step1/out"
+    )
+    search = Loader(ctx, idx=dict(loader.idx))
+    for docid in ("http://example.com/wf.cwl#main/step2/inp", "http://example.com/wf.cwl#main"):
+        for field in ("source", "scatter"):
+            for link in ("inp", "step1/out", "step1/inp", "out", "main", "nothing", ""):
+                try:
+                    expected = search.validate_scoped(field, link, docid)
+                except ValidationException as e:
+                    expected = str(e)
+                try:
+                    found = loader.validate_scoped(field, link, docid)
+                except ValidationException as e:
+                    found = str(e)
+                assert found == expected
+    del loader.idx["http://example.com/wf.cwl#main/step1/out"]
+    assert ("http://example.com/wf.cwl", "main/", "step1/out") not in loader.idx.scoped
+
+
+def test_validate_scoped_index_mutations() -> None:
+    """The scoped index follows pop, update and clear on the idx."""
+    ctx: ContextType = {"source": {"@type": "@id", "refScope": 1}, "id": "@id"}
+    loader = Loader(ctx)
+    assert isinstance(loader.idx, ref_resolver.NormDict)
+    docid = "http://example.com/wf.cwl#main/step"
+    target = "http://example.com/wf.cwl#main/inp"
+    loader.idx.update({target: "inp"})
+    assert loader.validate_scoped("source", "inp", docid) == target
+    assert loader.idx.pop(target) == "inp"
+    assert loader.idx.pop(target, None) is None
+    with pytest.raises(KeyError):
+        loader.idx.pop(target)
+    with pytest.raises(ValidationException):
+        loader.validate_scoped("source", "inp", docid)
+    loader.idx.update([(target, "inp")], other="x")
+    assert loader.validate_scoped("source", "inp", docid) == target
+    loader.idx.clear()
+    assert not loader.idx.scoped
+    with pytest.raises(ValidationException):
+        loader.validate_scoped("source", "inp", docid)
+
+    # an entry removed behind the index's back is not found either
+    loader.idx[target] = "inp"
+    dict.__delitem__(loader.idx, target)
+    with pytest.raises(ValidationException):
+        loader.validate_scoped("source", "inp", docid)
@@ -1,9 +1,17 @@
+import os
 from pathlib import Path
 from typing import Any, cast
 
-from schema_salad import schema
+import pytest
+from ruamel.yaml.comments import CommentedSeq
 
-from .util import cwl_file_uri
+from schema_salad import schema, validate
+from schema_salad.avro.schema import Names
+from schema_salad.exceptions import SchemaException, ValidationException
+from schema_salad.main import main
+from schema_salad.utils import convert_to_dict
+
+from .util import basket_file_uri, cwl_file_uri, get_data, get_path
 
 
 def test_extend_and_specialize_enums(tmp_path: Path) -> None:
@@ -27,3 +35,172 @@ def test_extend_and_specialize_enums(tmp_path: Path) -> None:
     ]
     for symbol in symbols:
         assert symbol in CWLType["symbols"]
+
+
+def test_extend_and_specialize_out_of_order() -> None:
+    """Types inherit all of their bases' fields, whatever the declaration order."""
+    _, _, loader = schema.get_metaschema()
+
+    def record(name: str, extends: str | None = None) -> dict[str, Any]:
+        item: dict[str, Any] = {
+            "name": name,
+            "type": "record",
+            "fields": [{"name": f"{name}/{name.lower()}", "type": "string"}],
+        }
+        if extends:
+            item["extends"] = extends
+        return item
+
+    items = [record("A"), record("B", "A"), record("C", "B")]
+    in_order = schema.extend_and_specialize(items, loader)
+    reverse = schema.extend_and_specialize(items[::-1], loader)
+    assert [r["name"] for r in reverse] == ["C", "B", "A"]
+    assert reverse == in_order[::-1]
+    assert [f["name"] for f in reverse[0]["fields"]] == ["A/a", "B/b", "C/c"]
+    assert [f.get("inherited_from") for f in reverse[0]["fields"]] == ["A", "B", None]
+
+
+def test_replace_type_shares_unchanged() -> None:
+    """replace_type and make_valid_avro copy only what they change."""
+    _, _, loader = schema.get_metaschema()
+    enum = {"type": schema.saladp + "enum", "name": "E", "symbols": ["a", "b"]}
+    kept = {"name": "R/kept", "type": enum}
+    changed = {"name": "R/changed", "type": "Base"}
+    record = {"name": "R", "type": schema.saladp + "record", "fields": [kept, changed]}
+
+    replaced = schema.replace_type(record, {"Base": "Derived"}, loader, set())
+    assert replaced is not record and replaced["fields"][0] is kept
+    assert replaced["fields"][1] == {"name": "R/changed", "type": "Derived"}
+    assert changed["type"] == "Base"
+    assert schema.replace_type(record, {}, loader, set()) is record
+
+    avro_enum = {"type": "enum", "name": "E", "symbols": ["a", "b"]}
+    valid = schema.make_valid_avro({"name": "R/kept", "type": avro_enum}, {}, set(), fielddef=True)
+    assert isinstance(valid, dict)
+    assert valid["name"] == "kept" and valid["type"] is avro_enum
+
+    base = {"name": "Base", "type": "record", "abstract": True, "fields": [kept, changed]}
+    derived = {
+        "name": "Derived",
+        "type": "record",
+        "extends": "Base",
+        "specialize": [{"specializeFrom": "Base", "specializeTo": "Derived"}],
+    }
+    results = schema.extend_and_specialize([base, derived], loader)
+    assert [f["inherited_from"] for f in results[1]["fields"]] == ["Base", "Base"]
+    assert "inherited_from" not in kept
+
+
+def test_metaschema_disk_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    names, doc, loader = schema.get_metaschema()
+    cache_files = list((tmp_path / ".cache" / "salad").glob("metaschema-*.pickle"))
+    assert len(cache_files) == 1
+
+    monkeypatch.setattr(schema, "cached_metaschema", None)
+    names2, doc2, loader2 = schema.get_metaschema()
+    assert loader2 is not loader
+    assert sorted(names2.names) == sorted(names.names)
+    assert convert_to_dict(doc2) == convert_to_dict(doc)
+    assert list(loader2.idx) == list(loader.idx)
+    assert loader2.vocab == loader.vocab
+    assert isinstance(doc2, CommentedSeq)
+    assert doc2[0].lc.filename == "metaschema.yml"
+
+
+def test_metaschema_disk_cache_code_change(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The cache is not reused once the code that builds it has changed."""
+    module_file = tmp_path / "validate.py"
+    module_file.write_text(Path(validate.__file__).read_text())
+    monkeypatch.setattr(schema, "_fingerprint_files", [str(module_file)])
+    salad_cache = schema.get_metaschema()[2].cache
+    before = schema._metaschema_cache_file(salad_cache)
+    stat = os.stat(module_file)
+    os.utime(module_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert schema._metaschema_cache_file(salad_cache) != before
+    os.utime(module_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert schema._metaschema_cache_file(salad_cache) == before
+
+
+def test_metaschema_disk_cache_corrupt(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    schema.get_metaschema()
+    (cache_file,) = (tmp_path / ".cache" / "salad").glob("metaschema-*.pickle")
+    cache_file.write_bytes(b"not a pickle")
+
+    monkeypatch.setattr(schema, "cached_metaschema", None)
+    names, doc, loader = schema.get_metaschema()
+    assert "https://w3id.org/cwl/salad#RecordSchema" in loader.idx
+    assert cache_file.read_bytes() != b"not a pickle"
+
+
+def test_compiled_schema_roundtrip(tmp_path: Path) -> None:
+    document_loader, avsc_names, schema_metadata, metaschema_loader = schema.load_schema(
+        cwl_file_uri
+    )
+    assert isinstance(avsc_names, Names)
+    target = str(tmp_path / "cwl.saladc")
+    schema.save_compiled_schema(
+        target, document_loader, avsc_names, schema_metadata, metaschema_loader
+    )
+
+    loader2, names2, metadata2, _ = schema.load_compiled_schema(target)
+    assert isinstance(names2, Names)
+    assert sorted(names2.names) == sorted(avsc_names.names)
+    assert loader2.vocab == document_loader.vocab
+    assert loader2.idmap == document_loader.idmap
+    assert metadata2 == schema_metadata
+    doc = get_data("tests/test_real_cwl/topmed/topmed_variant_calling_pipeline.cwl")
+    with pytest.raises(ValidationException) as original:
+        schema.load_and_validate(document_loader, avsc_names, doc, True)
+    with pytest.raises(ValidationException) as restored:
+        schema.load_and_validate(loader2, names2, doc, True)
+    assert str(restored.value) == str(original.value)
+
+
+def test_compiled_schema_out_of_date(tmp_path: Path) -> None:
+    schema_file = tmp_path / "basket_schema.yml"
+    schema_file.write_text(get_path("tests/basket_schema.yml").read_text())
+    document_loader, avsc_names, schema_metadata, metaschema_loader = schema.load_schema(
+        schema_file.as_uri()
+    )
+    assert isinstance(avsc_names, Names)
+    target = str(tmp_path / "basket.saladc")
+    schema.save_compiled_schema(
+        target, document_loader, avsc_names, schema_metadata, metaschema_loader
+    )
+    schema.load_compiled_schema(target)
+
+    schema_file.write_text(schema_file.read_text() + "\n")
+    with pytest.raises(SchemaException, match="out of date"):
+        schema.load_compiled_schema(target)
+    schema.load_compiled_schema(target, check_sources=False)
+
+    not_compiled = tmp_path / "not_compiled.saladc"
+    not_compiled.write_bytes(b"garbage")
+    with pytest.raises(SchemaException, match="not a compiled"):
+        schema.load_compiled_schema(str(not_compiled))
+
+
+def test_compiled_schema_own_sources(tmp_path: Path) -> None:
+    """Only the documents of the compiled schema are recorded, not others of the process."""
+    schema.load_schema(cwl_file_uri)
+    for _ in range(2):
+        document_loader, avsc_names, schema_metadata, metaschema_loader = schema.load_schema(
+            basket_file_uri
+        )
+        assert list(document_loader.schema_sources) == [basket_file_uri]
+    assert isinstance(avsc_names, Names)
+    target = str(tmp_path / "basket.saladc")
+    schema.save_compiled_schema(
+        target, document_loader, avsc_names, schema_metadata, metaschema_loader
+    )
+    assert list(schema.load_compiled_schema(target)[0].schema_sources) == [basket_file_uri]
+
+
+def test_compile_schema_cli(tmp_path: Path) -> None:
+    target = tmp_path / "basket.saladc"
+    assert main(["--compile-schema", str(target), basket_file_uri]) == 0
+    _, names, _, _ = schema.load_compiled_schema(str(target))
+    assert isinstance(names, Names)
+    assert any(name.endswith(".Basket") for name in names.names)
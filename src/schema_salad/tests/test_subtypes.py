@@ -1,5 +1,7 @@
 """Confirm subtypes."""
 
+from typing import Any
+
 import pytest
 
 from schema_salad.avro import schema
@@ -8,7 +10,7 @@ from schema_salad.schema import load_schema
 
 from .util import get_data
 
-types = [
+types: list[tuple[Any, Any, bool]] = [
     (["int", "float", "double"], "int", True),
     (["int", "float", "double"], ["int"], True),
     (["int", "float", "double"], ["int", "float"], True),
@@ -88,6 +90,40 @@ def test_subtypes(old: schema.PropType, new: schema.PropType, result: bool) -> N
     assert schema.is_subtype({}, old, new) == result
 
 
+def test_subtypes_cache() -> None:
+    """Remembered verdicts are the ones is_subtype() gives without a shared cache."""
+    cache = schema.SubtypeCache()
+    for _ in range(2):
+        for old, new, result in types:
+            assert schema.is_subtype({}, old, new, cache) == result
+            assert schema.is_subtype({}, new, old, cache) == schema.is_subtype({}, new, old)
+
+    path = get_data("tests/test_schema/CommonWorkflowLanguage.yml")
+    _, _, _, metaschema_loader = load_schema(path)
+    items, _ = metaschema_loader.resolve_ref(path)
+    assert isinstance(items, list)
+    named = {i["name"]: i for i in items if isinstance(i, dict) and "name" in i}
+    specs = list(named) + [field["type"] for i in named.values() for field in i.get("fields", [])]
+    cache = schema.SubtypeCache()
+    verdicts = 0
+    for old in specs[::7]:
+        for new in specs[::5]:
+            try:
+                expected = schema.is_subtype(named, old, new)
+            except (KeyError, RecursionError) as e:
+                with pytest.raises(type(e)):
+                    schema.is_subtype(named, old, new, cache)
+                continue
+            assert schema.is_subtype(named, old, new, cache) == expected
+            verdicts += expected
+    assert verdicts > 0 and len(cache.verdicts) > 0
+
+    cache.forget("https://w3id.org/cwl/cwl#NotAType")
+    assert len(cache.verdicts) > 0
+    cache.forget("https://w3id.org/cwl/cwl#Process")
+    assert not cache.verdicts
+
+
 def test_avro_loading_subtype() -> None:
     """Confirm conversion of SALAD style names to avro when overriding."""
     path = get_data("tests/test_schema/avro_subtype.yml")
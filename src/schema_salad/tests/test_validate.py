@@ -0,0 +1,308 @@
+"""Compare the compiled validator with validate_ex."""
+
+import copy
+import logging
+import sys
+from collections.abc import MutableMapping, MutableSequence
+from typing import Any
+
+import pytest
+from ruamel.yaml.comments import CommentedMap
+
+from schema_salad.avro.schema import (
+    ArraySchema,
+    MapSchema,
+    NamedMapSchema,
+    NamedUnionSchema,
+    Names,
+    RecordSchema,
+    Schema,
+    UnionSchema,
+    make_avsc_object,
+)
+from schema_salad.exceptions import SchemaSaladException, ValidationException
+from schema_salad.ref_resolver import Loader
+from schema_salad.schema import (
+    compile_validator,
+    get_metaschema,
+    load_schema,
+    validate_doc,
+)
+from schema_salad.validate import union_candidates, validate_ex
+
+from .util import get_data
+
+DOCUMENTS = [
+    "tests/test_real_cwl/bio-cwl-tools/bamtools_stats.cwl",
+    "tests/test_real_cwl/bio-cwl-tools/picard_CreateSequenceDictionary.cwl",
+    "tests/test_real_cwl/topmed/topmed_variant_calling_pipeline.cwl",
+    "tests/foreign/foreign_prop1.cwl",
+    "tests/foreign/foreign_prop3.cwl",
+    "tests/test_schema/test1.cwl",
+    "tests/test_schema/test12.cwl",
+]
+
+
+def mutations(doc: Any) -> list[Any]:
+    """Make invalid variants of a document by breaking one field at a time."""
+    variants = []
+    if isinstance(doc, MutableMapping):
+        for key in list(doc):
+            replacements: list[Any] = [None, 42, "x", [], {"class": "Nope"}]
+            if key == "class":
+                # validate_ex expects the class field, if present, to be a string
+                replacements = ["x"]
+            for replacement in replacements:
+                variant = copy.copy(doc)
+                variant[key] = replacement
+                variants.append(variant)
+            variant = copy.copy(doc)
+            del variant[key]
+            variants.append(variant)
+        variant = copy.copy(doc)
+        variant["unknown_field"] = True
+        variant["http://example.com/foreign"] = True
+        variants.append(variant)
+    return variants
+
+
+def roots(names: Names) -> list[Schema]:
+    return [root for root in names.names.values() if root.props.get("documentRoot")]
+
+
+def check_same_verdicts(
+    caplog: pytest.LogCaptureFixture,
+    loader: Loader,
+    names: Names,
+    items: list[Any],
+    strict: bool,
+    strict_foreign_properties: bool,
+) -> None:
+    validator = compile_validator(loader, strict, strict_foreign_properties)
+    for item in items:
+        for root in roots(names):
+            caplog.clear()
+            expected = validate_ex(
+                root,
+                item,
+                loader.identifiers,
+                strict,
+                foreign_properties=loader.foreign_properties,
+                raise_ex=False,
+                skip_foreign_properties=loader.skip_schemas,
+                strict_foreign_properties=strict_foreign_properties,
+                vocab=loader.vocab,
+            )
+            expected_logs = [r.getMessage() for r in caplog.records]
+            caplog.clear()
+            assert validator.validate(root, item, loader.foreign_properties) == expected
+            assert [r.getMessage() for r in caplog.records] == expected_logs
+
+
+@pytest.fixture(scope="module")
+def cwl_documents() -> tuple[Loader, Names, list[Any]]:
+    path = get_data("tests/test_schema/CommonWorkflowLanguage.yml")
+    loader, names, _, _ = load_schema(path)
+    assert isinstance(names, Names)
+    items: list[Any] = []
+    for document in DOCUMENTS:
+        doc, _ = loader.resolve_ref(get_data(document), checklinks=False)
+        for item in doc if isinstance(doc, MutableSequence) else [doc]:
+            items.append(item)
+            items.extend(mutations(item))
+    return loader, names, items
+
+
+@pytest.mark.parametrize("strict", [True, False])
+@pytest.mark.parametrize("strict_foreign_properties", [True, False])
+def test_compiled_validator_cwl(
+    caplog: pytest.LogCaptureFixture,
+    cwl_documents: tuple[Loader, Names, list[Any]],
+    strict: bool,
+    strict_foreign_properties: bool,
+) -> None:
+    """Same verdicts and warnings as validate_ex for valid and broken CWL documents."""
+    caplog.set_level(logging.WARNING, logger="salad")
+    loader, names, items = cwl_documents
+    check_same_verdicts(caplog, loader, names, items, strict, strict_foreign_properties)
+
+
+def test_compiled_validator_metaschema(caplog: pytest.LogCaptureFixture) -> None:
+    """Same verdicts as validate_ex for the metaschema, which has recursive types."""
+    names, doc, loader = get_metaschema()
+    items: list[Any] = list(doc)
+    for item in doc:
+        items.extend(mutations(item))
+    check_same_verdicts(caplog, loader, names, items, True, False)
+
+
+def test_validate_doc_with_validator() -> None:
+    """validate_doc reports the same errors with a compiled validator."""
+    path = get_data("tests/test_schema/CommonWorkflowLanguage.yml")
+    loader, names, _, _ = load_schema(path)
+    assert isinstance(names, Names)
+    doc, _ = loader.resolve_ref(get_data(DOCUMENTS[0]))
+    validator = compile_validator(loader, True)
+    validate_doc(names, doc, loader, True, validator=validator)
+
+    assert isinstance(doc, CommentedMap)
+    broken = copy.copy(doc)
+    broken["inputs"] = 42
+    with pytest.raises(ValidationException) as expected:
+        validate_doc(names, broken, loader, True)
+    with pytest.raises(ValidationException) as compiled:
+        validate_doc(names, broken, loader, True, validator=validator)
+    assert str(compiled.value) == str(expected.value)
+
+
+def union_data(
+    expected_schema: Schema, datum: Any, found: list[tuple[UnionSchema | NamedUnionSchema, Any]]
+) -> None:
+    """Collect the (union, datum) pairs that validating the datum can come across."""
+    if isinstance(expected_schema, (UnionSchema, NamedUnionSchema)):
+        if any(u is expected_schema and d is datum for u, d in found):
+            return
+        found.append((expected_schema, datum))
+        for s in expected_schema.schemas:
+            union_data(s, datum, found)
+    elif isinstance(expected_schema, RecordSchema) and isinstance(datum, MutableMapping):
+        for f in expected_schema.fields:
+            union_data(f.type, datum.get(f.name), found)
+    elif isinstance(expected_schema, ArraySchema) and isinstance(datum, MutableSequence):
+        for d in datum:
+            union_data(expected_schema.items, d, found)
+    elif isinstance(expected_schema, (MapSchema, NamedMapSchema)) and isinstance(
+        datum, MutableMapping
+    ):
+        for d in datum.values():
+            union_data(expected_schema.values, d, found)
+
+
+def test_union_candidates(cwl_documents: tuple[Loader, Names, list[Any]]) -> None:
+    """The alternatives left out by union_candidates would all reject the datum."""
+    loader, names, items = cwl_documents
+    found: list[tuple[UnionSchema | NamedUnionSchema, Any]] = []
+    for item in items:
+        for root in roots(names):
+            union_data(root, item, found)
+    excluded = 0
+    for union, datum in found:
+        candidates = union_candidates(union, datum, loader.vocab)
+        assert [s for s in union.schemas if s in candidates] == candidates
+        for s in union.schemas:
+            if s not in candidates:
+                excluded += 1
+                assert not validate_ex(
+                    s,
+                    datum,
+                    loader.identifiers,
+                    False,
+                    foreign_properties=loader.foreign_properties,
+                    raise_ex=False,
+                    vocab=loader.vocab,
+                )
+    assert excluded > len(found)
+
+
+def test_union_alternatives_checked_once(
+    cwl_documents: tuple[Loader, Names, list[Any]], caplog: pytest.LogCaptureFixture
+) -> None:
+    """Explaining why a union rejects a value checks each alternative only once."""
+    loader, names, _ = cwl_documents
+    tool = {
+        "class": "CommandLineTool",
+        "inputs": [{"id": "#x", "type": "string", "unknown_field": True}],
+        "outputs": 42,
+    }
+    workflow = {
+        "class": "Workflow",
+        "id": "#main",
+        "inputs": [],
+        "outputs": [],
+        "steps": [{"id": "#step", "in": [], "out": [], "run": tool}],
+    }
+    root = names.get_name("org.w3id.cwl.cwl.Workflow", None)
+    assert root is not None
+    with pytest.raises(ValidationException, match="the value 42 is not a list"):
+        validate_ex(root, workflow, loader.identifiers, False, raise_ex=True, vocab=loader.vocab)
+    assert len([r for r in caplog.records if "unknown_field" in r.getMessage()]) == 1
+
+
+@pytest.mark.parametrize("strict", [True, False])
+def test_single_pass_same_errors(
+    cwl_documents: tuple[Loader, Names, list[Any]], strict: bool
+) -> None:
+    """validate_doc reports the same errors in single-pass mode."""
+    loader, names, items = cwl_documents
+    for number in range(1, 20):
+        try:
+            doc, _ = loader.resolve_ref(get_data(f"tests/test_schema/test{number}.cwl"))
+        except ValidationException:
+            continue
+        items = items + [doc]
+    rejected = 0
+    for item in items:
+        if not isinstance(item.get("id", ""), str):
+            # validate_doc expects identifiers to be strings to report an error
+            continue
+        try:
+            validate_doc(names, item, loader, strict)
+            expected = ""
+        except ValidationException as exc:
+            expected = str(exc)
+        try:
+            validate_doc(names, item, loader, strict, single_pass=True)
+            found = ""
+        except ValidationException as exc:
+            found = str(exc)
+        assert found == expected
+        rejected += bool(expected)
+    assert rejected > 0
+
+
+def test_validate_deep_document() -> None:
+    """validate_ex does not recurse into the values it validates."""
+    names = Names()
+    node = make_avsc_object(
+        {
+            "name": "Node",
+            "type": "record",
+            "fields": [
+                {"name": "label", "type": "string"},
+                {"name": "children", "type": ["null", {"type": "array", "items": "Node"}]},
+            ],
+        },
+        names,
+    )
+    leaf = CommentedMap([("label", "leaf")])
+    document = leaf
+    for _ in range(sys.getrecursionlimit() * 2):
+        document = CommentedMap([("label", "node"), ("children", [document])])
+    assert validate_ex(node, document, vocab={})
+    assert validate_ex(node, document, raise_ex=False, vocab={})
+
+    leaf["label"] = 1
+    assert not validate_ex(node, document, raise_ex=False, vocab={})
+    with pytest.raises(ValidationException) as exc:
+        validate_ex(node, document, vocab={})
+    error: SchemaSaladException = exc.value
+    while error.children:
+        error = error.children[0]
+    assert error.message == "the value is not string"
+
+
+def test_validate_doc_replaced_vocab() -> None:
+    """A validator is not used with a vocabulary the loader has replaced since."""
+    path = get_data("tests/test_schema/CommonWorkflowLanguage.yml")
+    loader, names, _, _ = load_schema(path)
+    assert isinstance(names, Names)
+    doc, _ = loader.resolve_ref(get_data(DOCUMENTS[0]))
+    assert isinstance(doc, CommentedMap)
+    validator = compile_validator(loader, True)
+    loader._own_context()
+    assert validator.vocab is not loader.vocab
+    loader.vocab["MyTool"] = loader.vocab["CommandLineTool"]
+    renamed = copy.copy(doc)
+    renamed["class"] = "MyTool"
+    validate_doc(names, renamed, loader, True)
+    validate_doc(names, renamed, loader, True, validator=validator)
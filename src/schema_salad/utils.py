@@ -1,15 +1,26 @@
+import copy
 import json
 import os
 import sys
+import tempfile
+import threading
 from collections.abc import Callable, Iterable, Mapping, MutableSequence
 from io import BufferedWriter
-from typing import IO, TYPE_CHECKING, Any, Final, Optional, TypeAlias, TypeVar, Union
+from typing import IO, TYPE_CHECKING, Any, Final, Optional, TypeAlias, TypeVar, Union, cast
 
 import requests
 from rdflib.graph import Graph
-from ruamel.yaml.comments import CommentedMap, CommentedSeq
+from ruamel.yaml.anchor import Anchor
+from ruamel.yaml.comments import Comment, CommentedMap, CommentedSeq, Format, merge_attrib
 from ruamel.yaml.constructor import RoundTripConstructor
 from ruamel.yaml.main import YAML
+from ruamel.yaml.resolver import implicit_resolvers
+from ruamel.yaml.tag import Tag
+
+try:
+    from yaml import CSafeLoader  # type: ignore[import-untyped]
+except ImportError:  # PyYAML is not installed, or was built without libyaml
+    CSafeLoader = None
 
 if TYPE_CHECKING:
     from .fetcher import Fetcher
@@ -75,6 +86,11 @@ def flatten(thing: Any, ltypes: Any = (list, tuple)) -> Any:
     return ltype(lst)
 
 
+def cache_dir() -> str:
+    """Return the directory used for schema-salad's on-disk caches."""
+    return os.path.join(os.environ.get("HOME", tempfile.gettempdir()), ".cache", "salad")
+
+
 def onWindows() -> bool:
     """Check if Python is running on Windows OS."""
     return os.name == "nt"
@@ -130,3 +146,211 @@ def yaml_no_ts() -> YAML:
     yaml.preserve_quotes = True  # type: ignore
     yaml.Constructor = _RoundTripNoTimeStampConstructor
     return yaml
+
+
+_yaml_pool: Final = threading.local()
+
+
+def pooled_yaml_no_ts() -> YAML:
+    """
+    Get this thread's shared yaml_no_ts() loader, reset for a new document.
+
+    Cheaper than yaml_no_ts() when parsing many small documents. Do not change
+    its settings, and finish or close() a load_all() before calling this again.
+    """
+    yaml: YAML | None = getattr(_yaml_pool, "yaml", None)
+    if yaml is None:
+        yaml = yaml_no_ts()
+        _yaml_pool.yaml = yaml
+        return yaml
+    # load() leaves the reader, scanner and parser ready for the next document,
+    # even after an error, but not the constructor, nor the list of documents
+    yaml.doc_infos = []
+    constructor: Final = yaml.constructor
+    constructor.constructed_objects = {}
+    constructor.recursive_objects = {}
+    constructor.state_generators = []
+    constructor.deep_construct = False
+    return yaml
+
+
+def _construct_int(loader: Any, node: Any) -> int:
+    # YAML 1.2 integers: a leading zero does not make them octal
+    value = str(loader.construct_scalar(node)).replace("_", "")
+    sign = -1 if value.startswith("-") else 1
+    value = value.lstrip("+-")
+    if value.startswith("0b"):
+        return sign * int(value[2:], 2)
+    if value.startswith("0o"):
+        return sign * int(value[2:], 8)
+    if value.startswith("0x"):
+        return sign * int(value[2:], 16)
+    return sign * int(value)
+
+
+def _construct_map(loader: Any, node: Any) -> CommentedMap:
+    loader.flatten_mapping(node)
+    data: Final = CommentedMap()
+    data.lc.line = node.start_mark.line
+    data.lc.col = node.start_mark.column
+    for key_node, value_node in node.value:
+        key = loader.construct_object(key_node, deep=True)
+        if key in data:
+            raise ValueError(f"Duplicate key {key!r}")
+        data[key] = loader.construct_object(value_node, deep=True)
+        data.lc.add_kv_line_col(
+            key,
+            [
+                key_node.start_mark.line,
+                key_node.start_mark.column,
+                value_node.start_mark.line,
+                value_node.start_mark.column,
+            ],
+        )
+    return data
+
+
+def _construct_seq(loader: Any, node: Any) -> CommentedSeq:
+    data: Final = CommentedSeq()
+    data.lc.line = node.start_mark.line
+    data.lc.col = node.start_mark.column
+    for item_node in node.value:
+        data.lc.add_kv_line_col(len(data), [item_node.start_mark.line, item_node.start_mark.column])
+        data.append(loader.construct_object(item_node, deep=True))
+    return data
+
+
+def _fast_loader() -> Any:
+    if CSafeLoader is None:
+        return None
+    loader: Final[Any] = type("_FastLoader", (CSafeLoader,), {"yaml_implicit_resolvers": {}})
+    for versions, tag, regexp, first in implicit_resolvers:
+        if (1, 2) in versions and tag.rsplit(":", 1)[1] not in ("timestamp", "value", "yaml"):
+            loader.add_implicit_resolver(tag, regexp, first)
+    loader.add_constructor("tag:yaml.org,2002:int", _construct_int)
+    loader.add_constructor("tag:yaml.org,2002:timestamp", loader.construct_scalar)
+    loader.add_constructor("tag:yaml.org,2002:map", _construct_map)
+    loader.add_constructor("tag:yaml.org,2002:seq", _construct_seq)
+    return loader
+
+
+_FastLoader: Final = _fast_loader()
+fast_yaml_available: Final = _FastLoader is not None
+
+
+def yaml_fast_load(text: str) -> Any:
+    """
+    Parse YAML (or JSON) text with libyaml, much faster than yaml_no_ts().
+
+    The result has the same values, with the same line and column data, as
+    yaml_no_ts() would give, but no comments or scalar styles. Raise an
+    exception if libyaml is not available or if the text is invalid or uses
+    something this parser does not handle the same way (duplicate or merged
+    keys, custom tags): the caller is expected to parse it again with
+    yaml_no_ts(), which also reports the errors with their location.
+    """
+    if _FastLoader is None:
+        raise ValueError("Fast YAML parsing needs PyYAML with libyaml")
+    loader: Final = _FastLoader(text)
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
+
+
+_YAML_ATTRIBUTES: Final = (Comment.attrib, Format.attrib, Anchor.attrib, Tag.attrib)
+
+
+def copy_yaml_tree(node: Any, memo: dict[int, Any] | None = None) -> Any:
+    """
+    Copy a round-trip YAML document, with its line and column data.
+
+    Much faster than copy.deepcopy for the plain maps and sequences that
+    make up most documents; other nodes are left to copy.deepcopy.
+    """
+    if not isinstance(node, (CommentedMap, CommentedSeq)):
+        return node
+    if memo is None:
+        memo = {}
+    found: Final = memo.get(id(node))
+    if found is not None:
+        return found
+    if type(node) is CommentedMap and not getattr(node, merge_attrib, None):
+        new_map: Final = CommentedMap()
+        memo[id(node)] = new_map
+        for key, value in node.items():
+            new_map[key] = copy_yaml_tree(value, memo)
+        new: CommentedMap | CommentedSeq = new_map
+    elif type(node) is CommentedSeq:
+        new_seq: Final = CommentedSeq()
+        memo[id(node)] = new_seq
+        new_seq.extend(copy_yaml_tree(value, memo) for value in node)
+        new = new_seq
+    else:
+        return copy.deepcopy(node, memo)
+    new.lc.line = node.lc.line
+    new.lc.col = node.lc.col
+    if node.lc.data is not None:
+        new.lc.data = {key: list(position) for key, position in node.lc.data.items()}
+    for attrib in _YAML_ATTRIBUTES:
+        if hasattr(node, attrib):
+            setattr(new, attrib, copy.deepcopy(getattr(node, attrib)))
+    return new
+
+
+class ParsedDocuments:
+    """
+    Parsed YAML documents, keyed by the SHA-256 of their text.
+
+    Shared by all the Loaders of a process, so a document imported by many
+    others is parsed once. The least recently used documents are dropped
+    once their texts add up to more than ``max_bytes``. A parsed document
+    takes many times the size of its text: ``max_bytes`` is a bound on the
+    number of documents kept, not on the memory they use.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Create an empty ParsedDocuments cache."""
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.documents: dict[str, tuple[CommentedMap | CommentedSeq, int]] = {}
+        self.lock: Final = threading.Lock()
+
+    def get(self, checksum: str) -> CommentedMap | CommentedSeq | None:
+        """Return a copy of the document with the given checksum, if there is one."""
+        with self.lock:
+            entry: Final = self.documents.pop(checksum, None)
+            if entry is None:
+                return None
+            self.documents[checksum] = entry
+        return cast(CommentedMap | CommentedSeq, copy_yaml_tree(entry[0]))
+
+    def put(self, checksum: str, document: CommentedMap | CommentedSeq, size: int) -> None:
+        """Keep a document, which must not be modified afterwards."""
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            previous: Final = self.documents.pop(checksum, None)
+            if previous is not None:
+                self.size -= previous[1]
+            self.documents[checksum] = (document, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                oldest = next(iter(self.documents))
+                self.size -= self.documents.pop(oldest)[1]
+
+    def clear(self) -> None:
+        """Drop all the documents."""
+        with self.lock:
+            self.documents.clear()
+            self.size = 0
+
+
+parsed_documents: Final = ParsedDocuments(0)
+"""
+The documents parsed by :py:meth:`schema_salad.ref_resolver.Loader.fetch`.
+
+Off by default: set its ``max_bytes`` to keep them, for instance to
+``64 * 1024 * 1024`` in a process that loads many documents importing the
+same ones.
+"""
@@ -1,13 +1,15 @@
 import logging
 import pprint
-from collections.abc import Mapping, MutableMapping, MutableSequence
-from typing import Any, Final
+import sys
+from collections.abc import Callable, Generator, Mapping, MutableMapping, MutableSequence
+from typing import Any, Final, NamedTuple, cast
 from urllib.parse import urlsplit
 
 from . import avro
 from .avro.schema import Schema
 from .exceptions import (
     ClassValidationException,
+    LazyMessage,
     SchemaSaladException,
     ValidationException,
 )
@@ -67,6 +69,12 @@ primitives: Final = {
 }
 
 
+NAME_CACHE_SIZE: Final = 65536
+"""How many URLs the caches of names computed from URLs hold before being reset."""
+
+_avro_type_names: Final[dict[str, str]] = {}
+
+
 def avro_type_name(url: str) -> str:
     """
     Turn a URL into an Avro-safe name.
@@ -77,15 +85,21 @@ def avro_type_name(url: str) -> str:
     the whole fragment.
     """
 
-    if url in primitives:
-        return primitives[url]
-
-    u: Final = urlsplit(url)
-    joined: Final = filter(
-        lambda x: x,
-        list(reversed(u.netloc.split("."))) + u.path.split("/") + u.fragment.split("/"),
-    )
-    return ".".join(joined)
+    name = _avro_type_names.get(url)
+    if name is None:
+        if url in primitives:
+            name = primitives[url]
+        else:
+            u: Final = urlsplit(url)
+            joined: Final = filter(
+                lambda x: x,
+                list(reversed(u.netloc.split("."))) + u.path.split("/") + u.fragment.split("/"),
+            )
+            name = sys.intern(".".join(joined))
+        if len(_avro_type_names) >= NAME_CACHE_SIZE:
+            _avro_type_names.clear()  # unlike evicting one entry, safe from any thread
+        _avro_type_names[url] = name
+    return name
 
 
 def friendly(v: Any) -> Any:
@@ -111,6 +125,180 @@ def vpformat(datum: Any) -> str:
     return a
 
 
+def _may_accept(expected_schema: Schema, datum_type: type) -> bool:
+    """Tell if some value of the given Python type could be valid for this schema."""
+    schema_type: Final = expected_schema.type
+    if schema_type == "null":
+        return datum_type is type(None)
+    if schema_type == "boolean":
+        return issubclass(datum_type, bool)
+    if schema_type == "string":
+        return issubclass(datum_type, (str, bytes))
+    if schema_type in ("int", "long"):
+        return issubclass(datum_type, int)
+    if schema_type in ("float", "double"):
+        return issubclass(datum_type, (int, float))
+    if isinstance(expected_schema, avro.schema.EnumSchema):
+        if expected_schema.name in ("org.w3id.cwl.salad.Any", "Any"):
+            return datum_type is not type(None)
+        return issubclass(datum_type, str)
+    if isinstance(expected_schema, avro.schema.ArraySchema):
+        return issubclass(datum_type, MutableSequence)
+    if isinstance(expected_schema, (avro.schema.UnionSchema, avro.schema.NamedUnionSchema)):
+        return any(_may_accept(s, datum_type) for s in expected_schema.schemas)
+    if isinstance(
+        expected_schema,
+        (avro.schema.RecordSchema, avro.schema.MapSchema, avro.schema.NamedMapSchema),
+    ):
+        return issubclass(datum_type, MutableMapping)
+    return False
+
+
+class _Alternative(NamedTuple):
+    """What a datum must look like to possibly be valid for one alternative of a union."""
+
+    schema: Schema
+    class_name: str | None
+    """The record name, if the record has a ``class`` field."""
+    required: tuple[str, ...]
+    """Fields that must be present."""
+    keys: tuple[tuple[str, frozenset[str]], ...]
+    """Fields that, if present, must have one of the given enum symbols as value."""
+
+
+def _alternative(expected_schema: Schema) -> _Alternative:
+    class_name = None
+    required: Final[list[str]] = []
+    keys: Final[list[tuple[str, frozenset[str]]]] = []
+    if isinstance(expected_schema, avro.schema.RecordSchema):
+        for f in expected_schema.fields:
+            if f.name == "class":
+                if class_name is None:
+                    class_name = expected_schema.name
+                continue
+            if f.default is None and not _may_accept(f.type, type(None)):
+                required.append(f.name)
+            if isinstance(f.type, avro.schema.EnumSchema) and f.type.name not in (
+                "org.w3id.cwl.salad.Any",
+                "Any",
+                "org.w3id.cwl.cwl.Expression",
+            ):
+                keys.append((f.name, frozenset(f.type.symbols)))
+    return _Alternative(expected_schema, class_name, tuple(required), tuple(keys))
+
+
+def _class_matches(name: str, d: Any, vocab: Mapping[str, str]) -> bool:
+    """Check the value of a ``class`` field like :py:func:`validate_ex` does."""
+    if not d:
+        return False
+    avroname = None
+    if d in vocab:
+        avroname = avro_type_name(vocab[d])
+    elif ":" in d:
+        prefix = d.split(":")[0]
+        if prefix in vocab:
+            d = vocab[prefix] + d[len(prefix) + 1 :]
+            if d in vocab:
+                avroname = avro_type_name(vocab[d])
+    return name in (d, avroname)
+
+
+def union_candidates(
+    expected_schema: avro.schema.UnionSchema | avro.schema.NamedUnionSchema,
+    datum: Any,
+    vocab: Mapping[str, str],
+) -> list[Schema]:
+    """
+    Return the alternatives of a union that might accept the datum, in order.
+
+    The others would certainly be rejected: they do not accept the Python
+    type of the datum or, for a mapping, the ``class``, a required field
+    or the symbol in an enum field does not fit. The alternatives for each
+    Python type are indexed on the union the first time they are needed.
+    """
+    datum_type: Final = type(datum)
+    alternatives = expected_schema.candidates.get(datum_type)
+    if alternatives is None:
+        alternatives = [
+            _alternative(s) for s in expected_schema.schemas if _may_accept(s, datum_type)
+        ]
+        expected_schema.candidates[datum_type] = alternatives
+    if not isinstance(datum, MutableMapping):
+        return [alt.schema for alt in alternatives]
+    class_value: Final = datum.get("class")
+    found: Final[list[Schema]] = []
+    for alt in alternatives:
+        if alt.class_name is not None and (
+            not class_value
+            or (
+                isinstance(class_value, str)
+                and not _class_matches(alt.class_name, class_value, vocab)
+            )
+        ):
+            continue
+        if not all(field in datum for field in alt.required):
+            continue
+        if any(
+            field in datum and not (isinstance(datum[field], str) and datum[field] in symbols)
+            for field, symbols in alt.keys
+        ):
+            continue
+        found.append(alt.schema)
+    return found
+
+
+def _unrecognized_extension_field(
+    field: str, sl: SourceLine, foreign_properties: set[str], strict_foreign_properties: bool
+) -> ValidationException:
+    return ValidationException(
+        "unrecognized extension field {!r}{}.{}".format(
+            field,
+            (
+                " and strict_foreign_properties checking is enabled"
+                if strict_foreign_properties
+                else ""
+            ),
+            (
+                "\nForeign properties from $schemas:\n  {}".format(
+                    "\n  ".join(sorted(foreign_properties))
+                )
+                if len(foreign_properties) > 0
+                else ""
+            ),
+        ),
+        sl,
+    )
+
+
+def _invalid_field(
+    field: str, sl: SourceLine, expected_schema: avro.schema.RecordSchema
+) -> ValidationException:
+    return ValidationException(
+        "invalid field {!r}, expected one of: {}".format(
+            field,
+            ", ".join(f"{fn.name!r}" for fn in expected_schema.fields),
+        ),
+        sl,
+    )
+
+
+def _value_message(template: str, datum: Any, *schemas: Any) -> str:
+    return template.format(vpformat(datum), *(friendly(s) for s in schemas))
+
+
+def _type_message(datum: Any, expected_schema: Schema) -> str:
+    return f"value is a {type(datum).__name__}, expected {friendly(expected_schema)}"
+
+
+def _symbol_message(datum: Any, expected_schema: avro.schema.EnumSchema) -> str:
+    return "the value {} is not a valid {}, expected {}{}".format(
+        vpformat(datum),
+        friendly(expected_schema.name),
+        "one of " if len(expected_schema.symbols) > 1 else "",
+        "'" + "', '".join(expected_schema.symbols) + "'",
+    )
+
+
 def validate_ex(
     expected_schema: Schema,
     datum: Any,
@@ -124,16 +312,67 @@ def validate_ex(
     vocab: Mapping[str, str] | None = None,
 ) -> bool:
     """Determine if a python datum is an instance of a schema."""
-    debug: Final = _logger.isEnabledFor(logging.DEBUG)
     if not identifiers:
         identifiers = []
 
-    if not foreign_properties:
-        foreign_properties = set()
-
     if vocab is None:
         raise Exception("vocab must be provided")
 
+    valid = _validate_scalar(expected_schema, datum, raise_ex)
+    if valid is not None:
+        return valid
+
+    # Walk the datum with an explicit stack of the values being validated,
+    # so deeply nested documents do not hit the recursion limit. Each one
+    # yields its parts to validate, and gets back their verdict or gets the
+    # error raised by validating them.
+    options: Final = _Options(
+        identifiers, strict, strict_foreign_properties, logger, skip_foreign_properties, vocab
+    )
+    stack: Final = [
+        _validate_ex(expected_schema, datum, foreign_properties or set(), raise_ex, options)
+    ]
+    error: Exception | None = None
+    while True:
+        walker = stack[-1]
+        try:
+            if error is not None:
+                thrown, error = error, None
+                request = walker.throw(thrown)
+            elif valid is not None:
+                request = walker.send(valid)
+            else:
+                request = next(walker)
+        except StopIteration as stop:
+            stack.pop()
+            if not stack:
+                return cast(bool, stop.value)
+            valid = stop.value
+            continue
+        except Exception as e:
+            stack.pop()
+            if not stack:
+                raise
+            error = e
+            valid = None
+            continue
+        item_schema, item, item_foreign_properties, item_raise_ex = request
+        # most values are strings and numbers, checked without a walker of their own
+        try:
+            valid = _validate_scalar(item_schema, item, item_raise_ex)
+        except Exception as e:
+            error = e
+            continue
+        if valid is None:
+            stack.append(
+                _validate_ex(
+                    item_schema, item, item_foreign_properties or set(), item_raise_ex, options
+                )
+            )
+
+
+def _validate_scalar(expected_schema: Schema, datum: Any, raise_ex: bool) -> bool | None:
+    """Validate a value against a primitive or enum schema, or return None for other schemas."""
     schema_type: Final = expected_schema.type
 
     if schema_type == "null":
@@ -160,19 +399,23 @@ def validate_ex(
         if isinstance(datum, int) and INT_MIN_VALUE <= datum <= INT_MAX_VALUE:
             return True
         if raise_ex:
-            raise ValidationException(f"{vpformat(datum)!r} is not int")
+            raise ValidationException(LazyMessage(_value_message, "{!r} is not int", datum))
         return False
     if schema_type == "long":
         if (isinstance(datum, int)) and LONG_MIN_VALUE <= datum <= LONG_MAX_VALUE:
             return True
         if raise_ex:
-            raise ValidationException(f"the value {vpformat(datum)!r} is not long")
+            raise ValidationException(
+                LazyMessage(_value_message, "the value {!r} is not long", datum)
+            )
         return False
     if schema_type in ["float", "double"]:
         if isinstance(datum, (int, float)):
             return True
         if raise_ex:
-            raise ValidationException(f"the value {vpformat(datum)!r} is not float or double")
+            raise ValidationException(
+                LazyMessage(_value_message, "the value {!r} is not float or double", datum)
+            )
         return False
     if isinstance(expected_schema, avro.schema.EnumSchema):
         if expected_schema.name in ("org.w3id.cwl.salad.Any", "Any"):
@@ -198,63 +441,78 @@ def validate_ex(
         if datum in expected_schema.symbols:
             return True
         if raise_ex:
-            raise ValidationException(
-                "the value {} is not a valid {}, expected {}{}".format(
-                    vpformat(datum),
-                    friendly(expected_schema.name),
-                    "one of " if len(expected_schema.symbols) > 1 else "",
-                    "'" + "', '".join(expected_schema.symbols) + "'",
-                )
-            )
+            raise ValidationException(LazyMessage(_symbol_message, datum, expected_schema))
         return False
+    return None
+
+
+class _Options(NamedTuple):
+    """The options of :py:func:`validate_ex` that are the same at every level."""
+
+    identifiers: list[str]
+    strict: bool
+    strict_foreign_properties: bool
+    logger: logging.Logger
+    skip_foreign_properties: bool
+    vocab: Mapping[str, str]
+
+
+def _validate_ex(
+    expected_schema: Schema,
+    datum: Any,
+    foreign_properties: set[str],
+    raise_ex: bool,
+    options: _Options,
+) -> Generator[tuple[Schema, Any, set[str] | None, bool], bool, bool]:
+    """Validate a value for :py:func:`validate_ex`, yielding the parts to validate."""
+    debug: Final = _logger.isEnabledFor(logging.DEBUG)
+    identifiers: Final = options.identifiers
+    strict: Final = options.strict
+    strict_foreign_properties: Final = options.strict_foreign_properties
+    logger: Final = options.logger
+    skip_foreign_properties: Final = options.skip_foreign_properties
+    vocab: Final = options.vocab
+
     if isinstance(expected_schema, avro.schema.ArraySchema):
         if isinstance(datum, MutableSequence):
             for i, d in enumerate(datum):
                 try:
-                    sl = SourceLine(datum, i, ValidationException)
-                    if not validate_ex(
-                        expected_schema.items,
-                        d,
-                        identifiers,
-                        strict=strict,
-                        foreign_properties=foreign_properties,
-                        raise_ex=raise_ex,
-                        strict_foreign_properties=strict_foreign_properties,
-                        logger=logger,
-                        skip_foreign_properties=skip_foreign_properties,
-                        vocab=vocab,
-                    ):
+                    if not (yield (expected_schema.items, d, foreign_properties, raise_ex)):
                         return False
                 except ValidationException as v:
                     if raise_ex:
                         source = v if debug else None
+                        sl = SourceLine(datum, i, ValidationException)
                         raise ValidationException("item is invalid because", sl, [v]) from source
                     return False
             return True
         if raise_ex:
             raise ValidationException(
-                f"the value {vpformat(datum)} is not a list, "
-                f"expected list of {friendly(expected_schema.items)}"
+                LazyMessage(
+                    _value_message,
+                    "the value {} is not a list, expected list of {}",
+                    datum,
+                    expected_schema.items,
+                )
             )
         return False
     if isinstance(expected_schema, (avro.schema.UnionSchema, avro.schema.NamedUnionSchema)):
-        for s in expected_schema.schemas:
-            if validate_ex(
-                s,
-                datum,
-                identifiers,
-                strict=strict,
-                raise_ex=False,
-                strict_foreign_properties=strict_foreign_properties,
-                logger=logger,
-                skip_foreign_properties=skip_foreign_properties,
-                vocab=vocab,
-            ):
-                return True
-
         if not raise_ex:
+            for s in union_candidates(expected_schema, datum, vocab):
+                if (yield (s, datum, None, False)):
+                    return True
             return False
 
+        # each alternative is tried once, keeping why it does not match
+        tried: Final[dict[int, ValidationException]] = {}
+        for s in union_candidates(expected_schema, datum, vocab):
+            try:
+                (yield (s, datum, None, True))
+            except ValidationException as e:
+                tried[id(s)] = e
+                continue
+            return True
+
         errors1: Final[list[SchemaSaladException]] = []
         checked: Final = []
         for s in expected_schema.schemas:
@@ -278,19 +536,15 @@ def validate_ex(
                 continue
 
             checked.append(s)
+            error = tried.get(id(s))
+            if error is not None and not foreign_properties:
+                if isinstance(error, ClassValidationException):
+                    raise error
+                errors1.append(error)
+                continue
+            # not tried yet, or the foreign properties change what is reported
             try:
-                validate_ex(
-                    s,
-                    datum,
-                    identifiers,
-                    strict=strict,
-                    foreign_properties=foreign_properties,
-                    raise_ex=True,
-                    strict_foreign_properties=strict_foreign_properties,
-                    logger=logger,
-                    skip_foreign_properties=skip_foreign_properties,
-                    vocab=vocab,
-                )
+                (yield (s, datum, foreign_properties, True))
             except ClassValidationException:
                 raise
             except ValidationException as e:
@@ -305,9 +559,7 @@ def validate_ex(
                 ],
                 "-",
             )
-        raise ValidationException(
-            f"value is a {type(datum).__name__}, expected {friendly(expected_schema)}"
-        )
+        raise ValidationException(LazyMessage(_type_message, datum, expected_schema))
 
     if isinstance(expected_schema, avro.schema.RecordSchema):
         if not isinstance(datum, MutableMapping):
@@ -318,30 +570,28 @@ def validate_ex(
             return False
 
         classmatch = None
-        for f in expected_schema.fields:
-            if f.name in ("class",):
-                d = datum.get(f.name)
-                if not d:
-                    if raise_ex:
-                        raise ValidationException(f"Missing {f.name!r} field")
-                    return False
-                avroname = None
-                if d in vocab:
-                    avroname = avro_type_name(vocab[d])
-                elif ":" in d:
-                    prefix = d.split(":")[0]
-                    if prefix in vocab:
-                        d = vocab[prefix] + d[len(prefix) + 1 :]
-                        if d in vocab:
-                            avroname = avro_type_name(vocab[d])
-                if expected_schema.name not in (d, avroname):
-                    if raise_ex:
-                        raise ValidationException(
-                            f"Expected class {expected_schema.name!r} but this is {d!r}"
-                        )
-                    return False
-                classmatch = d
-                break
+        if "class" in expected_schema.field_names:
+            d = datum.get("class")
+            if not d:
+                if raise_ex:
+                    raise ValidationException("Missing 'class' field")
+                return False
+            avroname = None
+            if d in vocab:
+                avroname = avro_type_name(vocab[d])
+            elif ":" in d:
+                prefix = d.split(":")[0]
+                if prefix in vocab:
+                    d = vocab[prefix] + d[len(prefix) + 1 :]
+                    if d in vocab:
+                        avroname = avro_type_name(vocab[d])
+            if expected_schema.name not in (d, avroname):
+                if raise_ex:
+                    raise ValidationException(
+                        f"Expected class {expected_schema.name!r} but this is {d!r}"
+                    )
+                return False
+            classmatch = d
 
         errors2: Final = []
         for f in expected_schema.fields:
@@ -357,19 +607,7 @@ def validate_ex(
                     fieldval = None
 
             try:
-                sl = SourceLine(datum, f.name, str)
-                if not validate_ex(
-                    f.type,
-                    fieldval,
-                    identifiers,
-                    strict=strict,
-                    foreign_properties=foreign_properties,
-                    raise_ex=raise_ex,
-                    strict_foreign_properties=strict_foreign_properties,
-                    logger=logger,
-                    skip_foreign_properties=skip_foreign_properties,
-                    vocab=vocab,
-                ):
+                if not (yield (f.type, fieldval, foreign_properties, raise_ex)):
                     return False
             except ValidationException as v:
                 if f.name not in datum:
@@ -378,17 +616,13 @@ def validate_ex(
                     errors2.append(
                         ValidationException(
                             f"the {f.name!r} field is not valid because",
-                            sl,
+                            SourceLine(datum, f.name, str),
                             [v],
                         )
                     )
 
         for d in datum:
-            found = False
-            for f in expected_schema.fields:
-                if d == f.name:
-                    found = True
-            if not found:
+            if d not in expected_schema.field_names:
                 sl = SourceLine(datum, d, str)
                 if d is None:
                     err = ValidationException("mapping with implicit null key", sl)
@@ -411,36 +645,15 @@ def validate_ex(
                     split = urlsplit(d)
                     if split.scheme:
                         if not skip_foreign_properties:
-                            err = ValidationException(
-                                "unrecognized extension field {!r}{}.{}".format(
-                                    d,
-                                    (
-                                        " and strict_foreign_properties checking is enabled"
-                                        if strict_foreign_properties
-                                        else ""
-                                    ),
-                                    (
-                                        "\nForeign properties from $schemas:\n  {}".format(
-                                            "\n  ".join(sorted(foreign_properties))
-                                        )
-                                        if len(foreign_properties) > 0
-                                        else ""
-                                    ),
-                                ),
-                                sl,
+                            err = _unrecognized_extension_field(
+                                d, sl, foreign_properties, strict_foreign_properties
                             )
                             if strict_foreign_properties:
                                 errors2.append(err)
                             elif len(foreign_properties) > 0:
                                 logger.warning(err.as_warning())
                     else:
-                        err = ValidationException(
-                            "invalid field {!r}, expected one of: {}".format(
-                                d,
-                                ", ".join(f"{fn.name!r}" for fn in expected_schema.fields),
-                            ),
-                            sl,
-                        )
+                        err = _invalid_field(d, sl, expected_schema)
                         if strict:
                             errors2.append(err)
                         else:
@@ -460,33 +673,279 @@ def validate_ex(
                 if not isinstance(key, str):
                     pass
                 try:
-                    sl = SourceLine(datum, key, ValidationException)
-                    if not validate_ex(
-                        expected_schema.values,
-                        val,
-                        identifiers,
-                        strict=strict,
-                        foreign_properties=foreign_properties,
-                        raise_ex=raise_ex,
-                        strict_foreign_properties=strict_foreign_properties,
-                        logger=logger,
-                        skip_foreign_properties=skip_foreign_properties,
-                        vocab=vocab,
-                    ):
+                    if not (yield (expected_schema.values, val, foreign_properties, raise_ex)):
                         return False
                 except ValidationException as v:
                     if raise_ex:
                         source = v if debug else None
+                        sl = SourceLine(datum, key, ValidationException)
                         raise ValidationException("item is invalid because", sl, [v]) from source
                     return False
             return True
         if raise_ex:
             raise ValidationException(
-                f"the value {vpformat(datum)} is not an object, "
-                f"expected object of {friendly(expected_schema.values)}"
+                LazyMessage(
+                    _value_message,
+                    "the value {} is not an object, expected object of {}",
+                    datum,
+                    expected_schema.values,
+                )
             )
         return False
 
     if raise_ex:
-        raise ValidationException(f"Unrecognized schema_type {schema_type}")
+        raise ValidationException(f"Unrecognized schema_type {expected_schema.type}")
     return False
+
+
+CheckType = Callable[[Any, set[str]], bool]
+"""A compiled check: ``check(datum, foreign_properties)``."""
+
+_NO_FOREIGN_PROPERTIES: Final[set[str]] = set()
+
+
+class CompiledValidator:
+    """
+    Specialized equivalent of ``validate_ex(..., raise_ex=False)``.
+
+    Each schema is turned once into a closure with the type dispatch already
+    done and the field names, defaults and enum symbols precomputed; union
+    alternatives are narrowed down with :py:func:`union_candidates`. The verdicts,
+    and the warnings that are logged, are the same as :py:func:`validate_ex`
+    with the same options. ``identifiers`` and ``vocab`` are used by reference:
+    the validator follows the changes made to them in place, but not their
+    replacement by the loader they came from, as when it stops sharing its
+    context; :py:func:`schema.validate_doc` then makes a new validator.
+    """
+
+    def __init__(
+        self,
+        identifiers: list[str],
+        vocab: Mapping[str, str],
+        strict: bool = False,
+        strict_foreign_properties: bool = False,
+        skip_foreign_properties: bool = False,
+        logger: logging.Logger = _logger,
+    ) -> None:
+        """Create an empty validator; schemas are compiled on first use."""
+        self.identifiers: Final = identifiers
+        self.vocab: Final = vocab
+        self.strict: Final = strict
+        self.strict_foreign_properties: Final = strict_foreign_properties
+        self.skip_foreign_properties: Final = skip_foreign_properties
+        self.logger: Final = logger
+        # keyed by id(); the schemas are kept alive so that their ids stay unique
+        self._checks: Final[dict[int, CheckType]] = {}
+        self._schemas: Final[list[Schema]] = []
+
+    def validate(
+        self, expected_schema: Schema, datum: Any, foreign_properties: set[str] | None = None
+    ) -> bool:
+        """Determine if a python datum is an instance of a schema."""
+        return self.compile(expected_schema)(datum, foreign_properties or _NO_FOREIGN_PROPERTIES)
+
+    def compile(self, expected_schema: Schema) -> CheckType:
+        """Return the check function for a schema, building it if needed."""
+        check = self._checks.get(id(expected_schema))
+        if check is not None:
+            return check
+        # Composite schemas register their closure before compiling their
+        # children, so that recursive types refer back to it.
+        schema_type: Final = expected_schema.type
+        if schema_type == "null":
+            check = _check_null
+        elif schema_type == "boolean":
+            check = _check_boolean
+        elif schema_type == "string":
+            check = _check_string
+        elif schema_type == "int":
+            check = _check_int
+        elif schema_type == "long":
+            check = _check_long
+        elif schema_type in ("float", "double"):
+            check = _check_number
+        elif isinstance(expected_schema, avro.schema.EnumSchema):
+            check = _compile_enum(expected_schema)
+        elif isinstance(expected_schema, avro.schema.ArraySchema):
+            return self._compile_array(expected_schema)
+        elif isinstance(expected_schema, (avro.schema.UnionSchema, avro.schema.NamedUnionSchema)):
+            return self._compile_union(expected_schema)
+        elif isinstance(expected_schema, avro.schema.RecordSchema):
+            return self._compile_record(expected_schema)
+        elif isinstance(expected_schema, (avro.schema.MapSchema, avro.schema.NamedMapSchema)):
+            return self._compile_map(expected_schema, expected_schema.values)
+        else:
+            check = _check_nothing
+        self._register(expected_schema, check)
+        return check
+
+    def _register(self, expected_schema: Schema, check: CheckType) -> None:
+        self._checks[id(expected_schema)] = check
+        self._schemas.append(expected_schema)
+
+    def _compile_array(self, expected_schema: avro.schema.ArraySchema) -> CheckType:
+        items: Final[list[CheckType]] = []
+
+        def check(datum: Any, foreign_properties: set[str]) -> bool:
+            if not isinstance(datum, MutableSequence):
+                return False
+            item_check = items[0]
+            for d in datum:
+                if not item_check(d, foreign_properties):
+                    return False
+            return True
+
+        self._register(expected_schema, check)
+        items.append(self.compile(expected_schema.items))
+        return check
+
+    def _compile_map(self, expected_schema: Schema, values_schema: Schema) -> CheckType:
+        values: Final[list[CheckType]] = []
+
+        def check(datum: Any, foreign_properties: set[str]) -> bool:
+            if not isinstance(datum, MutableMapping):
+                return False
+            value_check = values[0]
+            for val in datum.values():
+                if not value_check(val, foreign_properties):
+                    return False
+            return True
+
+        self._register(expected_schema, check)
+        values.append(self.compile(values_schema))
+        return check
+
+    def _compile_union(
+        self, expected_schema: avro.schema.UnionSchema | avro.schema.NamedUnionSchema
+    ) -> CheckType:
+        checks: Final = self._checks
+        vocab: Final = self.vocab
+
+        def check(datum: Any, foreign_properties: set[str]) -> bool:
+            # like validate_ex, the alternatives are tried without the foreign properties
+            for s in union_candidates(expected_schema, datum, vocab):
+                if checks[id(s)](datum, _NO_FOREIGN_PROPERTIES):
+                    return True
+            return False
+
+        self._register(expected_schema, check)
+        for s in expected_schema.schemas:
+            self.compile(s)
+        return check
+
+    def _compile_record(self, expected_schema: avro.schema.RecordSchema) -> CheckType:
+        name: Final = expected_schema.name
+        field_names: Final = expected_schema.field_names
+        has_class: Final = "class" in field_names
+        fields: Final[list[tuple[str, Any, CheckType]]] = []
+        identifiers: Final = self.identifiers
+        strict: Final = self.strict
+        strict_foreign_properties: Final = self.strict_foreign_properties
+        skip_foreign_properties: Final = self.skip_foreign_properties
+        logger: Final = self.logger
+        class_matches: Final = self._class_matches
+
+        def check(datum: Any, foreign_properties: set[str]) -> bool:
+            if not isinstance(datum, MutableMapping):
+                return False
+            if has_class and not class_matches(name, datum.get("class")):
+                return False
+            for field_name, default, field_check in fields:
+                if not field_check(
+                    datum[field_name] if field_name in datum else default, foreign_properties
+                ):
+                    return False
+            invalid = False
+            for d in datum:
+                if d in field_names:
+                    continue
+                if d is None:
+                    if strict:
+                        invalid = True
+                    else:
+                        err = ValidationException(
+                            "mapping with implicit null key", SourceLine(datum, d, str)
+                        )
+                        logger.warning(err.as_warning())
+                    continue
+                if d not in identifiers and d not in foreign_properties and d[0] not in ("@", "$"):
+                    if strict and strict_foreign_properties and not skip_foreign_properties:
+                        return False
+                    if urlsplit(d).scheme:
+                        if not skip_foreign_properties:
+                            if strict_foreign_properties:
+                                invalid = True
+                            elif len(foreign_properties) > 0:
+                                err = _unrecognized_extension_field(
+                                    d,
+                                    SourceLine(datum, d, str),
+                                    foreign_properties,
+                                    strict_foreign_properties,
+                                )
+                                logger.warning(err.as_warning())
+                    elif strict:
+                        invalid = True
+                    else:
+                        err = _invalid_field(d, SourceLine(datum, d, str), expected_schema)
+                        logger.warning(err.as_warning())
+            return not invalid
+
+        self._register(expected_schema, check)
+        fields.extend(
+            (f.name, f.default, self.compile(f.type))
+            for f in expected_schema.fields
+            if f.name != "class"
+        )
+        return check
+
+    def _class_matches(self, name: str, d: Any) -> bool:
+        return _class_matches(name, d, self.vocab)
+
+
+def _check_null(datum: Any, foreign_properties: set[str]) -> bool:
+    return datum is None
+
+
+def _check_boolean(datum: Any, foreign_properties: set[str]) -> bool:
+    return isinstance(datum, bool)
+
+
+def _check_string(datum: Any, foreign_properties: set[str]) -> bool:
+    return isinstance(datum, (str, bytes))
+
+
+def _check_int(datum: Any, foreign_properties: set[str]) -> bool:
+    return isinstance(datum, int) and INT_MIN_VALUE <= datum <= INT_MAX_VALUE
+
+
+def _check_long(datum: Any, foreign_properties: set[str]) -> bool:
+    return isinstance(datum, int) and LONG_MIN_VALUE <= datum <= LONG_MAX_VALUE
+
+
+def _check_number(datum: Any, foreign_properties: set[str]) -> bool:
+    return isinstance(datum, (int, float))
+
+
+def _check_nothing(datum: Any, foreign_properties: set[str]) -> bool:
+    return False
+
+
+def _compile_enum(expected_schema: avro.schema.EnumSchema) -> CheckType:
+    if expected_schema.name in ("org.w3id.cwl.salad.Any", "Any"):
+        return _check_not_null
+    if expected_schema.name == "org.w3id.cwl.cwl.Expression":
+        return _check_expression
+    symbols: Final = frozenset(expected_schema.symbols)
+
+    def check(datum: Any, foreign_properties: set[str]) -> bool:
+        return isinstance(datum, str) and datum in symbols
+
+    return check
+
+
+def _check_not_null(datum: Any, foreign_properties: set[str]) -> bool:
+    return datum is not None
+
+
+def _check_expression(datum: Any, foreign_properties: set[str]) -> bool:
+    return isinstance(datum, str) and ("$(" in datum or "${" in datum)